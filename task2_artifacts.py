@@ -0,0 +1,221 @@
+"""
+Task 2: Failure Artifact Capture
+=================================
+Saves a screenshot, a DOM snapshot and the browser console log when a
+login case fails, so a failure carries more evidence than its message.
+
+Only the driver calls happen on the test thread, because the page must be
+captured before the next case changes it. Hashing is cheap and done inline
+so the case record can reference its artifacts; compression and disk
+writes run on a background thread.
+
+Files are content-addressed (<sha1>.<ext>[.gz]), so a failure that repeats
+across hundreds of cases is stored once. The store keeps its directory
+under a byte cap by evicting the least recently used files; writing or
+re-submitting an artifact counts as a use.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import queue
+import threading
+from collections import OrderedDict
+
+
+ARTIFACT_SCREENSHOT = 'screenshot'
+ARTIFACT_DOM = 'dom'
+ARTIFACT_CONSOLE = 'console'
+
+ALL_ARTIFACTS = (ARTIFACT_SCREENSHOT, ARTIFACT_DOM, ARTIFACT_CONSOLE)
+
+# PNG is already deflate-compressed; text artifacts are gzipped
+_EXTENSIONS = {
+    ARTIFACT_SCREENSHOT: '.png',
+    ARTIFACT_DOM: '.html.gz',
+    ARTIFACT_CONSOLE: '.json.gz',
+}
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+_STOP = object()
+
+
+class ArtifactStore:
+    """
+    Content-addressed, size-capped artifact directory with a background writer.
+    """
+
+    def __init__(self, directory='task2_artifacts', max_bytes=DEFAULT_MAX_BYTES, queue_size=256,
+                 compress_level=6):
+        """
+        Args:
+            directory (str): Where artifacts are written
+            max_bytes (int): Disk cap; least recently used files are evicted beyond it
+            queue_size (int): Pending writes held in memory; further artifacts
+                are dropped (and counted) rather than blocking the test loop
+            compress_level (int): gzip level for text artifacts
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.stats = {'written': 0, 'deduplicated': 0, 'evicted': 0, 'dropped': 0}
+        os.makedirs(directory, exist_ok=True)
+
+        # name -> size, oldest use first; seeded from what earlier runs left behind
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        entries = []
+        for entry in os.scandir(directory):
+            if entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._index[name] = size
+            self._total_bytes += size
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def submit(self, kind, data):
+        """
+        Queue one artifact for writing.
+
+        Args:
+            kind (str): One of ALL_ARTIFACTS
+            data (bytes or str): Raw artifact content
+
+        Returns:
+            str: File name the artifact is (or will be) stored under, or None
+                if it was dropped because the write queue is full
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        name = hashlib.sha1(data).hexdigest() + _EXTENSIONS[kind]
+
+        with self._lock:
+            if name in self._index:
+                self._touch(name)
+                self.stats['deduplicated'] += 1
+                return name
+
+        try:
+            self._queue.put_nowait((name, data))
+        except queue.Full:
+            with self._lock:
+                self.stats['dropped'] += 1
+            return None
+        return name
+
+    def path(self, name):
+        """Full path of a stored artifact."""
+        return os.path.join(self.directory, name)
+
+    def _touch(self, name):
+        """Mark an artifact as recently used (caller holds the lock)."""
+        self._index.move_to_end(name)
+        try:
+            os.utime(self.path(name))
+        except OSError:
+            pass
+
+    def _drain(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._write(*item)
+            except Exception as e:
+                print(f"✗ Failed to write artifact: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, name, data):
+        with self._lock:
+            if name in self._index:
+                # Queued twice before the first write landed
+                self._touch(name)
+                self.stats['deduplicated'] += 1
+                return
+
+        if name.endswith('.gz'):
+            data = gzip.compress(data, compresslevel=self.compress_level)
+        temp_path = self.path(name) + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, self.path(name))
+
+        with self._lock:
+            self._index[name] = len(data)
+            self._total_bytes += len(data)
+            self.stats['written'] += 1
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used files until under the cap (caller holds the lock)."""
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            name, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self.stats['evicted'] += 1
+            try:
+                os.remove(self.path(name))
+            except OSError:
+                pass
+
+    def flush(self):
+        """Block until every queued artifact is on disk."""
+        self._queue.join()
+
+    def close(self):
+        """Write what is queued and stop the background writer."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def capture_failure_artifacts(driver, store, kinds=ALL_ARTIFACTS):
+    """
+    Grab the requested artifacts from the browser and hand them to the store.
+
+    Capture errors (e.g. a crashed browser) are swallowed: evidence is best
+    effort and must never change a case's outcome.
+
+    Args:
+        driver: Selenium WebDriver
+        store (ArtifactStore): Destination
+        kinds (tuple): Subset of ALL_ARTIFACTS
+
+    Returns:
+        dict: kind -> stored file name, for the artifacts that were captured
+    """
+    artifacts = {}
+    for kind in kinds:
+        try:
+            if kind == ARTIFACT_SCREENSHOT:
+                data = driver.get_screenshot_as_png()
+            elif kind == ARTIFACT_DOM:
+                data = driver.page_source
+            elif kind == ARTIFACT_CONSOLE:
+                data = json.dumps(driver.get_log('browser'))
+            else:
+                continue
+        except Exception:
+            continue
+        name = store.submit(kind, data)
+        if name:
+            artifacts[kind] = name
+    return artifacts
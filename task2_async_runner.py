@@ -0,0 +1,391 @@
+"""
+Task 2: Asyncio Login Test Orchestrator
+========================================
+Schedules hundreds of login scenarios at once under a semaphore-bounded
+concurrency limit, with a per-case timeout and cancellation. Backends that
+provide an async_check_credentials coroutine are awaited natively; blocking
+backends such as LoginPageTest run in executor threads, one pooled browser
+session per thread. Results use the same layout as LoginPageTest.results,
+so print_results_summary and the JSONL result sink work unchanged.
+"""
+
+import asyncio
+import functools
+import http.client
+import io
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from task2_automated_testing import (
+    BASE_URL, EXPECT_FAILURE, new_results, print_results_summary
+)
+from task2_backends import (
+    BACKEND_HTTP, BACKEND_SELENIUM, MAX_REDIRECTS, BackendRouter, HttpLoginBackend,
+    default_scenarios
+)
+from task2_parallel_runner import SessionPool
+from task2_result_sink import JsonlResultSink, summarise_stream
+from task2_timing import PhaseTimer
+
+
+async def _async_http_request(method, url, body=None, headers=None, timeout=30):
+    """
+    Minimal HTTP/1.1 client over asyncio streams (one connection per request).
+
+    Returns:
+        tuple: (status, response headers, decoded body)
+    """
+    parts = urlsplit(url)
+    secure = parts.scheme == 'https'
+    port = parts.port or (443 if secure else 80)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, port, ssl=ssl.create_default_context() if secure else None),
+        timeout
+    )
+    try:
+        payload = body.encode('utf-8') if body is not None else b''
+        request_headers = {'Host': parts.netloc, 'Connection': 'close', 'Accept-Encoding': 'identity'}
+        request_headers.update(headers or {})
+        request_headers['Connection'] = 'close'
+        if body is not None:
+            request_headers['Content-Length'] = str(len(payload))
+
+        head = f"{method} {path} HTTP/1.1\r\n"
+        head += ''.join(f"{key}: {value}\r\n" for key, value in request_headers.items())
+        writer.write(head.encode('latin-1') + b'\r\n' + payload)
+        await writer.drain()
+
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        status = int(status_line.split()[1])
+        raw_headers = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), timeout)
+        response_headers = http.client.parse_headers(io.BytesIO(raw_headers))
+
+        if response_headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            content = b''.join(chunks)
+        elif response_headers.get('Content-Length') is not None:
+            content = await asyncio.wait_for(
+                reader.readexactly(int(response_headers['Content-Length'])), timeout
+            )
+        else:
+            content = await asyncio.wait_for(reader.read(), timeout)
+
+        return status, response_headers, content.decode('utf-8', errors='replace')
+    finally:
+        writer.close()
+
+
+class AsyncHttpLoginBackend(HttpLoginBackend):
+    """
+    HttpLoginBackend driven natively by asyncio instead of blocking sockets.
+    """
+
+    async def _async_fetch(self, method, url, cookies, body=None):
+        status, response_headers, payload = await _async_http_request(
+            method, url, body=body, headers=self._request_headers(cookies, body), timeout=self.timeout
+        )
+        self._store_cookies(response_headers, cookies)
+        return status, response_headers, payload
+
+    async def async_check_credentials(self, name, username, password, expected=EXPECT_FAILURE,
+                                      error_keywords=()):
+        """
+        Coroutine version of check_credentials.
+
+        Returns:
+            dict: Test case record with 'name', 'status' and 'message'
+        """
+        test_result = self._new_result(name)
+        timer = PhaseTimer()
+
+        try:
+            cookies = {}
+            with timer.phase('fetch_form'):
+                form = self._cached_form()
+                if form is None:
+                    status, _, payload = await self._async_fetch('GET', self.base_url, cookies)
+                    form = self._parse_form(status, payload)
+
+            with timer.phase('submit'):
+                validation, method, url, body = self._form_submission(form, username, password)
+                if validation:
+                    outcome, detail = validation
+                else:
+                    status, headers, payload = await self._async_fetch(method, url, cookies, body=body)
+                    for _ in range(MAX_REDIRECTS):
+                        target = self._redirect_target(status, headers, url)
+                        if target is None:
+                            break
+                        url = target
+                        status, headers, payload = await self._async_fetch('GET', url, cookies)
+                    outcome, detail = self._read_outcome(form, url, status, payload)
+
+            with timer.phase('outcome'):
+                self._finish(test_result, expected, outcome, detail, error_keywords)
+
+        except Exception as e:
+            test_result['message'] = str(e)
+
+        timer.attach(test_result)
+        self._report(test_result)
+        return test_result
+
+
+class _PooledSeleniumBackend:
+    """
+    Runs blocking LoginPageTest cases on sessions borrowed from a SessionPool,
+    so each executor thread drives its own browser.
+    """
+
+    # The orchestrator passes abandoned=threading.Event() to each case
+    tracks_abandoned_cases = True
+
+    def __init__(self, base_url, pool_size):
+        self.pool = SessionPool(base_url, size=pool_size)
+        for session in self.pool.sessions:
+            session.verbose = False
+
+    def check_credentials(self, *args, abandoned=None, **kwargs):
+        """
+        Run one case on a pooled session.
+
+        The session goes back to the pool only when the case has finished.
+        If the orchestrator gave up on the case in the meantime (abandoned is
+        set), the browser may still be mid-page, so the session is
+        quarantined and the pool replaces it.
+        """
+        session = self.pool.acquire()
+        try:
+            return session.check_credentials(*args, **kwargs)
+        finally:
+            if abandoned is not None and abandoned.is_set():
+                session.quarantined = True
+            self.pool.release(session)
+
+    def cleanup(self):
+        self.pool.close()
+
+
+class AsyncLoginOrchestrator:
+    """
+    Runs login scenarios concurrently on an asyncio event loop.
+    """
+
+    def __init__(self, router, concurrency=50, case_timeout=60, executor_workers=None, result_sink=None):
+        """
+        Args:
+            router (BackendRouter): Backend selector for the scenarios
+            concurrency (int): Maximum number of cases in flight at once
+            case_timeout (float): Seconds before a single case is abandoned
+            executor_workers (int): Threads for blocking backends
+                (defaults to the concurrency limit)
+            result_sink (JsonlResultSink): Stream each case to disk as it finishes
+                instead of keeping it in results['test_cases']
+        """
+        self.router = router
+        self.concurrency = concurrency
+        self.case_timeout = case_timeout
+        self.result_sink = result_sink
+        self.executor = ThreadPoolExecutor(max_workers=executor_workers or concurrency)
+        self._tasks = []
+        self._backends = {}
+
+    async def _backend(self, name):
+        """
+        The router's backend, started in a worker thread.
+
+        Starting a backend can block for seconds (a SessionPool launches its
+        browsers), which must not stall the event loop.
+        """
+        backend = self._backends.get(name)
+        if backend is None:
+            backend = await asyncio.to_thread(self.router.backend, name)
+            self._backends[name] = backend
+        return backend
+
+    async def _run_case(self, semaphore, scenario):
+        scenario = dict(scenario)
+        backend_name = scenario.pop('backend', None)
+
+        async with semaphore:
+            start = time.perf_counter()
+            abandoned = threading.Event()
+            try:
+                backend = await self._backend(backend_name)
+                native = getattr(backend, 'async_check_credentials', None)
+                if native is not None:
+                    call = native(**scenario)
+                else:
+                    if getattr(backend, 'tracks_abandoned_cases', False):
+                        scenario['abandoned'] = abandoned
+                    loop = asyncio.get_running_loop()
+                    call = loop.run_in_executor(
+                        self.executor, functools.partial(backend.check_credentials, **scenario)
+                    )
+                test_result = await asyncio.wait_for(call, self.case_timeout)
+
+            except asyncio.TimeoutError:
+                # A running executor thread cannot be interrupted; tell the
+                # backend so it does not reuse the session the thread holds
+                abandoned.set()
+                test_result = {
+                    'name': scenario.get('name', ''),
+                    'status': 'FAILED',
+                    'message': f"Case timed out after {self.case_timeout}s"
+                }
+            except Exception as e:
+                test_result = {
+                    'name': scenario.get('name', ''),
+                    'status': 'FAILED',
+                    'message': str(e)
+                }
+
+            test_result.setdefault('backend', backend_name or self.router.default_backend)
+            test_result['duration_seconds'] = round(time.perf_counter() - start, 3)
+            if self.result_sink:
+                self.result_sink.write(test_result)
+            return test_result
+
+    async def run(self, scenarios):
+        """
+        Run every scenario, at most `concurrency` at a time.
+
+        Cancelling this coroutine (or calling cancel()) stops pending cases;
+        cases that already finished are still returned.
+
+        Args:
+            scenarios (iterable): Keyword-argument dicts, optionally with 'backend'
+
+        Returns:
+            dict: Results in the same layout as LoginPageTest.results, with
+                test cases in scenario order (empty when streaming to a sink)
+        """
+        results = new_results()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        start = time.perf_counter()
+
+        self._tasks = [asyncio.ensure_future(self._run_case(semaphore, scenario)) for scenario in scenarios]
+        try:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        finally:
+            cancelled = 0
+            for task in self._tasks:
+                if task.cancelled():
+                    cancelled += 1
+                    continue
+                if not task.done():
+                    task.cancel()
+                    cancelled += 1
+                    continue
+                if task.exception() is not None:
+                    continue
+                test_result = task.result()
+                results['total_tests'] += 1
+                if test_result['status'] == 'PASSED':
+                    results['passed'] += 1
+                else:
+                    results['failed'] += 1
+                if not self.result_sink:
+                    results['test_cases'].append(test_result)
+
+            results['cancelled'] = cancelled
+            results['duration_seconds'] = round(time.perf_counter() - start, 3)
+            self._tasks = []
+
+        return results
+
+    def cancel(self):
+        """Cancel every case that has not finished yet."""
+        for task in self._tasks:
+            task.cancel()
+
+    def close(self):
+        """Shut down executor threads and every backend the router started."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.router.cleanup()
+        self._backends = {}
+
+
+def async_router(base_url=BASE_URL, default_backend=BACKEND_HTTP, selenium_sessions=2):
+    """
+    BackendRouter whose HTTP backend is async-native and whose Selenium
+    backend spreads blocking cases over a pool of browser sessions.
+    """
+    factories = {
+        BACKEND_HTTP: AsyncHttpLoginBackend,
+        BACKEND_SELENIUM: lambda url: _PooledSeleniumBackend(url, selenium_sessions),
+    }
+    return BackendRouter(base_url, default_backend=default_backend, factories=factories)
+
+
+async def run_login_tests_async(scenarios=None, base_url=BASE_URL, default_backend=BACKEND_HTTP,
+                                concurrency=50, case_timeout=60, selenium_sessions=2, result_sink=None):
+    """
+    Async entry point for running login scenarios.
+
+    Args:
+        scenarios (iterable): Keyword-argument dicts; defaults to the standard four
+        base_url (str): URL of the login page
+        default_backend (str): Backend for scenarios that do not name one
+        concurrency (int): Maximum number of cases in flight at once
+        case_timeout (float): Seconds before a single case is abandoned
+        selenium_sessions (int): Browser sessions for Selenium scenarios
+        result_sink (JsonlResultSink): Stream each case to disk as it finishes
+
+    Returns:
+        dict: Results in the same layout as LoginPageTest.results
+    """
+    if scenarios is None:
+        scenarios = default_scenarios(default_backend)
+
+    orchestrator = AsyncLoginOrchestrator(
+        async_router(base_url, default_backend, selenium_sessions),
+        concurrency=concurrency,
+        case_timeout=case_timeout,
+        executor_workers=selenium_sessions,
+        result_sink=result_sink,
+    )
+    try:
+        return await orchestrator.run(scenarios)
+    finally:
+        orchestrator.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run login scenarios on an asyncio event loop")
+    parser.add_argument('--backend', choices=[BACKEND_HTTP, BACKEND_SELENIUM], default=BACKEND_HTTP)
+    parser.add_argument('--base-url', default=BASE_URL, help="URL of the login page")
+    parser.add_argument('--concurrency', type=int, default=50, help="Maximum cases in flight")
+    parser.add_argument('--case-timeout', type=float, default=60, help="Per-case timeout in seconds")
+    parser.add_argument('--selenium-sessions', type=int, default=2, help="Browser sessions for Selenium cases")
+    args = parser.parse_args()
+
+    with JsonlResultSink('task2_test_results.jsonl') as result_sink:
+        results = asyncio.run(run_login_tests_async(
+            base_url=args.base_url,
+            default_backend=args.backend,
+            concurrency=args.concurrency,
+            case_timeout=args.case_timeout,
+            selenium_sessions=args.selenium_sessions,
+            result_sink=result_sink,
+        ))
+
+    print_results_summary(summarise_stream(result_sink.path))
+    print(f"Wall-clock time: {results['duration_seconds']:.2f}s")
+    print(f"\n✓ Test results streamed to {result_sink.path}")
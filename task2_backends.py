@@ -0,0 +1,502 @@
+"""
+Task 2: Pluggable Login Test Backends
+======================================
+The same valid/invalid/empty credential scenarios can run either through
+a Selenium browser (LoginPageTest) or through a lightweight HTTP client
+that posts the login form over pooled keep-alive connections and checks
+the redirect or error markup. Scenarios pick their backend individually,
+so bulk cases take the HTTP path and only flows that need JavaScript pay
+for a browser.
+
+Every backend exposes the LoginPageTest interface:
+    check_credentials(name, username, password, expected, error_keywords) -> dict
+    cleanup()
+"""
+
+import http.client
+import queue
+import threading
+from html.parser import HTMLParser
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from task2_automated_testing import (
+    BASE_URL, EXPECT_FAILURE, EXPECT_SUCCESS, INVALID_PASSWORD, INVALID_USERNAME,
+    VALID_PASSWORD, VALID_USERNAME, LoginPageTest, judge_login_outcome, new_results,
+    print_results_summary
+)
+from task2_timing import PhaseTimer
+from task2_waits import (
+    DEFAULT_TIMEOUT, OUTCOME_ERROR, OUTCOME_INVALID_FORM, OUTCOME_REDIRECT,
+    OUTCOME_SUCCESS
+)
+
+
+BACKEND_SELENIUM = 'selenium'
+BACKEND_HTTP = 'http'
+
+# Redirect hops followed after the form POST before giving up
+MAX_REDIRECTS = 5
+
+
+class LoginBackend:
+    """
+    Interface shared by every login test backend.
+    LoginPageTest satisfies it without subclassing.
+    """
+
+    def check_credentials(self, name, username, password, expected=EXPECT_FAILURE, error_keywords=()):
+        """Run one login attempt and return a test case record."""
+        raise NotImplementedError
+
+    def cleanup(self):
+        """Release the backend's resources."""
+
+
+class _LoginPageParser(HTMLParser):
+    """Collects the login form fields and any .error/.success flash text."""
+
+    def __init__(self):
+        super().__init__()
+        self.form_action = None
+        self.form_method = 'get'
+        self.inputs = {}
+        self.required = set()
+        self.flash = {}
+        self._in_form = False
+        self._flash_class = None
+        self._flash_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+
+        if self._flash_class:
+            self._flash_depth += 1
+        elif OUTCOME_ERROR in classes or OUTCOME_SUCCESS in classes:
+            self._flash_class = OUTCOME_ERROR if OUTCOME_ERROR in classes else OUTCOME_SUCCESS
+            self._flash_depth = 1
+            self.flash.setdefault(self._flash_class, '')
+
+        if tag == 'form' and self.form_action is None:
+            self._in_form = True
+            self.form_action = attrs.get('action') or ''
+            self.form_method = (attrs.get('method') or 'get').lower()
+        elif tag == 'input' and self._in_form and attrs.get('name'):
+            self.inputs[attrs['name']] = attrs.get('value') or ''
+            if 'required' in attrs:
+                self.required.add(attrs['name'])
+
+    def handle_endtag(self, tag):
+        if tag == 'form':
+            self._in_form = False
+        if self._flash_class:
+            self._flash_depth -= 1
+            if self._flash_depth <= 0:
+                self._flash_class = None
+
+    def handle_data(self, data):
+        if self._flash_class:
+            self.flash[self._flash_class] += data
+
+
+class HttpConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP(S) connections per host.
+    """
+
+    def __init__(self, max_per_host=8, timeout=DEFAULT_TIMEOUT):
+        """
+        Args:
+            max_per_host (int): Idle connections kept for each host
+            timeout (float): Socket timeout in seconds
+        """
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _idle_queue(self, key):
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue(maxsize=self.max_per_host)
+            return self._idle[key]
+
+    def _connect(self, scheme, netloc):
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def request(self, method, url, body=None, headers=None):
+        """
+        Send a request on a pooled connection, retrying once on a stale socket.
+
+        Returns:
+            tuple: (status, response headers, decoded body)
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        # Bytes bodies go out in the same packet as the headers; str bodies are
+        # sent separately and stall on Nagle/delayed-ACK for ~40 ms per request
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        idle = self._idle_queue(key)
+        for attempt in range(2):
+            try:
+                connection = idle.get_nowait()
+            except queue.Empty:
+                connection = self._connect(parts.scheme, parts.netloc)
+
+            try:
+                connection.request(method, path, body=body, headers=headers or {})
+                response = connection.getresponse()
+                payload = response.read().decode('utf-8', errors='replace')
+            except (http.client.HTTPException, ConnectionError):
+                connection.close()
+                if attempt == 0:
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                try:
+                    idle.put_nowait(connection)
+                except queue.Full:
+                    connection.close()
+            return response.status, response.headers, payload
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            queues = list(self._idle.values())
+            self._idle = {}
+        for idle in queues:
+            while True:
+                try:
+                    idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+class HttpLoginBackend(LoginBackend):
+    """
+    Posts the login form directly over HTTP, without a browser.
+    Each case starts with an empty cookie set so no session state leaks.
+
+    The request/response handling is split into I/O-free helpers so the
+    async orchestrator can drive the same logic over asyncio streams.
+    """
+
+    def __init__(self, base_url, pool=None, timeout=DEFAULT_TIMEOUT, verbose=False):
+        """
+        Args:
+            base_url (str): URL of the login page
+            pool (HttpConnectionPool): Shared connection pool (created if omitted)
+            timeout (float): Socket timeout in seconds
+            verbose (bool): Print a line per case like LoginPageTest
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.pool = pool or HttpConnectionPool(timeout=timeout)
+        self.verbose = verbose
+        self._form = None
+
+    @staticmethod
+    def _request_headers(cookies, body):
+        """Headers for one request carrying the case's cookies."""
+        headers = {'Connection': 'keep-alive'}
+        if cookies:
+            headers['Cookie'] = '; '.join(f"{key}={value}" for key, value in cookies.items())
+        if body is not None:
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        return headers
+
+    @staticmethod
+    def _store_cookies(response_headers, cookies):
+        """Track Set-Cookie headers in the case's cookie dict."""
+        for header in response_headers.get_all('Set-Cookie') or []:
+            cookie = header.split(';', 1)[0]
+            if '=' in cookie:
+                key, value = cookie.split('=', 1)
+                cookies[key.strip()] = value.strip()
+
+    def _fetch(self, method, url, cookies, body=None):
+        """Send one request on the connection pool."""
+        status, response_headers, payload = self.pool.request(
+            method, url, body=body, headers=self._request_headers(cookies, body)
+        )
+        self._store_cookies(response_headers, cookies)
+        return status, response_headers, payload
+
+    def _cached_form(self):
+        """
+        The parsed login form if it can be reused, otherwise None.
+        Forms with hidden inputs (e.g. CSRF tokens) are re-read for every case.
+        """
+        form = self._form
+        if form is None or form['has_hidden']:
+            return None
+        return form
+
+    def _parse_form(self, status, payload):
+        """Parse and cache the login form from the login page markup."""
+        if status >= 400:
+            raise Exception(f"Login page returned HTTP {status}")
+        parser = _LoginPageParser()
+        parser.feed(payload)
+        if parser.form_action is None:
+            raise Exception("No login form found on page")
+        form = {
+            'action': urljoin(self.base_url, parser.form_action or self.base_url),
+            'method': parser.form_method,
+            'inputs': parser.inputs,
+            'required': parser.required,
+            'has_hidden': any(name not in ('username', 'password') for name in parser.inputs),
+        }
+        self._form = form
+        return form
+
+    @staticmethod
+    def _form_submission(form, username, password):
+        """
+        Build the form submission, or the validation outcome a browser would show.
+
+        Returns:
+            tuple: (validation outcome or None, method, url, body)
+        """
+        for field, value in (('username', username), ('password', password)):
+            if field in form['required'] and not value:
+                return (OUTCOME_INVALID_FORM, f"Please fill out the {field} field."), None, None, None
+
+        fields = dict(form['inputs'])
+        fields['username'] = username
+        fields['password'] = password
+        body = urlencode(fields)
+
+        if form['method'] == 'post':
+            return None, 'POST', form['action'], body
+        return None, 'GET', f"{form['action']}?{body}", None
+
+    @staticmethod
+    def _redirect_target(status, headers, url):
+        """The URL a redirect response points to, or None."""
+        if status in (301, 302, 303, 307, 308) and headers.get('Location'):
+            return urljoin(url, headers['Location'])
+        return None
+
+    def _read_outcome(self, form, url, status, payload):
+        """
+        Interpret the final response after redirects.
+
+        Returns:
+            tuple: (outcome, detail) in the task2_waits vocabulary
+        """
+        parser = _LoginPageParser()
+        parser.feed(payload)
+        if OUTCOME_ERROR in parser.flash:
+            return OUTCOME_ERROR, parser.flash[OUTCOME_ERROR]
+        if OUTCOME_SUCCESS in parser.flash:
+            return OUTCOME_SUCCESS, parser.flash[OUTCOME_SUCCESS]
+        if url != self.base_url and url != form['action']:
+            return OUTCOME_REDIRECT, url
+        if status >= 400:
+            raise Exception(f"Login submission returned HTTP {status}")
+        return None, ''
+
+    def _submit(self, form, username, password, cookies):
+        """
+        Post the form and follow redirects.
+
+        Returns:
+            tuple: (outcome, detail) in the task2_waits vocabulary
+        """
+        validation, method, url, body = self._form_submission(form, username, password)
+        if validation:
+            return validation
+
+        status, headers, payload = self._fetch(method, url, cookies, body=body)
+        for _ in range(MAX_REDIRECTS):
+            target = self._redirect_target(status, headers, url)
+            if target is None:
+                break
+            url = target
+            status, headers, payload = self._fetch('GET', url, cookies)
+
+        return self._read_outcome(form, url, status, payload)
+
+    def _finish(self, test_result, expected, outcome, detail, error_keywords):
+        """Judge an outcome into the test case record."""
+        passed, test_result['message'] = judge_login_outcome(expected, outcome, detail, error_keywords)
+        if passed:
+            test_result['status'] = 'PASSED'
+
+    def _new_result(self, name):
+        return {
+            'name': name,
+            'status': 'FAILED',
+            'message': '',
+            'backend': BACKEND_HTTP
+        }
+
+    def _report(self, test_result):
+        if self.verbose:
+            if test_result['status'] == 'PASSED':
+                print(f"✓ {test_result['name']} PASSED")
+            else:
+                print(f"✗ {test_result['name']} FAILED: {test_result['message']}")
+
+    def check_credentials(self, name, username, password, expected=EXPECT_FAILURE, error_keywords=()):
+        """
+        Submit one credential pair over HTTP and judge the outcome.
+
+        Returns:
+            dict: Test case record with 'name', 'status' and 'message'
+        """
+        test_result = self._new_result(name)
+        timer = PhaseTimer()
+
+        try:
+            cookies = {}
+            with timer.phase('fetch_form'):
+                form = self._cached_form()
+                if form is None:
+                    status, _, payload = self._fetch('GET', self.base_url, cookies)
+                    form = self._parse_form(status, payload)
+            with timer.phase('submit'):
+                outcome, detail = self._submit(form, username, password, cookies)
+            with timer.phase('outcome'):
+                self._finish(test_result, expected, outcome, detail, error_keywords)
+
+        except Exception as e:
+            test_result['message'] = str(e)
+
+        timer.attach(test_result)
+        self._report(test_result)
+        return test_result
+
+    def cleanup(self):
+        """Close pooled connections."""
+        self.pool.close()
+
+
+def _selenium_backend(base_url):
+    test_suite = LoginPageTest(base_url)
+    test_suite.verbose = False
+    return test_suite
+
+
+BACKEND_FACTORIES = {
+    BACKEND_SELENIUM: _selenium_backend,
+    BACKEND_HTTP: HttpLoginBackend,
+}
+
+
+class BackendRouter(LoginBackend):
+    """
+    Sends each scenario to the backend it names, creating backends lazily
+    so a browser is only started if some scenario actually needs one.
+    """
+
+    def __init__(self, base_url=BASE_URL, default_backend=BACKEND_HTTP, factories=None):
+        """
+        Args:
+            base_url (str): URL of the login page
+            default_backend (str): Backend for scenarios that do not name one
+            factories (dict): Backend name -> callable(base_url); defaults to BACKEND_FACTORIES
+        """
+        self.base_url = base_url
+        self.default_backend = default_backend
+        self.factories = factories or BACKEND_FACTORIES
+        self._backends = {}
+        self._lock = threading.Lock()
+
+    def backend(self, name=None):
+        """Return the named backend, starting it on first use."""
+        name = name or self.default_backend
+        with self._lock:
+            if name not in self._backends:
+                if name not in self.factories:
+                    raise ValueError(f"Unknown login test backend: {name}")
+                self._backends[name] = self.factories[name](self.base_url)
+            return self._backends[name]
+
+    def check_credentials(self, name, username, password, expected=EXPECT_FAILURE, error_keywords=(),
+                          backend=None):
+        """Run one scenario on its selected backend."""
+        test_result = self.backend(backend).check_credentials(name, username, password, expected, error_keywords)
+        test_result.setdefault('backend', backend or self.default_backend)
+        return test_result
+
+    def cleanup(self):
+        """Clean up every backend that was started."""
+        with self._lock:
+            backends = list(self._backends.values())
+            self._backends = {}
+        for started in backends:
+            started.cleanup()
+
+
+def default_scenarios(default_backend=BACKEND_HTTP):
+    """
+    The standard valid/invalid/empty credential scenarios as router rows.
+
+    Returns:
+        list: Keyword-argument dicts for BackendRouter.check_credentials
+    """
+    return [
+        {'name': 'Valid Login Test', 'username': VALID_USERNAME, 'password': VALID_PASSWORD,
+         'expected': EXPECT_SUCCESS, 'backend': default_backend},
+        {'name': 'Invalid Username Test', 'username': INVALID_USERNAME, 'password': VALID_PASSWORD,
+         'expected': EXPECT_FAILURE, 'error_keywords': ('invalid', 'incorrect'), 'backend': default_backend},
+        {'name': 'Invalid Password Test', 'username': VALID_USERNAME, 'password': INVALID_PASSWORD,
+         'expected': EXPECT_FAILURE, 'error_keywords': ('invalid', 'incorrect', 'password'),
+         'backend': default_backend},
+        {'name': 'Empty Credentials Test', 'username': '', 'password': '',
+         'expected': EXPECT_FAILURE, 'backend': default_backend},
+    ]
+
+
+def run_scenarios(router, scenarios):
+    """
+    Run scenarios through a router and collect results.
+
+    Args:
+        router (BackendRouter): Backend selector
+        scenarios (iterable): Keyword-argument dicts, optionally with 'backend'
+
+    Returns:
+        dict: Results in the same layout as LoginPageTest.results
+    """
+    results = new_results()
+    for scenario in scenarios:
+        test_result = router.check_credentials(**scenario)
+        results['total_tests'] += 1
+        if test_result['status'] == 'PASSED':
+            results['passed'] += 1
+        else:
+            results['failed'] += 1
+        results['test_cases'].append(test_result)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the login scenarios on a chosen backend")
+    parser.add_argument('--backend', choices=sorted(BACKEND_FACTORIES), default=BACKEND_HTTP)
+    parser.add_argument('--base-url', default=BASE_URL, help="URL of the login page")
+    args = parser.parse_args()
+
+    router = BackendRouter(args.base_url, default_backend=args.backend)
+    try:
+        print_results_summary(run_scenarios(router, default_scenarios(args.backend)))
+    finally:
+        router.cleanup()
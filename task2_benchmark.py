@@ -0,0 +1,120 @@
+"""
+Task 2: Login Test Throughput Benchmark
+========================================
+Runs N login scenarios against the bundled local login server under
+different backend and concurrency settings and reports cases/second,
+giving a repeatable performance baseline for the testing subsystem.
+
+Example:
+    python task2_benchmark.py --cases 2000 --backends http --concurrency 1 8 32
+    python task2_benchmark.py --cases 40 --backends selenium --concurrency 1 4 --latency-ms 20
+"""
+
+import asyncio
+import csv
+import itertools
+
+from task2_async_runner import run_login_tests_async
+from task2_backends import BACKEND_HTTP, BACKEND_SELENIUM, default_scenarios
+from task2_local_server import start_local_server
+from task2_timing import phase_percentiles, print_phase_report
+
+
+def benchmark_scenarios(count, backend):
+    """The standard four scenarios repeated up to `count` cases."""
+    scenarios = itertools.cycle(default_scenarios(backend))
+    return [dict(next(scenarios), name=f"Case {index + 1}") for index in range(count)]
+
+
+def run_benchmark(cases=200, backends=(BACKEND_HTTP,), concurrency_levels=(1, 8, 32),
+                  latency_ms=0, jitter_ms=0, error_rate=0.0, seed=42, case_timeout=60):
+    """
+    Benchmark every backend/concurrency combination against a local server.
+
+    Args:
+        cases (int): Scenarios per combination
+        backends (iterable): Backend names to compare
+        concurrency_levels (iterable): Concurrency limits to compare; for
+            Selenium this is also the number of browser sessions
+        latency_ms, jitter_ms, error_rate: Local server latency/error profile
+        seed (int): Seed for the server's jitter and error injection
+        case_timeout (float): Per-case timeout in seconds
+
+    Returns:
+        list: One row dict per combination with throughput and pass counts
+    """
+    rows = []
+    server = start_local_server(latency_ms=latency_ms, jitter_ms=jitter_ms,
+                                error_rate=error_rate, seed=seed)
+    try:
+        for backend, concurrency in itertools.product(backends, concurrency_levels):
+            results = asyncio.run(run_login_tests_async(
+                benchmark_scenarios(cases, backend),
+                base_url=server.login_url,
+                default_backend=backend,
+                concurrency=concurrency,
+                case_timeout=case_timeout,
+                selenium_sessions=concurrency,
+            ))
+            duration = results['duration_seconds'] or 1e-9
+            row = {
+                'backend': backend,
+                'concurrency': concurrency,
+                'cases': results['total_tests'],
+                'passed': results['passed'],
+                'failed': results['failed'],
+                'seconds': round(duration, 3),
+                'cases_per_second': round(results['total_tests'] / duration, 2),
+            }
+            rows.append(row)
+            print(f"✓ {backend:<9} concurrency={concurrency:<4} {row['cases_per_second']:>10.2f} cases/s "
+                  f"({row['passed']}/{row['cases']} passed in {row['seconds']:.2f}s)")
+            if backend == BACKEND_SELENIUM:
+                print_phase_report(phase_percentiles(results['test_cases']))
+    finally:
+        server.stop()
+
+    return rows
+
+
+def print_benchmark_table(rows):
+    """Print benchmark rows as a table."""
+    print("\n" + "="*80)
+    print("LOGIN TEST THROUGHPUT BENCHMARK")
+    print("="*80)
+    print(f"{'Backend':<10}{'Concurrency':>12}{'Cases':>8}{'Passed':>8}{'Seconds':>10}{'Cases/s':>12}")
+    for row in rows:
+        print(f"{row['backend']:<10}{row['concurrency']:>12}{row['cases']:>8}{row['passed']:>8}"
+              f"{row['seconds']:>10.2f}{row['cases_per_second']:>12.2f}")
+    print("="*80)
+
+
+def save_benchmark_csv(rows, filename='task2_benchmark_results.csv'):
+    """Save benchmark rows to a CSV file."""
+    with open(filename, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"\n✓ Benchmark results saved to {filename}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark login test throughput against a local server")
+    parser.add_argument('--cases', type=int, default=200, help="Scenarios per combination")
+    parser.add_argument('--backends', nargs='+', default=[BACKEND_HTTP],
+                        choices=[BACKEND_HTTP, BACKEND_SELENIUM])
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 8, 32])
+    parser.add_argument('--latency-ms', type=float, default=0, help="Server delay per request")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Random extra server delay")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests failing with 500")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None, help="Optional CSV file for the results")
+    args = parser.parse_args()
+
+    rows = run_benchmark(args.cases, args.backends, args.concurrency, args.latency_ms,
+                         args.jitter_ms, args.error_rate, args.seed)
+    print_benchmark_table(rows)
+    if args.output:
+        save_benchmark_csv(rows, args.output)
@@ -0,0 +1,263 @@
+"""
+Task 2: Resource-Capped Browser Profiles
+=========================================
+Named Chrome configurations for LoginPageTest sessions. The
+"minimal-headless" profile turns off subsystems a login form never needs
+(GPU, extensions, sync, background networking, caches) and blocks images
+and web fonts, so each browser takes far less memory on CI hosts.
+
+The module also measures the resident memory (RSS) of a session's
+chromedriver + Chrome process tree and works out how many parallel
+sessions fit inside a memory budget.
+"""
+
+import os
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+
+PROFILE_DEFAULT = 'default'
+PROFILE_HEADLESS = 'headless'
+PROFILE_MINIMAL_HEADLESS = 'minimal-headless'
+
+_BASE_ARGUMENTS = ['--no-sandbox', '--disable-dev-shm-usage']
+
+_MINIMAL_ARGUMENTS = [
+    '--headless=new',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-component-update',
+    '--disable-features=Translate,MediaRouter,OptimizationHints',
+    '--no-first-run',
+    '--mute-audio',
+    '--disk-cache-size=1',
+    '--media-cache-size=1',
+    '--blink-settings=imagesEnabled=false',
+    '--renderer-process-limit=1',
+    '--js-flags=--max-old-space-size=128',
+    '--window-size=1024,768',
+]
+
+# Resources a login form does not need; blocked through the DevTools protocol
+_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+]
+
+BROWSER_PROFILES = {
+    PROFILE_DEFAULT: {
+        'arguments': _BASE_ARGUMENTS,
+        'prefs': {},
+        'page_load_strategy': 'normal',
+        'blocked_urls': [],
+    },
+    PROFILE_HEADLESS: {
+        'arguments': _BASE_ARGUMENTS + ['--headless=new'],
+        'prefs': {},
+        'page_load_strategy': 'normal',
+        'blocked_urls': [],
+    },
+    PROFILE_MINIMAL_HEADLESS: {
+        'arguments': _BASE_ARGUMENTS + _MINIMAL_ARGUMENTS,
+        'prefs': {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+            'profile.default_content_setting_values.geolocation': 2,
+        },
+        'page_load_strategy': 'eager',
+        'blocked_urls': _BLOCKED_URL_PATTERNS,
+    },
+}
+
+# Profile used when none is given; override with TASK2_BROWSER_PROFILE
+DEFAULT_PROFILE = os.environ.get('TASK2_BROWSER_PROFILE', PROFILE_DEFAULT)
+
+
+def _profile(name):
+    if name not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile: {name} (choose from {', '.join(BROWSER_PROFILES)})")
+    return BROWSER_PROFILES[name]
+
+
+def build_chrome_options(profile=DEFAULT_PROFILE, console_log=False):
+    """
+    Chrome options for a named profile.
+
+    Args:
+        profile (str): Key of BROWSER_PROFILES
+        console_log (bool): Keep the browser console log for driver.get_log('browser')
+
+    Returns:
+        ChromeOptions: Options ready for webdriver.Chrome
+    """
+    settings = _profile(profile)
+    options = webdriver.ChromeOptions()
+    for argument in settings['arguments']:
+        options.add_argument(argument)
+    if settings['prefs']:
+        options.add_experimental_option('prefs', settings['prefs'])
+    options.page_load_strategy = settings['page_load_strategy']
+    if console_log:
+        options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+    return options
+
+
+def apply_runtime_profile(driver, profile=DEFAULT_PROFILE):
+    """
+    Apply profile settings that need a live session (URL blocking).
+
+    Args:
+        driver: Chrome WebDriver
+        profile (str): Key of BROWSER_PROFILES
+    """
+    blocked = _profile(profile)['blocked_urls']
+    if not blocked:
+        return
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked})
+    except (WebDriverException, AttributeError):
+        # Remote or non-Chromium drivers have no DevTools access
+        pass
+
+
+def _proc_children(pid):
+    """Child PIDs of a process from /proc (Linux)."""
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return children
+
+
+def _proc_rss_bytes(pid):
+    """Resident set size of one process from /proc (Linux)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss_bytes(pid):
+    """
+    Total RSS of a process and all of its descendants.
+
+    Uses psutil when it is installed and falls back to /proc otherwise.
+
+    Returns:
+        int: Bytes, or None if memory cannot be measured on this platform
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+
+    if not os.path.isdir('/proc'):
+        return None
+
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        total += _proc_rss_bytes(current)
+        pending.extend(_proc_children(current))
+    return total
+
+
+def session_rss_bytes(driver):
+    """
+    RSS of the chromedriver process and the Chrome processes it started.
+
+    Returns:
+        int: Bytes, or None if it cannot be measured
+    """
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    return process_tree_rss_bytes(pid)
+
+
+def sessions_within_budget(budget_mb, per_session_mb, reserve_mb=0):
+    """
+    How many sessions of a measured size fit in a memory budget.
+
+    Args:
+        budget_mb (float): Memory available for browsers
+        per_session_mb (float): Measured RSS of one session
+        reserve_mb (float): Headroom kept back for the test process itself
+
+    Returns:
+        int: Number of sessions (at least 1)
+    """
+    if per_session_mb <= 0:
+        return 1
+    return max(1, int((budget_mb - reserve_mb) // per_session_mb))
+
+
+def measure_session_mb(base_url, profile=DEFAULT_PROFILE, driver_path=None):
+    """
+    Start one session with a profile, run a login case and measure its RSS.
+
+    Returns:
+        float: Session RSS in MB, or None if it cannot be measured
+    """
+    from task2_automated_testing import LoginPageTest, VALID_PASSWORD, VALID_USERNAME
+
+    test_suite = LoginPageTest(base_url, driver_path, profile=profile)
+    try:
+        test_suite.verbose = False
+        test_suite.test_valid_login(VALID_USERNAME, VALID_PASSWORD)
+        rss = session_rss_bytes(test_suite.driver)
+    finally:
+        test_suite.cleanup()
+    return None if rss is None else rss / (1024 * 1024)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from task2_automated_testing import BASE_URL
+
+    parser = argparse.ArgumentParser(description="Measure browser profile memory and size a session pool")
+    parser.add_argument('--base-url', default=BASE_URL, help="URL of the login page")
+    parser.add_argument('--profiles', nargs='+', default=list(BROWSER_PROFILES), choices=list(BROWSER_PROFILES))
+    parser.add_argument('--memory-budget-mb', type=float, default=4096, help="Memory available for browsers")
+    parser.add_argument('--reserve-mb', type=float, default=256, help="Headroom kept for the test process")
+    args = parser.parse_args()
+
+    print(f"{'Profile':<18}{'RSS (MB)':>10}{'Sessions in budget':>22}")
+    for name in args.profiles:
+        rss_mb = measure_session_mb(args.base_url, name)
+        if rss_mb is None:
+            print(f"{name:<18}{'n/a':>10}{'n/a':>22}")
+        else:
+            fit = sessions_within_budget(args.memory_budget_mb, rss_mb, args.reserve_mb)
+            print(f"{name:<18}{rss_mb:>10.1f}{fit:>22}")
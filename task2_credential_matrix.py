@@ -0,0 +1,157 @@
+"""
+Task 2: Data-Driven Credential Matrix
+======================================
+Streams username/password/expected-outcome rows from a CSV or JSONL file
+through LoginPageTest.check_credentials in a single browser session.
+Rows are read lazily and each outcome is appended to a JSONL file as soon
+as it finishes, so memory stays flat for matrices of any size.
+
+Row fields:
+    username, password   Credentials to submit (blank for empty input)
+    expected             "success" or "failure" (also accepts pass/valid/true)
+    name                 Optional test case name
+    error_keywords       Optional accepted error words ("|"-separated in CSV)
+    backend              Optional backend name ("http" or "selenium")
+"""
+
+import csv
+import json
+import os
+
+from task2_automated_testing import (
+    BASE_URL, EXPECT_FAILURE, EXPECT_SUCCESS, new_results, print_results_summary
+)
+from task2_backends import BACKEND_FACTORIES, BACKEND_SELENIUM, BackendRouter
+from task2_result_sink import JsonlResultSink
+
+
+_SUCCESS_ALIASES = {'success', 'pass', 'passed', 'valid', 'true', '1', 'yes'}
+
+
+def _normalise_row(row, row_number):
+    """Convert a raw CSV/JSONL row into check_credentials keyword arguments."""
+    expected = str(row.get('expected', EXPECT_FAILURE)).strip().lower()
+
+    keywords = row.get('error_keywords') or ()
+    if isinstance(keywords, str):
+        keywords = [keyword for keyword in keywords.split('|') if keyword]
+
+    normalised = {
+        'name': row.get('name') or f"Matrix Row {row_number}",
+        'username': row.get('username') or '',
+        'password': row.get('password') or '',
+        'expected': EXPECT_SUCCESS if expected in _SUCCESS_ALIASES else EXPECT_FAILURE,
+        'error_keywords': tuple(keyword.strip().lower() for keyword in keywords),
+    }
+    if row.get('backend'):
+        normalised['backend'] = row['backend'].strip().lower()
+    return normalised
+
+
+def iter_credential_rows(path):
+    """
+    Lazily read credential rows from a CSV or JSONL file.
+
+    Args:
+        path (str): File ending in .csv, .jsonl or .ndjson
+
+    Yields:
+        dict: Keyword arguments for LoginPageTest.check_credentials
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    with open(path, newline='', encoding='utf-8') as f:
+        if extension == '.csv':
+            for row_number, row in enumerate(csv.DictReader(f), start=1):
+                yield _normalise_row(row, row_number)
+        elif extension in ('.jsonl', '.ndjson'):
+            for row_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if line:
+                    yield _normalise_row(json.loads(line), row_number)
+        else:
+            raise ValueError(f"Unsupported credential matrix format: {path}")
+
+
+def run_credential_matrix(test_suite, rows, output_path, flush_interval=1.0):
+    """
+    Run every row through one session and stream each outcome to disk.
+
+    Only the pass/fail counters are kept in memory; per-case records go
+    straight to output_path through a JsonlResultSink.
+
+    Args:
+        test_suite: LoginPageTest, HTTP backend or BackendRouter that executes
+            the rows (rows naming a backend need a BackendRouter)
+        rows (iterable): Keyword-argument dicts from iter_credential_rows
+        output_path (str): JSONL file receiving one record per case
+        flush_interval (float): Seconds between flushes of the output stream
+
+    Returns:
+        dict: Results counters with an empty 'test_cases' list
+    """
+    results = new_results()
+    results['output'] = output_path
+
+    with JsonlResultSink(output_path, flush_interval=flush_interval) as sink:
+        for row in rows:
+            test_result = test_suite.check_credentials(**row)
+
+            results['total_tests'] += 1
+            if test_result['status'] == 'PASSED':
+                results['passed'] += 1
+            else:
+                results['failed'] += 1
+
+            sink.write(test_result)
+
+    return results
+
+
+def run_matrix_file(matrix_path, output_path='task2_matrix_results.jsonl', base_url=BASE_URL,
+                    default_backend=BACKEND_SELENIUM):
+    """
+    Run a credential matrix file against the login page.
+
+    Args:
+        matrix_path (str): CSV or JSONL credential matrix
+        output_path (str): JSONL file for per-case results
+        base_url (str): URL of the login page
+        default_backend (str): Backend for rows without a 'backend' column
+
+    Returns:
+        dict: Results counters, or None if the run could not start
+    """
+    print("\n" + "="*80)
+    print("TASK 2: CREDENTIAL MATRIX LOGIN TESTING")
+    print("="*80)
+
+    test_suite = BackendRouter(base_url, default_backend=default_backend)
+    try:
+        print(f"\nRunning credential matrix from {matrix_path}...")
+        results = run_credential_matrix(test_suite, iter_credential_rows(matrix_path), output_path)
+
+        print_results_summary(results)
+        print(f"\n✓ Per-case results streamed to {output_path}")
+        return results
+
+    except Exception as e:
+        print(f"\n✗ Credential matrix execution failed: {e}")
+        return None
+
+    finally:
+        test_suite.cleanup()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a CSV/JSONL credential matrix through the login test")
+    parser.add_argument('matrix', help="Path to a .csv or .jsonl credential matrix")
+    parser.add_argument('--output', default='task2_matrix_results.jsonl', help="JSONL file for per-case results")
+    parser.add_argument('--base-url', default=BASE_URL, help="URL of the login page")
+    parser.add_argument('--backend', choices=sorted(BACKEND_FACTORIES), default=BACKEND_SELENIUM,
+                        help="Backend for rows that do not name one")
+    args = parser.parse_args()
+
+    results = run_matrix_file(args.matrix, args.output, args.base_url, args.backend)
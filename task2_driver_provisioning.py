@@ -0,0 +1,256 @@
+"""
+Task 2: Cached, Offline-Friendly WebDriver Provisioning
+========================================================
+Resolves the ChromeDriver binary once and remembers its path and version
+on disk, so later runs (and every session in a pool) skip
+ChromeDriverManager's version lookup and download. Resolution order:
+
+    1. An explicit driver_path argument
+    2. The CHROMEDRIVER_PATH environment variable
+    3. The on-disk cache from a previous resolution
+    4. A chromedriver binary already on PATH
+    5. ChromeDriverManager().install() (network; skipped when offline)
+
+When a Chrome instance is already running with --remote-debugging-port,
+a single session can attach to that warm browser instead of launching a
+new one by passing its address (e.g. "127.0.0.1:9222") as
+debugger_address; the CLIs read it from TASK2_DEBUGGER_ADDRESS. Pooled,
+async and sharded runners never attach: their sessions would share one
+tab and cookie jar.
+"""
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+from datetime import datetime
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.service import Service
+
+
+# Environment variable the single-session CLIs read a warm browser's address from
+DEBUGGER_ADDRESS_ENV = 'TASK2_DEBUGGER_ADDRESS'
+
+DRIVER_CACHE_FILE = os.environ.get(
+    'TASK2_DRIVER_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'task2', 'chromedriver.json')
+)
+
+_resolve_lock = threading.Lock()
+_resolved_path = None
+
+
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _driver_version(path):
+    """Ask a driver binary for its version string (empty if it cannot say)."""
+    try:
+        output = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=10).stdout
+        return output.strip().splitlines()[0] if output.strip() else ''
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def load_cached_driver(cache_file=DRIVER_CACHE_FILE):
+    """
+    Read the cached driver entry if it still points at a usable binary.
+
+    Returns:
+        dict: {'path', 'version', 'resolved_at'} or None
+    """
+    try:
+        with open(cache_file) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if _is_executable(entry.get('path')) else None
+
+
+def save_cached_driver(path, cache_file=DRIVER_CACHE_FILE):
+    """Record a resolved driver path and its version on disk."""
+    entry = {
+        'path': path,
+        'version': _driver_version(path),
+        'resolved_at': datetime.now().isoformat()
+    }
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump(entry, f, indent=2)
+    except OSError as e:
+        print(f"✗ Could not write driver cache {cache_file}: {e}")
+    return entry
+
+
+def clear_cached_driver(cache_file=DRIVER_CACHE_FILE):
+    """Forget the cached driver, e.g. after a browser/driver version mismatch."""
+    global _resolved_path
+    with _resolve_lock:
+        _resolved_path = None
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
+
+
+def resolve_driver_path(driver_path=None, offline=None, cache_file=DRIVER_CACHE_FILE):
+    """
+    Find a ChromeDriver binary, hitting the network only as a last resort.
+
+    Args:
+        driver_path (str): Explicit driver path, used as-is
+        offline (bool): Never call ChromeDriverManager; defaults to the
+            TASK2_OFFLINE environment variable
+        cache_file (str): Where the resolved path is remembered
+
+    Returns:
+        str: Path to a ChromeDriver executable
+    """
+    global _resolved_path
+
+    if driver_path:
+        return driver_path
+
+    if offline is None:
+        offline = os.environ.get('TASK2_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+    with _resolve_lock:
+        if _is_executable(_resolved_path):
+            return _resolved_path
+
+        candidates = [os.environ.get('CHROMEDRIVER_PATH')]
+        cached = load_cached_driver(cache_file)
+        if cached:
+            candidates.append(cached['path'])
+        candidates.append(shutil.which('chromedriver'))
+
+        for candidate in candidates:
+            if _is_executable(candidate):
+                _resolved_path = candidate
+                if not cached or cached['path'] != candidate:
+                    save_cached_driver(candidate, cache_file)
+                return candidate
+
+        if offline:
+            raise FileNotFoundError(
+                "No local ChromeDriver found; set CHROMEDRIVER_PATH or run once online"
+            )
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        _resolved_path = ChromeDriverManager().install()
+        save_cached_driver(_resolved_path, cache_file)
+        return _resolved_path
+
+
+def warm_browser_address(debugger_address):
+    """
+    The debugger address of a running Chrome to attach to, if one is reachable.
+
+    Args:
+        debugger_address (str): host:port, or None
+
+    Returns:
+        str: The address, or None if nothing is listening there
+    """
+    if not debugger_address:
+        return None
+
+    host, _, port = debugger_address.rpartition(':')
+    try:
+        with socket.create_connection((host or '127.0.0.1', int(port)), timeout=0.5):
+            return debugger_address
+    except (OSError, ValueError):
+        return None
+
+
+def create_chrome_driver(options, driver_path=None, debugger_address=None):
+    """
+    Start (or attach to) Chrome using the cached driver resolution.
+
+    A session that fails to start with a cached driver, typically because
+    Chrome was upgraded, clears the cache and retries once with a fresh
+    resolution.
+
+    Args:
+        options (ChromeOptions): Browser options
+        driver_path (str): Explicit driver path
+        debugger_address (str): host:port of a warm Chrome to reuse; only
+            for a single session, since every driver attached to it shares
+            the same tab, cookies and browser process
+
+    Returns:
+        WebDriver: Chrome driver
+    """
+    address = warm_browser_address(debugger_address)
+    if address:
+        options.add_experimental_option('debuggerAddress', address)
+
+    path = resolve_driver_path(driver_path)
+    try:
+        return webdriver.Chrome(service=Service(executable_path=path), options=options)
+    except SessionNotCreatedException:
+        if driver_path:
+            raise
+        clear_cached_driver()
+        path = resolve_driver_path()
+        return webdriver.Chrome(service=Service(executable_path=path), options=options)
+
+
+def measure_time_to_first_test(base_url, debugger_address=None):
+    """
+    Time a fresh LoginPageTest from construction through its first case.
+
+    Args:
+        base_url (str): URL of the login page
+        debugger_address (str): host:port of a warm Chrome to attach to
+
+    Returns:
+        dict: 'driver_resolution_seconds', 'startup_seconds' and 'first_test_seconds'
+    """
+    from task2_automated_testing import LoginPageTest, VALID_PASSWORD, VALID_USERNAME
+
+    start = time.perf_counter()
+    resolve_driver_path()
+    resolved = time.perf_counter()
+
+    test_suite = LoginPageTest(base_url, debugger_address=debugger_address)
+    started = time.perf_counter()
+    try:
+        test_suite.test_valid_login(VALID_USERNAME, VALID_PASSWORD)
+    finally:
+        finished = time.perf_counter()
+        test_suite.cleanup()
+
+    return {
+        'driver_resolution_seconds': round(resolved - start, 3),
+        'startup_seconds': round(started - start, 3),
+        'first_test_seconds': round(finished - start, 3)
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from task2_automated_testing import BASE_URL
+
+    parser = argparse.ArgumentParser(description="Resolve ChromeDriver and time a fresh test run")
+    parser.add_argument('--base-url', default=BASE_URL, help="URL of the login page")
+    parser.add_argument('--clear-cache', action='store_true', help="Forget the cached driver first")
+    parser.add_argument('--debugger-address', default=os.environ.get(DEBUGGER_ADDRESS_ENV),
+                        help="host:port of a running Chrome to attach to")
+    args = parser.parse_args()
+
+    if args.clear_cache:
+        clear_cached_driver()
+
+    timings = measure_time_to_first_test(args.base_url, args.debugger_address)
+    print("\nTime to first test:")
+    for key, value in timings.items():
+        print(f"  {key}: {value:.3f}s")
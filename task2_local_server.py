@@ -0,0 +1,278 @@
+"""
+Task 2: Local Stand-In Login Server
+====================================
+A small threaded HTTP app that mimics the herokuapp login page used by
+LoginPageTest, so tests and benchmarks can run reproducibly without a
+network connection. It serves the same DOM the tests expect:
+
+    /login          form with #username, #password and #submit
+    /authenticate   POST target; redirects with a .flash.error or .flash.success
+    /secure         protected page, redirects to /login without a session
+    /logout         clears the session
+
+A latency and error profile can be configured to imitate slow or flaky
+environments.
+"""
+
+import html
+import random
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from task2_automated_testing import VALID_PASSWORD, VALID_USERNAME
+
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>The Internet</title></head>
+<body>
+<div id="flash-messages" class="large-12 columns">{flash}</div>
+<div class="example">
+  <h2>Login Page</h2>
+  <form name="login" method="post" action="/authenticate" id="login">
+    <div class="row"><label for="username">Username</label>
+      <input type="text" name="username" id="username"></div>
+    <div class="row"><label for="password">Password</label>
+      <input type="password" name="password" id="password"></div>
+    <button class="radius" type="submit" id="submit"><i class="fa fa-2x fa-sign-in"> Login</i></button>
+  </form>
+</div>
+</body>
+</html>
+"""
+
+SECURE_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>The Internet</title></head>
+<body>
+<div id="flash-messages" class="large-12 columns">{flash}</div>
+<div class="example">
+  <h2>Secure Area</h2>
+  <a class="button secondary radius" href="/logout"><i class="icon-2x icon-signout"> Logout</i></a>
+</div>
+</body>
+</html>
+"""
+
+FLASH = '<div data-alert id="flash" class="flash {kind}">{text}<a href="#" class="close">×</a></div>'
+
+SESSION_COOKIE = 'session'
+
+# Oldest sessions are dropped beyond this many, so long benchmarks stay bounded
+MAX_SESSIONS = 10000
+
+
+class LatencyProfile:
+    """
+    Per-request delay and failure injection.
+    """
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, seed=None):
+        """
+        Args:
+            latency_ms (float): Base delay added to every request
+            jitter_ms (float): Uniform random extra delay, 0..jitter_ms
+            error_rate (float): Fraction of requests answered with HTTP 500
+            seed (int): Seed for reproducible jitter and errors
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def apply(self):
+        """Sleep for this request's latency; return True if it should fail."""
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+            fail = self._random.random() < self.error_rate
+        delay = (self.latency_ms + jitter) / 1000
+        if delay > 0:
+            time.sleep(delay)
+        return fail
+
+
+class _LoginRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _session(self):
+        """Return (token, session dict), creating a session if needed."""
+        token = None
+        for part in self.headers.get('Cookie', '').split(';'):
+            key, _, value = part.strip().partition('=')
+            if key == SESSION_COOKIE:
+                token = value
+        return self.server.session(token)
+
+    def _respond(self, status, body='', headers=None, token=None):
+        payload = body.encode('utf-8')
+        lines = [f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}"]
+        lines.append("Content-Type: text/html; charset=utf-8")
+        lines.append(f"Content-Length: {len(payload)}")
+        if token:
+            lines.append(f"Set-Cookie: {SESSION_COOKIE}={token}; Path=/; HttpOnly")
+        for key, value in (headers or {}).items():
+            lines.append(f"{key}: {value}")
+        # One write per response: split header/body writes stall on Nagle/delayed ACK
+        self.wfile.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + payload)
+        self.wfile.flush()
+
+    def _redirect(self, location, token):
+        self._respond(303, headers={'Location': location}, token=token)
+
+    def _injected_failure(self):
+        if self.server.profile.apply():
+            self._respond(500, '<html><body><h1>Internal Server Error</h1></body></html>')
+            return True
+        return False
+
+    @staticmethod
+    def _render_flash(session):
+        flash = session.pop('flash', None)
+        if not flash:
+            return ''
+        kind, text = flash
+        return FLASH.format(kind=kind, text=html.escape(text))
+
+    def do_GET(self):
+        if self._injected_failure():
+            return
+
+        token, session = self._session()
+        path = urlsplit(self.path).path
+
+        if path in ('/', '/login'):
+            self._respond(200, LOGIN_PAGE.format(flash=self._render_flash(session)), token=token)
+        elif path == '/secure':
+            if session.get('user'):
+                self._respond(200, SECURE_PAGE.format(flash=self._render_flash(session)), token=token)
+            else:
+                session['flash'] = ('error', "You must login to view the secure area!")
+                self._redirect('/login', token)
+        elif path == '/logout':
+            session.pop('user', None)
+            session['flash'] = ('success', "You logged out of the secure area!")
+            self._redirect('/login', token)
+        else:
+            self._respond(404, '<html><body><h1>Not Found</h1></body></html>')
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        form = parse_qs(self.rfile.read(length).decode('utf-8'), keep_blank_values=True)
+
+        if self._injected_failure():
+            return
+
+        token, session = self._session()
+        if urlsplit(self.path).path != '/authenticate':
+            self._respond(404, '<html><body><h1>Not Found</h1></body></html>')
+            return
+
+        username = form.get('username', [''])[0]
+        password = form.get('password', [''])[0]
+        users = self.server.users
+
+        if username not in users:
+            session['flash'] = ('error', "Your username is invalid!")
+            self._redirect('/login', token)
+        elif users[username] != password:
+            session['flash'] = ('error', "Your password is invalid!")
+            self._redirect('/login', token)
+        else:
+            session['user'] = username
+            session['flash'] = ('success', "You logged into a secure area!")
+            self._redirect('/secure', token)
+
+
+class LocalLoginServer(ThreadingHTTPServer):
+    """
+    Threaded login app with in-memory sessions.
+    """
+
+    daemon_threads = True
+    # The default backlog of 5 drops connections under concurrent benchmarks
+    request_queue_size = 256
+
+    def __init__(self, host='127.0.0.1', port=0, profile=None, users=None):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free one)
+            profile (LatencyProfile): Delay/failure injection
+            users (dict): username -> password accepted by /authenticate
+        """
+        super().__init__((host, port), _LoginRequestHandler)
+        self.profile = profile or LatencyProfile()
+        self.users = users or {VALID_USERNAME: VALID_PASSWORD}
+        self._sessions = OrderedDict()
+        self._sessions_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def login_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/login"
+
+    def session(self, token):
+        """Look up a session by cookie token, creating one when unknown."""
+        with self._sessions_lock:
+            if token not in self._sessions:
+                token = secrets.token_hex(16)
+                self._sessions[token] = {}
+                if len(self._sessions) > MAX_SESSIONS:
+                    self._sessions.popitem(last=False)
+            return token, self._sessions[token]
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def start_local_server(port=0, latency_ms=0, jitter_ms=0, error_rate=0.0, seed=None):
+    """
+    Start a LocalLoginServer in the background.
+
+    Returns:
+        LocalLoginServer: Running server; use .login_url as the test base_url
+    """
+    profile = LatencyProfile(latency_ms, jitter_ms, error_rate, seed)
+    return LocalLoginServer(port=port, profile=profile).start()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the login test page")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency-ms', type=float, default=0, help="Delay added to every request")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Random extra delay up to this value")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 500")
+    args = parser.parse_args()
+
+    server = LocalLoginServer(port=args.port, profile=LatencyProfile(args.latency_ms, args.jitter_ms,
+                                                                     args.error_rate))
+    print(f"✓ Serving login page at {server.login_url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,126 @@
+"""
+Task 2: Login Page Object
+==========================
+Keeps every login form selector in one place and resolves the username,
+password and submit elements in a single script call per page load.
+
+Each field has an ordered list of fallback CSS selectors; the first one
+that matches wins, so a page without an id on its submit button (the
+herokuapp demo uses a plain <button type="submit">) still resolves.
+Resolved elements are cached and only looked up again after a navigation
+or when the browser reports them as stale.
+"""
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+
+
+# Fallback selectors per field, most specific first
+LOGIN_FORM_SELECTORS = {
+    'username': ['#username', 'input[name="username"]', 'form input[type="email"]', 'form input[type="text"]'],
+    'password': ['#password', 'input[name="password"]', 'form input[type="password"]'],
+    'submit': ['#submit', 'form button[type="submit"]', 'form input[type="submit"]', 'form button'],
+}
+
+# Tries each field's selectors in order; one round-trip for the whole form
+_RESOLVE_SCRIPT = """
+var selectors = arguments[0];
+var elements = {}, matched = {};
+for (var field in selectors) {
+    var candidates = selectors[field];
+    for (var i = 0; i < candidates.length; i++) {
+        var element = document.querySelector(candidates[i]);
+        if (element) { elements[field] = element; matched[field] = candidates[i]; break; }
+    }
+    if (!elements[field]) { return {missing: field}; }
+}
+return {elements: elements, matched: matched};
+"""
+
+
+class LoginPage:
+    """
+    Page object for the login form with cached, validated element lookups.
+    """
+
+    def __init__(self, driver, wait, selectors=None):
+        """
+        Args:
+            driver: Selenium WebDriver
+            wait (WebDriverWait): Wait used while the form is loading
+            selectors (dict): field -> ordered CSS selectors; defaults to
+                LOGIN_FORM_SELECTORS
+        """
+        self.driver = driver
+        self.wait = wait
+        self.selectors = selectors or LOGIN_FORM_SELECTORS
+        self.matched = {}
+        self.resolutions = 0
+        self._elements = None
+        self._missing = None
+
+    def invalidate(self):
+        """Forget the cached elements; call after the page is reloaded."""
+        self._elements = None
+
+    def _probe(self, driver):
+        state = driver.execute_script(_RESOLVE_SCRIPT, self.selectors)
+        if not state or 'elements' not in state:
+            self._missing = (state or {}).get('missing')
+            return False
+        return state
+
+    def resolve(self):
+        """
+        Wait for the form and look up every field.
+
+        Returns:
+            dict: field -> WebElement
+
+        Raises:
+            NoSuchElementException: If a field matches none of its selectors
+                before the wait's deadline
+        """
+        self._missing = None
+        try:
+            state = self.wait.until(self._probe)
+        except TimeoutException:
+            field = self._missing or 'username'
+            raise NoSuchElementException(
+                f"Login form field '{field}' not found (tried: {', '.join(self.selectors[field])})")
+
+        self._elements = state['elements']
+        self.matched = state['matched']
+        self.resolutions += 1
+        return self._elements
+
+    def wait_for_form(self):
+        """Wait for the form to load and resolve it; a no-op while elements are cached."""
+        if self._elements is None:
+            self.resolve()
+
+    def elements(self):
+        """Cached field elements, resolving them on first use after a page load."""
+        if self._elements is None:
+            return self.resolve()
+        return self._elements
+
+    def _with_elements(self, action):
+        """Run action(elements), re-resolving once if the cached ones went stale."""
+        try:
+            return action(self.elements())
+        except StaleElementReferenceException:
+            self.invalidate()
+            return action(self.resolve())
+
+    def fill(self, username, password):
+        """Clear both fields and type the credentials (empty strings leave them blank)."""
+        def _fill(elements):
+            for field, value in (('username', username), ('password', password)):
+                elements[field].clear()
+                if value:
+                    elements[field].send_keys(value)
+        self._with_elements(_fill)
+
+    def submit(self):
+        """Click the submit button."""
+        self._with_elements(lambda elements: elements['submit'].click())
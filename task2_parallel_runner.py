@@ -0,0 +1,347 @@
+"""
+Task 2: Parallel Login Test Runner
+===================================
+Runs LoginPageTest cases across a pool of WebDriver sessions.
+Each worker thread borrows one browser session at a time, so wall-clock
+time scales down with the pool size instead of summing every case.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from task2_artifacts import DEFAULT_MAX_BYTES, ArtifactStore
+from task2_automated_testing import (
+    BASE_URL, LoginPageTest, default_test_cases, new_results,
+    print_results_summary, save_results_file
+)
+from task2_browser_profiles import BROWSER_PROFILES, DEFAULT_PROFILE, measure_session_mb, sessions_within_budget
+from task2_result_sink import JsonlResultSink, summarise_stream
+from task2_retry import FAILURE_INFRASTRUCTURE, RetryPolicy
+
+
+class SessionPool:
+    """
+    Fixed-size pool of LoginPageTest sessions, one browser per slot.
+    """
+
+    def __init__(self, base_url, size=2, driver_path=None, session_factory=LoginPageTest, profile=None,
+                 retry_policy=None, artifact_store=None):
+        """
+        Start the pool's browser sessions.
+
+        Args:
+            base_url (str): URL of the login page
+            size (int): Number of WebDriver sessions to keep open
+            driver_path (str): Path to ChromeDriver (if not in PATH)
+            session_factory (callable): Builds one session from (base_url, driver_path)
+            profile (str): Browser profile passed to the factory (None keeps its default)
+            retry_policy (RetryPolicy): Retry policy passed to the factory (None keeps its default)
+            artifact_store (ArtifactStore): Failure artifact store shared by every session
+        """
+        if size < 1:
+            raise ValueError("Session pool size must be at least 1")
+
+        self.base_url = base_url
+        self.size = size
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._driver_path = driver_path
+        self._session_factory = session_factory
+        self._session_kwargs = {key: value for key, value in
+                                (('profile', profile), ('retry_policy', retry_policy),
+                                 ('artifact_store', artifact_store)) if value}
+        self.replaced = 0
+
+        # Browser startup dominates, so launch every session concurrently
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(self._new_session) for _ in range(size)]
+
+        self.sessions = []
+        errors = []
+        for future in futures:
+            try:
+                self.sessions.append(future.result())
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            self.close()
+            raise errors[0]
+
+        for session in self.sessions:
+            self._idle.put(session)
+
+        print(f"✓ Session pool ready with {size} browser session(s)")
+
+    def _new_session(self):
+        return self._session_factory(self.base_url, self._driver_path, **self._session_kwargs)
+
+    def acquire(self, timeout=None):
+        """
+        Borrow an idle session, blocking until one is free.
+
+        Raises:
+            queue.Empty: If timeout expires first
+            RuntimeError: If every session was quarantined and none could be replaced
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if not self.sessions:
+                raise RuntimeError("No healthy browser sessions left in the pool")
+            wait = 1.0 if deadline is None else min(1.0, max(0.0, deadline - time.monotonic()))
+            try:
+                return self._idle.get(timeout=wait)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+
+    def release(self, session):
+        """Return a borrowed session to the pool, replacing it if it was quarantined."""
+        if getattr(session, 'quarantined', False):
+            session = self._replace(session)
+            if session is None:
+                return
+        self._idle.put(session)
+
+    def _replace(self, session):
+        """Swap a quarantined session for a fresh one; None if startup fails."""
+        try:
+            session.cleanup()
+        except Exception:
+            pass
+        try:
+            fresh = self._new_session()
+        except Exception as e:
+            fresh = None
+            print(f"✗ Failed to replace quarantined browser session: {e}")
+
+        with self._lock:
+            self.sessions.remove(session)
+            if fresh is not None:
+                self.sessions.append(fresh)
+                self.replaced += 1
+        if fresh is not None:
+            print("✓ Replaced a quarantined browser session")
+        return fresh
+
+    def close(self):
+        """Quit every browser in the pool."""
+        for session in self.sessions:
+            try:
+                session.cleanup()
+            except Exception as e:
+                print(f"✗ Failed to close browser session: {e}")
+        self.sessions = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ParallelLoginRunner:
+    """
+    Dispatches LoginPageTest cases to a SessionPool from worker threads
+    and merges each worker's results into one shared results dict.
+    """
+
+    def __init__(self, pool, result_sink=None):
+        """
+        Args:
+            pool (SessionPool): Sessions the worker threads borrow from
+            result_sink (JsonlResultSink): Stream merged cases to disk instead
+                of keeping them in results['test_cases']
+        """
+        self.pool = pool
+        self.result_sink = result_sink
+        self.results = new_results()
+        self._lock = threading.Lock()
+
+    def run(self, test_cases):
+        """
+        Run test cases concurrently, one worker thread per pooled session.
+
+        Each record is tagged with 'case_index', its position in test_cases,
+        since records are merged in completion order.
+
+        Args:
+            test_cases (iterable): (method_name, args) tuples
+
+        Returns:
+            dict: Merged results in the same layout as LoginPageTest.results
+        """
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+            futures = [executor.submit(self._run_case, method_name, args, case_index)
+                       for case_index, (method_name, args) in enumerate(test_cases)]
+            for future in futures:
+                future.result()
+
+        self.results['duration_seconds'] = round(time.perf_counter() - start, 3)
+        self.results['pool_size'] = self.pool.size
+        self.results['sessions_replaced'] = getattr(self.pool, 'replaced', 0)
+        return self.results
+
+    def _run_case(self, method_name, args, case_index=None, rescheduled=False):
+        """
+        Run one case on a borrowed session and merge what it recorded.
+
+        A case whose infrastructure failure got its session quarantined is
+        run once more on another (or a replacement) session.
+        """
+        session = self.pool.acquire()
+        try:
+            first_new = len(session.results['test_cases'])
+            passed = getattr(session, method_name)(*args)
+            new_cases = session.results['test_cases'][first_new:]
+            # The shared results own these records now; keep the session's list flat
+            del session.results['test_cases'][first_new:]
+            lost_session = (getattr(session, 'quarantined', False) and new_cases
+                            and new_cases[-1].get('failure_kind') == FAILURE_INFRASTRUCTURE)
+        finally:
+            self.pool.release(session)
+
+        if lost_session and not rescheduled:
+            return self._run_case(method_name, args, case_index, rescheduled=True)
+
+        for test_case in new_cases:
+            test_case['case_index'] = case_index
+        self._merge(new_cases)
+        return passed
+
+    def _merge(self, test_cases):
+        """Fold per-worker test case records into the shared results."""
+        with self._lock:
+            for test_case in test_cases:
+                self.results['total_tests'] += 1
+                if test_case['status'] == 'PASSED':
+                    self.results['passed'] += 1
+                else:
+                    self.results['failed'] += 1
+                if self.result_sink:
+                    self.result_sink.write(test_case)
+                else:
+                    self.results['test_cases'].append(test_case)
+
+    def save_results(self, filename='test_results.json'):
+        """Save merged test results to a JSON file."""
+        save_results_file(self.results, filename)
+
+    def print_summary(self):
+        """Print a summary of merged test results, rebuilt from the stream if one is attached."""
+        if self.result_sink:
+            self.result_sink.flush()
+            print_results_summary(summarise_stream(self.result_sink.path))
+        else:
+            print_results_summary(self.results)
+
+
+def pool_size_for_budget(base_url, memory_budget_mb, profile=DEFAULT_PROFILE, max_size=None, reserve_mb=256):
+    """
+    Size a session pool from the measured RSS of one browser session.
+
+    Args:
+        base_url (str): URL of the login page
+        memory_budget_mb (float): Memory available for browsers
+        profile (str): Browser profile the pool will use
+        max_size (int): Upper bound on the result
+        reserve_mb (float): Headroom kept for the test process
+
+    Returns:
+        int: Number of sessions that fit the budget
+    """
+    session_mb = measure_session_mb(base_url, profile)
+    if session_mb is None:
+        print("✗ Browser memory cannot be measured here; using the requested pool size")
+        return max_size or 1
+    size = sessions_within_budget(memory_budget_mb, session_mb, reserve_mb)
+    if max_size:
+        size = min(size, max_size)
+    print(f"✓ One '{profile}' session uses {session_mb:.1f} MB; "
+          f"{size} session(s) fit in {memory_budget_mb:.0f} MB")
+    return size
+
+
+def run_parallel_login_tests(pool_size=2, test_cases=None, base_url=BASE_URL, profile=DEFAULT_PROFILE,
+                             memory_budget_mb=None, retry_policy=None, artifacts_dir=None,
+                             artifacts_max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Run the login test cases across a pool of browser sessions.
+
+    Args:
+        pool_size (int): Number of concurrent WebDriver sessions (the upper
+            bound when memory_budget_mb is given)
+        test_cases (list): (method_name, args) tuples; defaults to the standard four
+        base_url (str): URL of the login page
+        profile (str): Browser profile for every session
+        memory_budget_mb (float): Size the pool to fit this much browser memory
+        retry_policy (RetryPolicy): Retries for flaky cases; defaults to RetryPolicy()
+        artifacts_dir (str): Capture failure screenshots/DOM/console logs here
+        artifacts_max_bytes (int): Disk cap for the artifact directory
+
+    Returns:
+        dict: Merged test results, or None if the run could not start
+    """
+    if memory_budget_mb:
+        pool_size = pool_size_for_budget(base_url, memory_budget_mb, profile, max_size=pool_size)
+
+    print("\n" + "="*80)
+    print(f"TASK 2: PARALLEL LOGIN PAGE TESTING (pool size {pool_size})")
+    print("="*80)
+
+    if test_cases is None:
+        test_cases = default_test_cases()
+
+    artifact_store = ArtifactStore(artifacts_dir, artifacts_max_bytes) if artifacts_dir else None
+
+    try:
+        with SessionPool(base_url, size=pool_size, profile=profile,
+                         retry_policy=retry_policy or RetryPolicy(), artifact_store=artifact_store) as pool, \
+                JsonlResultSink('task2_test_results.jsonl') as result_sink:
+            runner = ParallelLoginRunner(pool, result_sink=result_sink)
+
+            print("\nRunning test cases...")
+            runner.run(test_cases)
+
+            runner.print_summary()
+            print(f"Wall-clock time: {runner.results['duration_seconds']:.2f}s")
+            print(f"\n✓ Test results streamed to {result_sink.path}")
+
+            return runner.results
+
+    except Exception as e:
+        print(f"\n✗ Parallel test execution failed: {e}")
+        return None
+
+    finally:
+        if artifact_store:
+            artifact_store.close()
+            print(f"✓ Failure artifacts in {artifact_store.directory}: {artifact_store.stats}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run login tests across a pool of browser sessions")
+    parser.add_argument('--pool-size', type=int, default=2, help="Number of concurrent WebDriver sessions")
+    parser.add_argument('--profile', default=DEFAULT_PROFILE, choices=list(BROWSER_PROFILES),
+                        help="Browser profile, e.g. minimal-headless for CI")
+    parser.add_argument('--memory-budget-mb', type=float, default=None,
+                        help="Shrink the pool to fit this much browser memory")
+    parser.add_argument('--max-attempts', type=int, default=3,
+                        help="Attempts per case for infrastructure/timing failures")
+    parser.add_argument('--artifacts-dir', default=None,
+                        help="Capture screenshot/DOM/console artifacts of failed cases here")
+    parser.add_argument('--artifacts-max-mb', type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="Disk cap for failure artifacts (least recently used are evicted)")
+    args = parser.parse_args()
+
+    results = run_parallel_login_tests(pool_size=args.pool_size, profile=args.profile,
+                                       memory_budget_mb=args.memory_budget_mb,
+                                       retry_policy=RetryPolicy(max_attempts=args.max_attempts),
+                                       artifacts_dir=args.artifacts_dir,
+                                       artifacts_max_bytes=int(args.artifacts_max_mb * 1024 * 1024))
@@ -0,0 +1,218 @@
+"""
+Task 2: Streaming JSONL Result Sink
+====================================
+Appends one compact JSON record per finished test case instead of dumping
+the whole results dict at the end of a run, so memory stays flat and a
+crash loses at most one flush interval of results. A background thread
+flushes pending records once per interval, so a case that hangs does not
+hold earlier records in the buffer.
+
+Selenium failure messages carry long stack traces, often dozens of lines
+of "Stacktrace:" frames. The sink keeps only the first line(s) of the
+message in each case record and stores every distinct trace once, keyed by
+a short content hash that the case record points to.
+
+Record kinds (one JSON object per line):
+    {"kind": "run", "timestamp": ...}                       once per sink
+    {"kind": "trace", "trace_hash": ..., "trace": ...}      once per distinct trace
+    {"name": ..., "status": ..., "message": ..., "trace_hash": ...}   one per case
+"""
+
+import hashlib
+import json
+import threading
+from datetime import datetime
+
+from task2_timing import phase_percentiles
+
+
+# Longest message kept inline in a case record
+MAX_MESSAGE_CHARS = 300
+
+# Markers that start the bulky part of a Selenium error message
+_TRACE_MARKERS = ('\nStacktrace:', '\n  (Session info:', '; For documentation on this error')
+
+
+def split_trace(message):
+    """
+    Separate the readable head of an error message from its stack trace.
+
+    Returns:
+        tuple: (head, trace) where trace is '' if none was found
+    """
+    cut = len(message)
+    for marker in _TRACE_MARKERS:
+        index = message.find(marker)
+        if index != -1:
+            cut = min(cut, index)
+    return message[:cut].strip(), message[cut:].strip()
+
+
+def trace_hash(trace):
+    """Short, stable content hash for a stack trace."""
+    return hashlib.sha1(trace.encode('utf-8')).hexdigest()[:12]
+
+
+class JsonlResultSink:
+    """
+    Thread-safe, append-only JSONL writer for test case records.
+    """
+
+    def __init__(self, path, flush_interval=1.0, max_message_chars=MAX_MESSAGE_CHARS, append=False):
+        """
+        Args:
+            path (str): JSONL output file
+            flush_interval (float): Seconds between flushes (0 flushes every record)
+            max_message_chars (int): Inline message length limit
+            append (bool): Continue an existing stream instead of starting a new one
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_message_chars = max_message_chars
+        self._lock = threading.Lock()
+        self._seen_traces = set()
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+        self._dirty = False
+        self._closed = threading.Event()
+        self._write_line({'kind': 'run', 'timestamp': datetime.now().isoformat()})
+        self.flush()
+
+        self._flusher = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_periodically, name='jsonl-sink-flush',
+                                             daemon=True)
+            self._flusher.start()
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if self._dirty and not self._file.closed:
+                    self._file.flush()
+                    self._dirty = False
+
+    def _write_line(self, record):
+        self._file.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+
+    def write(self, test_result):
+        """
+        Append one test case record, compacting its message.
+
+        Args:
+            test_result (dict): Record with at least 'name', 'status', 'message'
+        """
+        record = dict(test_result)
+        head, trace = split_trace(str(record.get('message', '')))
+        if len(head) > self.max_message_chars:
+            head = head[:self.max_message_chars - 3] + '...'
+        record['message'] = head
+
+        with self._lock:
+            if trace:
+                digest = trace_hash(trace)
+                record['trace_hash'] = digest
+                if digest not in self._seen_traces:
+                    self._seen_traces.add(digest)
+                    self._write_line({'kind': 'trace', 'trace_hash': digest, 'trace': trace})
+            self._write_line(record)
+
+            if self._flusher is None:
+                self._file.flush()
+            else:
+                self._dirty = True
+
+    def flush(self):
+        """Push buffered records to disk."""
+        with self._lock:
+            self._file.flush()
+            self._dirty = False
+
+    def close(self):
+        """Flush and close the stream."""
+        self._closed.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def iter_stream(path):
+    """
+    Yield case records from a result stream, skipping run/trace records
+    and a torn final line left by a crash.
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if 'kind' not in record:
+                yield record
+
+
+def summarise_stream(path, include_cases=True):
+    """
+    Rebuild a results dict from a result stream.
+
+    Args:
+        path (str): JSONL stream written by JsonlResultSink
+        include_cases (bool): Keep per-case records (disable for huge streams)
+
+    Returns:
+        dict: Results in the same layout as LoginPageTest.results
+    """
+    results = {
+        'total_tests': 0,
+        'passed': 0,
+        'failed': 0,
+        'test_cases': [],
+        'timestamp': None
+    }
+    traces = set()
+
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            kind = record.get('kind')
+            if kind == 'run':
+                results['timestamp'] = results['timestamp'] or record['timestamp']
+                continue
+            if kind == 'trace':
+                traces.add(record['trace_hash'])
+                continue
+
+            results['total_tests'] += 1
+            if record.get('status') == 'PASSED':
+                results['passed'] += 1
+            else:
+                results['failed'] += 1
+            if include_cases:
+                results['test_cases'].append(record)
+
+    results['distinct_traces'] = len(traces)
+    results['phase_latency'] = phase_percentiles(iter_stream(path))
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from task2_automated_testing import print_results_summary
+
+    parser = argparse.ArgumentParser(description="Summarise a JSONL login test result stream")
+    parser.add_argument('stream', help="JSONL file written by JsonlResultSink")
+    parser.add_argument('--counts-only', action='store_true', help="Skip per-case lines")
+    args = parser.parse_args()
+
+    print_results_summary(summarise_stream(args.stream, include_cases=not args.counts_only))
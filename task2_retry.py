@@ -0,0 +1,112 @@
+"""
+Task 2: Failure Classification and Retry Policy
+================================================
+Sorts a failed login case into one of three kinds:
+
+    infrastructure  the browser or driver broke (crash, lost session,
+                    connection refused); retried on a restarted session
+    timing          the page was slow or changed under us (timeouts,
+                    stale elements); retried on a reset session
+    assertion       the page answered and the answer was wrong; never retried
+
+Retries back off exponentially, and a session that keeps crashing is
+quarantined so the pool can replace it instead of failing every case it
+touches.
+"""
+
+import random
+import time
+
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchWindowException, SessionNotCreatedException,
+    StaleElementReferenceException, TimeoutException, WebDriverException
+)
+
+
+FAILURE_INFRASTRUCTURE = 'infrastructure'
+FAILURE_TIMING = 'timing'
+FAILURE_ASSERTION = 'assertion'
+
+RETRYABLE_FAILURES = (FAILURE_INFRASTRUCTURE, FAILURE_TIMING)
+
+# Driver messages that mean the browser process itself is gone
+_CRASH_MARKERS = (
+    'chrome not reachable', 'session deleted', 'disconnected', 'tab crashed',
+    'target window already closed', 'unable to receive message from renderer',
+)
+
+_TIMING_EXCEPTIONS = (TimeoutException, StaleElementReferenceException)
+_INFRASTRUCTURE_EXCEPTIONS = (
+    InvalidSessionIdException, NoSuchWindowException, SessionNotCreatedException,
+    ConnectionError, OSError,
+)
+
+
+def classify_failure(error):
+    """
+    Classify an exception raised while running a login case.
+
+    Args:
+        error (Exception): The exception
+
+    Returns:
+        str: FAILURE_INFRASTRUCTURE, FAILURE_TIMING or FAILURE_ASSERTION
+    """
+    if isinstance(error, _TIMING_EXCEPTIONS):
+        return FAILURE_TIMING
+    if isinstance(error, _INFRASTRUCTURE_EXCEPTIONS):
+        return FAILURE_INFRASTRUCTURE
+    if isinstance(error, WebDriverException):
+        message = str(error).lower()
+        if any(marker in message for marker in _CRASH_MARKERS):
+            return FAILURE_INFRASTRUCTURE
+        # Other driver errors (element not interactable, JS errors) are usually transient
+        return FAILURE_TIMING
+    # urllib3/http.client errors from a dead chromedriver surface as plain exceptions
+    if type(error).__module__.split('.')[0] in ('urllib3', 'http'):
+        return FAILURE_INFRASTRUCTURE
+    return FAILURE_ASSERTION
+
+
+class RetryPolicy:
+    """
+    How often and how patiently failed cases are retried.
+    """
+
+    def __init__(self, max_attempts=3, backoff_seconds=0.5, backoff_factor=2.0, max_backoff_seconds=8.0,
+                 jitter=0.2, quarantine_after=3, retry_on=RETRYABLE_FAILURES):
+        """
+        Args:
+            max_attempts (int): Attempts per case, including the first
+            backoff_seconds (float): Delay before the first retry
+            backoff_factor (float): Multiplier applied to each further delay
+            max_backoff_seconds (float): Upper bound on one delay
+            jitter (float): Random extra fraction added to each delay
+            quarantine_after (int): Consecutive crashes before a session is
+                taken out of service
+            retry_on (tuple): Failure kinds worth retrying
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.backoff_factor = backoff_factor
+        self.max_backoff_seconds = max_backoff_seconds
+        self.jitter = jitter
+        self.quarantine_after = quarantine_after
+        self.retry_on = tuple(retry_on)
+
+    def should_retry(self, failure_kind, attempt):
+        """True if a case that failed with failure_kind on this attempt gets another go."""
+        return failure_kind in self.retry_on and attempt < self.max_attempts
+
+    def delay(self, attempt):
+        """Seconds to wait after the given (1-based) failed attempt."""
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * self.backoff_factor ** (attempt - 1))
+        return delay * (1 + random.uniform(0, self.jitter))
+
+    def sleep(self, attempt):
+        """Back off after the given failed attempt."""
+        time.sleep(self.delay(attempt))
+
+
+# Records every case once: no retries, failures classified only
+NO_RETRY = RetryPolicy(max_attempts=1)
@@ -0,0 +1,112 @@
+"""
+Task 2: Per-Case Session Reset for Login Tests
+===============================================
+Returns a reused browser session to a clean login form between cases.
+Cookies and local/session storage are always cleared so no state leaks
+from one case into the next, but a full page navigation only happens
+when the current page cannot be reused.
+"""
+
+from selenium.common.exceptions import WebDriverException
+
+from task2_page_objects import LOGIN_FORM_SELECTORS
+
+
+# Reset actions, cheapest first
+RESET_REUSED = 'reused'
+RESET_SCRUBBED = 'scrubbed'
+RESET_NAVIGATED = 'navigated'
+
+_CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+# Returns the first element matching one of a field's fallback selectors
+_FIND_FIELD_JS = """
+function findField(candidates) {
+    for (var i = 0; i < candidates.length; i++) {
+        var element = document.querySelector(candidates[i]);
+        if (element) { return element; }
+    }
+    return null;
+}
+"""
+
+# Reports 'clean', 'dirty' (login form present but used) or 'foreign'
+_FORM_STATE_SCRIPT = _FIND_FIELD_JS + """
+var baseUrl = arguments[0], selectors = arguments[1];
+if (window.location.href !== baseUrl || document.readyState !== 'complete') { return 'foreign'; }
+var username = findField(selectors.username);
+var password = findField(selectors.password);
+var submit = findField(selectors.submit);
+if (!username || !password || !submit) { return 'foreign'; }
+if (username.value || password.value || document.querySelector('.error, .success')) { return 'dirty'; }
+return 'clean';
+"""
+
+_SCRUB_FORM_SCRIPT = _FIND_FIELD_JS + """
+var selectors = arguments[0];
+var flashes = document.querySelectorAll('.error, .success');
+for (var i = 0; i < flashes.length; i++) { flashes[i].remove(); }
+var username = findField(selectors.username);
+if (username.form) { username.form.reset(); }
+username.value = '';
+findField(selectors.password).value = '';
+"""
+
+
+def clear_browser_state(driver):
+    """
+    Delete cookies and clear local/session storage for the current origin.
+
+    Args:
+        driver: Selenium WebDriver
+    """
+    try:
+        driver.delete_all_cookies()
+        driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+    except WebDriverException:
+        # Nothing to clear on blank or cross-origin pages
+        pass
+
+
+def reset_to_login_form(driver, base_url, scrub_dom=True, selectors=None):
+    """
+    Clear session state and bring the browser back to an empty login form.
+
+    A page that is already on base_url with an untouched form is reused
+    as-is. When scrub_dom is enabled, a login page that only carries typed
+    values or a flash message is scrubbed in place instead of reloaded.
+    Anything else falls back to a full navigation.
+
+    Args:
+        driver: Selenium WebDriver
+        base_url (str): URL of the login page
+        scrub_dom (bool): Allow in-place cleanup of a used login form;
+            disable for pages whose forms carry one-time tokens
+        selectors (dict): Login form selectors; defaults to LOGIN_FORM_SELECTORS
+
+    Returns:
+        str: RESET_REUSED, RESET_SCRUBBED or RESET_NAVIGATED
+    """
+    selectors = selectors or LOGIN_FORM_SELECTORS
+    clear_browser_state(driver)
+
+    try:
+        state = driver.execute_script(_FORM_STATE_SCRIPT, base_url, selectors)
+    except WebDriverException:
+        state = 'foreign'
+
+    if state == 'clean':
+        return RESET_REUSED
+
+    if state == 'dirty' and scrub_dom:
+        try:
+            driver.execute_script(_SCRUB_FORM_SCRIPT, selectors)
+            return RESET_SCRUBBED
+        except WebDriverException:
+            pass
+
+    driver.get(base_url)
+    return RESET_NAVIGATED
@@ -0,0 +1,247 @@
+"""
+Task 2: Multi-Process Sharded Login Test Runner
+================================================
+Splits a list of login cases across worker processes. Each process owns
+its own SessionPool and ParallelLoginRunner and streams its results to a
+shard file, so result processing in one shard never competes for the GIL
+with another. The shard streams are then merged into one report whose
+case order matches the input list, however the shards finished.
+
+Cases may be (method_name, args) tuples as used by ParallelLoginRunner,
+or scenario dicts with name/username/password/expected/error_keywords as
+produced by task2_credential_matrix.iter_credential_rows. Every shard runs
+browser sessions, so a scenario that names any backend other than
+"selenium" is rejected before any worker starts.
+
+Example:
+    python task2_sharded_runner.py --shards 4 --pool-size 2 --matrix credentials.csv
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from task2_automated_testing import BASE_URL, EXPECT_FAILURE, default_test_cases, print_results_summary
+from task2_backends import BACKEND_SELENIUM
+from task2_browser_profiles import BROWSER_PROFILES, DEFAULT_PROFILE
+from task2_result_sink import JsonlResultSink, summarise_stream
+from task2_retry import RetryPolicy
+
+
+def scenario_to_case(scenario):
+    """
+    Normalise a case to a (method_name, args) tuple.
+
+    Args:
+        scenario: (method_name, args) tuple or scenario dict
+
+    Returns:
+        tuple: (method_name, args) understood by LoginPageTest
+
+    Raises:
+        ValueError: If the scenario names a backend other than Selenium
+    """
+    if not isinstance(scenario, dict):
+        method_name, args = scenario
+        return method_name, tuple(args)
+    backend = scenario.get('backend')
+    if backend and backend != BACKEND_SELENIUM:
+        raise ValueError(f"Scenario '{scenario['name']}' asks for the '{backend}' backend; "
+                         f"the sharded runner only drives {BACKEND_SELENIUM} sessions")
+    return ('run_login_case', (scenario['name'], scenario.get('username', ''), scenario.get('password', ''),
+                               scenario.get('expected', EXPECT_FAILURE),
+                               tuple(scenario.get('error_keywords') or ())))
+
+
+def shard_cases(test_cases, shards):
+    """
+    Deal cases round-robin into shards, remembering each case's position.
+
+    Round-robin keeps slow and fast scenarios that sit next to each other
+    in a matrix spread across shards.
+
+    Returns:
+        list: One list of (case_index, (method_name, args)) per non-empty shard
+    """
+    buckets = [[] for _ in range(max(1, shards))]
+    for case_index, scenario in enumerate(test_cases):
+        buckets[case_index % len(buckets)].append((case_index, scenario_to_case(scenario)))
+    return [bucket for bucket in buckets if bucket]
+
+
+def _run_shard(shard_index, indexed_cases, base_url, pool_size, profile, max_attempts, output_dir):
+    """
+    Worker process entry point: run one shard on its own session pool.
+
+    Returns:
+        dict: Shard summary with its stream path and the global case indices
+    """
+    from task2_parallel_runner import ParallelLoginRunner, SessionPool
+
+    path = os.path.join(output_dir, f"task2_shard_{shard_index}.jsonl")
+    case_indices = [case_index for case_index, _ in indexed_cases]
+    summary = {'shard': shard_index, 'path': path, 'case_indices': case_indices, 'pid': os.getpid()}
+
+    try:
+        with SessionPool(base_url, size=min(pool_size, len(indexed_cases)), profile=profile,
+                         retry_policy=RetryPolicy(max_attempts=max_attempts)) as pool, \
+                JsonlResultSink(path) as result_sink:
+            for session in pool.sessions:
+                session.verbose = False
+            runner = ParallelLoginRunner(pool, result_sink=result_sink)
+            results = runner.run([case for _, case in indexed_cases])
+        summary.update(passed=results['passed'], failed=results['failed'],
+                       duration_seconds=results['duration_seconds'])
+    except Exception as e:
+        summary['error'] = str(e)
+    return summary
+
+
+def merge_shard_streams(shard_summaries, output_path):
+    """
+    Merge shard result streams into one stream ordered like the input list.
+
+    Each shard record's local 'case_index' is mapped back to its position
+    in the original case list. Traces are written once across all shards.
+    Cases of a shard that failed to start are recorded as FAILED.
+
+    Args:
+        shard_summaries (list): Summaries returned by the shard workers
+        output_path (str): Merged JSONL file
+
+    Returns:
+        str: output_path
+    """
+    cases = []
+    traces = {}
+    for summary in shard_summaries:
+        case_indices = summary['case_indices']
+        seen = set()
+        if os.path.exists(summary['path']):
+            with open(summary['path'], encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    kind = record.get('kind')
+                    if kind == 'trace':
+                        traces.setdefault(record['trace_hash'], record)
+                    elif kind is None:
+                        record['case_index'] = case_indices[record['case_index']]
+                        record['shard'] = summary['shard']
+                        seen.add(record['case_index'])
+                        cases.append(record)
+
+        # Cases a crashed shard never reported still belong in the report
+        for case_index in case_indices:
+            if case_index not in seen:
+                cases.append({'name': f"Case {case_index + 1}", 'status': 'FAILED',
+                              'message': f"Shard {summary['shard']} did not report: {summary.get('error', 'no result')}",
+                              'failure_kind': 'infrastructure', 'case_index': case_index,
+                              'shard': summary['shard']})
+
+    cases.sort(key=lambda record: record['case_index'])
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        def write(record):
+            f.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+        write({'kind': 'run', 'timestamp': datetime.now().isoformat(), 'shards': len(shard_summaries)})
+        for digest in sorted(traces):
+            write(traces[digest])
+        for record in cases:
+            write(record)
+    return output_path
+
+
+def run_sharded_login_tests(test_cases=None, shards=None, pool_size=2, base_url=BASE_URL, profile=DEFAULT_PROFILE,
+                            max_attempts=3, output_path='task2_test_results.jsonl', output_dir='.',
+                            start_method='spawn'):
+    """
+    Run login cases across worker processes and merge their results.
+
+    Args:
+        test_cases (list): (method_name, args) tuples or scenario dicts;
+            defaults to the standard four
+        shards (int): Worker processes (defaults to the CPU count)
+        pool_size (int): Browser sessions per worker process
+        base_url (str): URL of the login page
+        profile (str): Browser profile for every session
+        max_attempts (int): Attempts per case for infrastructure/timing failures
+        output_path (str): Merged JSONL result stream
+        output_dir (str): Directory for the per-shard streams
+        start_method (str): multiprocessing start method; 'spawn' avoids
+            forking a process that already runs driver threads
+
+    Returns:
+        dict: Results rebuilt from the merged stream, with 'duration_seconds'
+            and per-shard 'shards' summaries
+    """
+    if test_cases is None:
+        test_cases = default_test_cases()
+    shards = shards or os.cpu_count() or 1
+
+    print("\n" + "="*80)
+    print(f"TASK 2: SHARDED LOGIN PAGE TESTING ({shards} shard(s) x {pool_size} session(s))")
+    print("="*80)
+
+    start = time.perf_counter()
+    buckets = shard_cases(test_cases, shards)
+    context = multiprocessing.get_context(start_method)
+
+    with ProcessPoolExecutor(max_workers=len(buckets), mp_context=context) as executor:
+        futures = [executor.submit(_run_shard, shard_index, bucket, base_url, pool_size, profile,
+                                   max_attempts, output_dir)
+                   for shard_index, bucket in enumerate(buckets)]
+        summaries = []
+        for shard_index, future in enumerate(futures):
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                # The worker process itself died; merge still reports its cases
+                summaries.append({'shard': shard_index, 'path': '', 'error': str(e),
+                                  'case_indices': [case_index for case_index, _ in buckets[shard_index]]})
+
+    for summary in summaries:
+        if 'error' in summary:
+            print(f"✗ Shard {summary['shard']} failed: {summary['error']}")
+        else:
+            print(f"✓ Shard {summary['shard']} (pid {summary['pid']}): {summary['passed']} passed, "
+                  f"{summary['failed']} failed in {summary['duration_seconds']:.2f}s")
+
+    merge_shard_streams(summaries, output_path)
+    for summary in summaries:
+        if summary['path'] and os.path.exists(summary['path']):
+            os.remove(summary['path'])
+
+    results = summarise_stream(output_path)
+    results['duration_seconds'] = round(time.perf_counter() - start, 3)
+    results['shards'] = [{key: value for key, value in summary.items() if key != 'case_indices'}
+                         for summary in summaries]
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from task2_credential_matrix import iter_credential_rows
+
+    parser = argparse.ArgumentParser(description="Run login tests sharded across worker processes")
+    parser.add_argument('--shards', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--pool-size', type=int, default=2, help="Browser sessions per worker process")
+    parser.add_argument('--matrix', default=None, help="CSV/JSONL credential matrix (default: standard four cases)")
+    parser.add_argument('--base-url', default=BASE_URL, help="URL of the login page")
+    parser.add_argument('--profile', default=DEFAULT_PROFILE, choices=list(BROWSER_PROFILES))
+    parser.add_argument('--max-attempts', type=int, default=3)
+    parser.add_argument('--output', default='task2_test_results.jsonl', help="Merged JSONL result stream")
+    args = parser.parse_args()
+
+    cases = list(iter_credential_rows(args.matrix)) if args.matrix else None
+    results = run_sharded_login_tests(cases, args.shards, args.pool_size, args.base_url, args.profile,
+                                      args.max_attempts, args.output)
+    print_results_summary(results)
+    print(f"Wall-clock time: {results['duration_seconds']:.2f}s")
+    print(f"\n✓ Test results streamed to {args.output}")
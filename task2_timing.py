@@ -0,0 +1,115 @@
+"""
+Task 2: Per-Phase Timing for Login Test Cases
+==============================================
+Wraps each phase of a login case in a monotonic timer and stores the
+timestamps on the test case record. Browser cases record 'reset' (session
+reset/navigation), 'wait.until' (waiting for the form to load),
+'find_element' (field lookup), 'send_keys', 'click' and 'outcome'; the
+HTTP backends record 'fetch_form', 'submit' and 'outcome'. The
+report turns those records into p50/p95/p99 latencies per phase, so wait
+or pooling changes can be judged on data.
+
+Each timed record carries:
+    'phases': [{'phase': name, 'start': monotonic seconds, 'duration': seconds}, ...]
+"""
+
+import time
+from contextlib import contextmanager
+
+
+PERCENTILES = (50, 95, 99)
+
+
+class PhaseTimer:
+    """
+    Collects monotonic start/duration pairs for the phases of one case.
+    """
+
+    def __init__(self):
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as one phase, even if it raises."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                'phase': name,
+                'start': round(start, 6),
+                'duration': round(time.monotonic() - start, 6)
+            })
+
+    def attach(self, test_result):
+        """Store the recorded phases on a test case record."""
+        test_result['phases'] = self.phases
+        return test_result
+
+
+def _percentile(sorted_values, percent):
+    """Linear-interpolated percentile of an already sorted list."""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def phase_percentiles(test_cases, percentiles=PERCENTILES):
+    """
+    Aggregate per-phase durations across test case records.
+
+    A phase that runs several times in one case (e.g. two element lookups)
+    counts once with its summed duration.
+
+    Args:
+        test_cases (iterable): Records carrying a 'phases' list
+        percentiles (tuple): Percentiles to report
+
+    Returns:
+        dict: phase -> {'count': n, 'p50': s, 'p95': s, 'p99': s}
+    """
+    durations = {}
+    for test_case in test_cases:
+        per_case = {}
+        for entry in test_case.get('phases') or ():
+            per_case[entry['phase']] = per_case.get(entry['phase'], 0.0) + entry['duration']
+        for name, duration in per_case.items():
+            durations.setdefault(name, []).append(duration)
+
+    report = {}
+    for name, values in durations.items():
+        values.sort()
+        stats = {'count': len(values)}
+        for percent in percentiles:
+            stats[f"p{percent}"] = round(_percentile(values, percent), 6)
+        report[name] = stats
+    return report
+
+
+def print_phase_report(report):
+    """Print a per-phase latency table."""
+    if not report:
+        return
+
+    print("\nPer-Phase Latency (seconds):")
+    columns = [key for key in next(iter(report.values())) if key != 'count']
+    header = f"  {'Phase':<14}{'Count':>8}" + ''.join(f"{column:>10}" for column in columns)
+    print(header)
+    for name, stats in report.items():
+        row = f"  {name:<14}{stats['count']:>8}" + ''.join(f"{stats[column]:>10.3f}" for column in columns)
+        print(row)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from task2_result_sink import iter_stream
+
+    parser = argparse.ArgumentParser(description="Report per-phase latency percentiles from a result stream")
+    parser.add_argument('stream', help="JSONL file written by JsonlResultSink")
+    args = parser.parse_args()
+
+    print_phase_report(phase_percentiles(iter_stream(args.stream)))
@@ -0,0 +1,93 @@
+"""
+Task 2: Event-Driven Waits for Login Tests
+===========================================
+Replaces fixed time.sleep pauses with waits that return as soon as the
+login page reaches a recognisable state: a redirect, a .success or .error
+flash message, or a blocked form with HTML5 validation errors.
+"""
+
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, StaleElementReferenceException
+)
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# Single deadline (seconds) applied to every wait in a test case
+DEFAULT_TIMEOUT = 10
+
+# How often the outcome probe is re-run while waiting
+POLL_FREQUENCY = 0.1
+
+OUTCOME_REDIRECT = 'redirect'
+OUTCOME_SUCCESS = 'success'
+OUTCOME_ERROR = 'error'
+OUTCOME_INVALID_FORM = 'invalid_form'
+
+# Probing the whole page in one script keeps each poll to a single round-trip
+_OUTCOME_SCRIPT = """
+var baseUrl = arguments[0];
+var error = document.querySelector('.error');
+if (error) { return ['error', error.innerText]; }
+var success = document.querySelector('.success');
+if (success) { return ['success', success.innerText]; }
+if (document.readyState === 'complete' && window.location.href !== baseUrl) {
+    return ['redirect', window.location.href];
+}
+var invalid = document.querySelector('form :invalid');
+if (invalid) { return ['invalid_form', invalid.validationMessage || '']; }
+return null;
+"""
+
+_IGNORED_EXCEPTIONS = (
+    NoSuchElementException, StaleElementReferenceException, JavascriptException
+)
+
+
+def make_wait(driver, timeout=DEFAULT_TIMEOUT):
+    """
+    Build an explicit wait that tolerates the page changing under it.
+
+    Args:
+        driver: Selenium WebDriver
+        timeout (float): Deadline in seconds
+
+    Returns:
+        WebDriverWait: Wait polling every POLL_FREQUENCY seconds
+    """
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY,
+                         ignored_exceptions=_IGNORED_EXCEPTIONS)
+
+
+def login_outcome(base_url):
+    """
+    Expected condition that reports the state of the login page.
+
+    Args:
+        base_url (str): URL of the login page; any other URL is a redirect
+
+    Returns:
+        callable: Condition returning (outcome, detail) or False while pending
+    """
+    def _condition(driver):
+        state = driver.execute_script(_OUTCOME_SCRIPT, base_url)
+        if not state:
+            return False
+        return state[0], state[1]
+    return _condition
+
+
+def wait_for_outcome(wait, base_url):
+    """
+    Wait for the page to react to a login submission.
+
+    Args:
+        wait (WebDriverWait): Wait built by make_wait
+        base_url (str): URL of the login page
+
+    Returns:
+        tuple: (outcome, detail) where outcome is one of the OUTCOME_* values
+
+    Raises:
+        TimeoutException: If nothing recognisable appears before the deadline
+    """
+    return wait.until(login_outcome(base_url))
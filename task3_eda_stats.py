@@ -0,0 +1,309 @@
+"""
+Task 3: Incremental EDA Statistics
+===================================
+Mergeable sufficient statistics for profiling the task3 data:
+
+    - per column: non-null count, mean, sum of squared deviations, min, max
+    - over complete rows: mean vector and co-moment (cross-product) matrix
+    - value counts for selected columns (e.g. the target)
+    - a set of 64-bit row hashes for duplicate detection
+
+Two EDAStats objects combine exactly with merge() (Chan et al.'s pairwise
+update for the moments, a set union for the hashes). Partitions can
+therefore be profiled in parallel, cached individually and combined. A
+new partition costs one pass over its own rows, and the correlation matrix
+and summaries of the whole dataset are read from the merged statistics.
+
+Correlation is computed over rows with no missing value in any column. On
+complete data this equals DataFrame.corr(); with missing values pandas
+uses pairwise-complete rows instead.
+
+Example:
+    python task3_eda_stats.py part-000.csv part-001.csv part-002.csv --workers 3
+"""
+
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+class EDAStats:
+    """
+    Sufficient statistics of a set of rows, mergeable across partitions.
+    """
+
+    def __init__(self, columns, count_columns=()):
+        """
+        Args:
+            columns (list): Numeric columns to summarise and correlate
+            count_columns (tuple): Columns whose value counts are kept
+        """
+        width = len(columns)
+        self.columns = list(columns)
+        self.count_columns = list(count_columns)
+        self.rows = 0
+        self.missing = np.zeros(width, dtype=np.int64)
+        self.count = np.zeros(width, dtype=np.int64)
+        self.mean = np.zeros(width)
+        self.m2 = np.zeros(width)
+        self.min = np.full(width, np.inf)
+        self.max = np.full(width, -np.inf)
+        self.complete_rows = 0
+        self.complete_mean = np.zeros(width)
+        self.comoment = np.zeros((width, width))
+        self.value_counts = {name: {} for name in self.count_columns}
+        self.row_hashes = set()
+
+    @classmethod
+    def from_frame(cls, frame, columns=None, count_columns=()):
+        """
+        Statistics of one DataFrame partition.
+
+        Args:
+            frame (DataFrame): The partition
+            columns (list): Numeric columns (all numeric columns by default)
+            count_columns (tuple): Columns whose value counts are kept
+
+        Returns:
+            EDAStats: Statistics of the partition
+        """
+        import pandas as pd
+
+        if columns is None:
+            columns = list(frame.select_dtypes('number').columns)
+        stats = cls(columns, count_columns)
+        stats.rows = len(frame)
+        stats.row_hashes = set(pd.util.hash_pandas_object(frame, index=False).tolist())
+        for name in stats.count_columns:
+            counts = frame[name].value_counts(dropna=False)
+            stats.value_counts[name] = {key: int(value) for key, value in counts.items()}
+        if len(frame) == 0:
+            return stats
+
+        values = frame[columns].to_numpy(dtype=np.float64)
+        null = np.isnan(values)
+        stats.missing = null.sum(axis=0)
+        stats.count = len(values) - stats.missing
+        present = stats.count > 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            stats.mean = np.where(present, np.nansum(values, axis=0) / stats.count, 0.0)
+            stats.m2 = np.nansum((values - stats.mean) ** 2, axis=0)
+            stats.min = np.where(present, np.nanmin(np.where(null, np.inf, values), axis=0), np.inf)
+            stats.max = np.where(present, np.nanmax(np.where(null, -np.inf, values), axis=0), -np.inf)
+
+        complete = values[~null.any(axis=1)]
+        stats.complete_rows = len(complete)
+        if len(complete):
+            stats.complete_mean = complete.mean(axis=0)
+            centered = complete - stats.complete_mean
+            stats.comoment = centered.T @ centered
+        return stats
+
+    def merge(self, other):
+        """
+        Fold another partition's statistics into this one.
+
+        Returns:
+            EDAStats: self
+        """
+        if other.columns != self.columns or other.count_columns != self.count_columns:
+            raise ValueError("Cannot merge statistics over different columns")
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(total > 0, other.count / np.maximum(total, 1), 0.0)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * weight
+        self.mean = self.mean + delta * weight
+        self.count = total
+        self.missing = self.missing + other.missing
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+
+        complete_total = self.complete_rows + other.complete_rows
+        if other.complete_rows:
+            delta = other.complete_mean - self.complete_mean
+            weight = other.complete_rows / complete_total
+            self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * self.complete_rows * weight
+            self.complete_mean = self.complete_mean + delta * weight
+        self.complete_rows = complete_total
+
+        for name, counts in other.value_counts.items():
+            merged = self.value_counts[name]
+            for key, value in counts.items():
+                merged[key] = merged.get(key, 0) + value
+        self.rows += other.rows
+        self.row_hashes |= other.row_hashes
+        return self
+
+    @property
+    def duplicate_rows(self):
+        """Rows identical to an earlier row (as DataFrame.duplicated().sum())."""
+        return self.rows - len(self.row_hashes)
+
+    def correlation(self, columns=None):
+        """
+        Pearson correlation matrix over complete rows.
+
+        Args:
+            columns (list): Subset of columns to return (all by default)
+
+        Returns:
+            DataFrame: Correlation matrix
+        """
+        import pandas as pd
+
+        index = [self.columns.index(name) for name in columns] if columns is not None else \
+            list(range(len(self.columns)))
+        comoment = self.comoment[np.ix_(index, index)]
+        scale = np.sqrt(np.diag(comoment))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            correlation = comoment / np.outer(scale, scale)
+        names = [self.columns[i] for i in index]
+        return pd.DataFrame(np.clip(correlation, -1.0, 1.0), index=names, columns=names)
+
+    def describe(self):
+        """
+        Per-column summary like DataFrame.describe() without quantiles.
+
+        Returns:
+            DataFrame: count, missing, mean, std, min and max per column
+        """
+        import pandas as pd
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(self.m2 / (self.count - 1))
+        return pd.DataFrame({'count': self.count, 'missing': self.missing, 'mean': self.mean, 'std': std,
+                             'min': self.min, 'max': self.max}, index=self.columns).T
+
+    def summary(self):
+        """
+        Returns:
+            dict: 'rows', 'missing_values', 'duplicate_rows' and 'value_counts'
+        """
+        return {
+            'rows': self.rows,
+            'missing_values': int(self.missing.sum()),
+            'duplicate_rows': self.duplicate_rows,
+            'value_counts': {name: dict(sorted(counts.items(), key=lambda item: str(item[0])))
+                             for name, counts in self.value_counts.items()},
+        }
+
+
+def merge_stats(partials):
+    """Combine a non-empty sequence of EDAStats into a new object."""
+    partials = list(partials)
+    merged = EDAStats(partials[0].columns, partials[0].count_columns)
+    for partial in partials:
+        merged.merge(partial)
+    return merged
+
+
+def _read_partition(path):
+    import pandas as pd
+
+    if os.path.splitext(path)[1].lower() in ('.parquet', '.pq'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def _partition_stats(path, columns, count_columns):
+    """Read and profile one partition file (runs in a worker process)."""
+    return EDAStats.from_frame(_read_partition(path), columns, count_columns)
+
+
+def partition_fingerprint(path):
+    """Cache identity of a partition file's content: its size and modification time."""
+    status = os.stat(path)
+    return {'size': status.st_size, 'mtime_ns': status.st_mtime_ns}
+
+
+def _partition_stage_name(path):
+    # One stage per partition file, so a rewritten partition replaces only its own entry
+    return f"eda_partition_{hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]}"
+
+
+def profile_partitions(paths, columns=None, count_columns=(), cache=None, workers=None):
+    """
+    Statistics of several partition files, computing only uncached ones.
+
+    Partitions missing from the cache are profiled in parallel in a process
+    pool and stored one entry per partition; all partitions are then merged.
+
+    Args:
+        paths (list): CSV or Parquet partition files
+        columns (list): Numeric columns (all numeric columns of the first
+            partition by default)
+        count_columns (tuple): Columns whose value counts are kept
+        cache (StageCache): Cache for per-partition statistics (None disables it)
+        workers (int): Worker processes (os.cpu_count() by default)
+
+    Returns:
+        tuple: (merged EDAStats, number of partitions computed by this call)
+    """
+    from task3_stage_cache import StageCache
+
+    if columns is None:
+        columns = list(_read_partition(paths[0]).select_dtypes('number').columns)
+    params = {'columns': list(columns), 'count_columns': list(count_columns)}
+    cache = cache or StageCache(enabled=False, verbose=False)
+
+    partials, pending = {}, []
+    for path in paths:
+        name = _partition_stage_name(path)
+        key = cache.key(name, _partition_stats, (partition_fingerprint(path),), params)
+        result = cache.lookup(name, key)
+        if result is not None:
+            partials[path] = result.value
+        else:
+            pending.append((path, name, key))
+
+    if pending:
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(pending))) as executor:
+            results = executor.map(_partition_stats, [path for path, _, _ in pending],
+                                   [params['columns']] * len(pending), [params['count_columns']] * len(pending))
+            for (path, name, key), stats in zip(pending, results):
+                partials[path] = cache.store(name, key, stats, time.perf_counter() - start).value
+
+    return merge_stats(partials[path] for path in paths), len(pending)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from task3_stage_cache import DEFAULT_CACHE_DIR, StageCache
+
+    parser = argparse.ArgumentParser(description="Incremental EDA statistics over partition files")
+    parser.add_argument('partitions', nargs='+', help="CSV or Parquet partition files")
+    parser.add_argument('--count-columns', nargs='*', default=['target'])
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--top', type=int, default=10, help="Print the N most correlated feature pairs")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats, computed = profile_partitions(args.partitions, count_columns=args.count_columns,
+                                         cache=StageCache(args.cache_dir, enabled=not args.no_cache, verbose=False),
+                                         workers=args.workers)
+    summary = stats.summary()
+    print(f"✓ Profiled {len(args.partitions)} partition(s) ({computed} computed, "
+          f"{len(args.partitions) - computed} cached) in {time.perf_counter() - start:.2f}s")
+    print(f"Rows: {summary['rows']}")
+    print(f"Missing Values: {summary['missing_values']}")
+    print(f"Duplicate Rows: {summary['duplicate_rows']}")
+    for name, counts in summary['value_counts'].items():
+        print(f"{name} counts: {counts}")
+
+    features = [name for name in stats.columns if name not in args.count_columns]
+    correlation = stats.correlation(features).to_numpy()
+    upper = np.triu_indices(len(features), k=1)
+    strongest = np.argsort(-np.abs(correlation[upper]))[:args.top]
+    print(f"\nTop {len(strongest)} correlated feature pairs:")
+    for pair in strongest:
+        i, j = upper[0][pair], upper[1][pair]
+        print(f"  {features[i]:<25} {features[j]:<25} {correlation[i, j]:+.4f}")
@@ -0,0 +1,274 @@
+"""
+Task 3: Flat-Array Random Forest Inference
+===========================================
+Exports a fitted RandomForestClassifier into a handful of contiguous NumPy
+arrays (split feature, threshold, left/right child and leaf class
+probabilities for every node of every tree) and scores batches by walking
+all trees at once with vectorized indexing. When numba is installed a
+compiled loop is used instead; it is optional and imported lazily.
+
+Leaves point to themselves and carry an +inf threshold, so a fixed number
+of steps (the forest's maximum depth) finishes every path without
+branching on leaf checks. Inputs are compared as float32, exactly as
+sklearn's trees do, so results match predict_proba to rounding error.
+
+The NumPy engine targets the online path: it removes sklearn's per-call
+overhead, which dominates batches up to a few hundred rows. For bulk
+scoring without numba, sklearn's compiled traversal remains faster.
+
+Example:
+    python task3_flat_forest.py --model task3_model.joblib --batch-sizes 1 8 64 1024
+"""
+
+import time
+
+import numpy as np
+
+
+# Rows scored per vectorized step; bounds the (trees x rows) node index matrix
+DEFAULT_BLOCK_ROWS = 1024
+
+
+class FlatForest:
+    """
+    A random forest stored as flat node arrays.
+    """
+
+    def __init__(self, feature, threshold, left, right, values, roots, max_depth, classes):
+        """
+        Args:
+            feature (ndarray): int32 split feature per node (0 for leaves)
+            threshold (ndarray): float64 split threshold per node (+inf for leaves)
+            left (ndarray): int32 global index of the left child (self for leaves)
+            right (ndarray): int32 global index of the right child (self for leaves)
+            values (ndarray): float64 (n_nodes, n_classes) class probabilities at leaves
+            roots (ndarray): int32 root node index of each tree
+            max_depth (int): Deepest path in any tree
+            classes (ndarray): Class labels in column order of values
+        """
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.values = values
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.classes = classes
+        # Interleaved (left, right) pairs: one gather picks the next node
+        self._children = np.stack([left, right], axis=1).ravel().astype(np.int32)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    @property
+    def nbytes(self):
+        """Memory held by the node arrays, including the interleaved child index."""
+        return sum(array.nbytes for array in (self.feature, self.threshold, self.left, self.right,
+                                              self.values, self.roots, self._children))
+
+    def _predict_block(self, X):
+        # Tree-major (trees x rows) node matrix over a feature-major copy of X;
+        # flat np.take gathers are much cheaper than 2-D fancy indexing
+        n_rows = len(X)
+        columns = np.ascontiguousarray(X.T).ravel()
+        offsets = np.arange(n_rows, dtype=np.int64)[None, :]
+        nodes = np.repeat(self.roots.astype(np.int64)[:, None], n_rows, axis=1)
+        for _ in range(self.max_depth):
+            go_right = columns.take(self.feature.take(nodes) * n_rows + offsets) > self.threshold.take(nodes)
+            nodes = self._children.take(nodes * 2 + go_right)
+        return self.values.take(nodes, axis=0).mean(axis=0)
+
+    def predict_proba(self, X, block_rows=DEFAULT_BLOCK_ROWS, use_numba=None):
+        """
+        Class probabilities for already-scaled feature rows.
+
+        Args:
+            X (array-like): 2-D array of scaled features
+            block_rows (int): Rows per vectorized block
+            use_numba (bool): Force (True) or skip (False) the compiled
+                kernel; None uses it when numba is installed
+
+        Returns:
+            ndarray: (n_rows, n_classes) probabilities, as sklearn's predict_proba
+        """
+        # sklearn trees compare float32 inputs against float64 thresholds
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        kernel = _numba_kernel() if use_numba is not False else None
+        if use_numba and kernel is None:
+            raise ImportError("numba is not installed")
+        if kernel is not None:
+            out = np.zeros((len(X), self.values.shape[1]))
+            kernel(X, self.feature, self.threshold, self.left, self.right, self.values, self.roots, out)
+            return out / self.n_trees
+
+        if len(X) <= block_rows:
+            return self._predict_block(X)
+        return np.vstack([self._predict_block(X[start:start + block_rows])
+                          for start in range(0, len(X), block_rows)])
+
+    def save(self, path):
+        """Write the node arrays to an uncompressed .npz file."""
+        np.savez(path, feature=self.feature, threshold=self.threshold, left=self.left, right=self.right,
+                 values=self.values, roots=self.roots, max_depth=np.array(self.max_depth),
+                 classes=self.classes)
+
+    @classmethod
+    def load(cls, path):
+        """Read a forest written by save()."""
+        with np.load(path) as arrays:
+            return cls(arrays['feature'], arrays['threshold'], arrays['left'], arrays['right'],
+                       arrays['values'], arrays['roots'], int(arrays['max_depth']), arrays['classes'])
+
+
+def export_forest(model):
+    """
+    Flatten a fitted RandomForestClassifier (or a single decision tree).
+
+    Args:
+        model: Fitted sklearn forest or tree classifier
+
+    Returns:
+        FlatForest: Equivalent flat-array forest
+    """
+    estimators = getattr(model, 'estimators_', [model])
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset, max_depth = 0, 0
+
+    for estimator in estimators:
+        tree = estimator.tree_
+        n_nodes = tree.node_count
+        index = np.arange(n_nodes)
+        leaf = tree.children_left == -1
+
+        features.append(np.where(leaf, 0, tree.feature).astype(np.int32))
+        thresholds.append(np.where(leaf, np.inf, tree.threshold).astype(np.float64))
+        lefts.append((np.where(leaf, index, tree.children_left) + offset).astype(np.int32))
+        rights.append((np.where(leaf, index, tree.children_right) + offset).astype(np.int32))
+        # Leaf class fractions, normalised the way DecisionTreeClassifier.predict_proba does
+        counts = np.asarray(tree.value[:, 0, :], dtype=np.float64)
+        totals = counts.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1.0
+        values.append(counts / totals)
+        roots.append(offset)
+
+        max_depth = max(max_depth, tree.max_depth)
+        offset += n_nodes
+
+    return FlatForest(np.concatenate(features), np.concatenate(thresholds), np.concatenate(lefts),
+                      np.concatenate(rights), np.vstack(values), np.array(roots, dtype=np.int32),
+                      max_depth, np.asarray(model.classes_))
+
+
+def verify_against_sklearn(model, flat_forest, X, atol=1e-9):
+    """
+    Compare flat-forest and sklearn probabilities on the same rows.
+
+    Returns:
+        float: Largest absolute difference
+
+    Raises:
+        AssertionError: If the difference exceeds atol
+    """
+    expected = model.predict_proba(X)
+    actual = flat_forest.predict_proba(X)
+    difference = float(np.abs(expected - actual).max())
+    if difference > atol:
+        raise AssertionError(f"Flat forest differs from sklearn by {difference:.3g} (> {atol:g})")
+    return difference
+
+
+_NUMBA_KERNEL = None
+_NUMBA_CHECKED = False
+
+
+def _numba_kernel():
+    """Compile the per-row traversal loop with numba, or return None without it."""
+    global _NUMBA_KERNEL, _NUMBA_CHECKED
+    if _NUMBA_CHECKED:
+        return _NUMBA_KERNEL
+    _NUMBA_CHECKED = True
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True, nogil=True)
+    def _traverse(X, feature, threshold, left, right, values, roots, out):
+        for row in range(X.shape[0]):
+            for tree in range(roots.shape[0]):
+                node = roots[tree]
+                while left[node] != node:
+                    if X[row, feature[node]] <= threshold[node]:
+                        node = left[node]
+                    else:
+                        node = right[node]
+                for column in range(values.shape[1]):
+                    out[row, column] += values[node, column]
+
+    _NUMBA_KERNEL = _traverse
+    return _NUMBA_KERNEL
+
+
+def benchmark_engines(model, X, batch_sizes=(1, 8, 64, 1024), repeats=50):
+    """
+    Time sklearn and flat-forest predict_proba per batch size.
+
+    Returns:
+        list: Rows with batch size and microseconds per call for each engine
+    """
+    flat_forest = export_forest(model)
+    rows = []
+    for batch_size in batch_sizes:
+        batch = X[np.arange(batch_size) % len(X)]
+        row = {'batch_size': batch_size}
+        for engine, predict in (('sklearn', model.predict_proba), ('flat', flat_forest.predict_proba)):
+            predict(batch)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                predict(batch)
+            row[f"{engine}_us"] = round((time.perf_counter() - start) / repeats * 1e6, 1)
+        row['speedup'] = round(row['sklearn_us'] / row['flat_us'], 1)
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from sklearn.datasets import load_breast_cancer
+
+    from task3_model_artifact import MODEL_FILE, load_model_artifact
+
+    parser = argparse.ArgumentParser(description="Export the task3 forest to flat arrays and benchmark it")
+    parser.add_argument('--model', default=MODEL_FILE)
+    parser.add_argument('--output', default=None, help="Optional .npz file for the exported forest")
+    parser.add_argument('--batch-sizes', nargs='+', type=int, default=[1, 8, 64, 1024])
+    parser.add_argument('--repeats', type=int, default=50)
+    args = parser.parse_args()
+
+    artifact = load_model_artifact(args.model)
+    forest, scaler = artifact['model'], artifact['scaler']
+    # Single-threaded on both sides so the comparison is per-call overhead
+    forest.n_jobs = 1
+    features = (load_breast_cancer().data - scaler.mean_) / scaler.scale_
+
+    flat = export_forest(forest)
+    difference = verify_against_sklearn(forest, flat, features)
+    print(f"✓ Exported {flat.n_trees} trees, {flat.n_nodes} nodes, {flat.nbytes / 1024:.1f} KiB; "
+          f"max |difference| vs sklearn = {difference:.2e}")
+    if args.output:
+        flat.save(args.output)
+        print(f"✓ Saved: {args.output}")
+
+    print(f"\n{'Batch':>8}{'sklearn (us)':>15}{'flat (us)':>12}{'Speedup':>10}")
+    for result in benchmark_engines(forest, features, args.batch_sizes, args.repeats):
+        print(f"{result['batch_size']:>8}{result['sklearn_us']:>15.1f}{result['flat_us']:>12.1f}"
+              f"{result['speedup']:>9.1f}x")
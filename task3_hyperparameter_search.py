@@ -0,0 +1,271 @@
+"""
+Task 3: Parallel Hyperparameter Search with Successive Halving
+===============================================================
+Tunes the task3 RandomForestClassifier instead of relying on the
+hard-coded MODEL_PARAMS.
+
+Every candidate configuration is scored with stratified k-fold
+cross-validation on the training split, one (candidate, fold) fit per job
+in a process pool. Successive halving uses the tree count as the budget:
+all candidates start with a small forest, and after each rung only the
+best 1/eta survive to be refitted with eta times as many trees, and the
+last rung always fits the full max_resource trees. Weak configurations are
+therefore dropped after a few cheap fits instead of being trained at full
+size. Equal scores are ranked by candidate order, so results are
+reproducible.
+
+Each rung of each candidate becomes one leaderboard row with its CV score
+and fit/score timings, saved as CSV.
+
+Example:
+    python task3_hyperparameter_search.py --workers 4 --folds 5
+    python task3_hyperparameter_search.py --compare-exhaustive --train-best
+"""
+
+import itertools
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+LEADERBOARD_FILE = 'task3_search_leaderboard.csv'
+
+# Candidate grid; n_estimators is the halving budget, not a grid axis
+SEARCH_SPACE = {
+    'max_depth': [4, 6, 10, None],
+    'min_samples_split': [2, 5, 10],
+    'min_samples_leaf': [1, 2, 4],
+    'max_features': ['sqrt', 'log2'],
+}
+
+# Tree-count budget: the first rung fits min_resource trees, the last max_resource
+MIN_RESOURCE = 25
+MAX_RESOURCE = 200
+ETA = 3
+
+
+def candidate_grid(search_space=None):
+    """
+    Expand a search space into a list of parameter dicts.
+
+    Args:
+        search_space (dict): Parameter name -> list of values (SEARCH_SPACE by default)
+
+    Returns:
+        list: One dict per combination, in a stable order
+    """
+    search_space = search_space or SEARCH_SPACE
+    names = sorted(search_space)
+    return [dict(zip(names, values)) for values in itertools.product(*(search_space[name] for name in names))]
+
+
+def halving_schedule(n_candidates, min_resource=MIN_RESOURCE, max_resource=MAX_RESOURCE, eta=ETA):
+    """
+    Plan the rungs of a successive-halving run.
+
+    Returns:
+        list: (n_candidates, n_estimators) per rung; the last rung always
+            trains max_resource trees. Once a single candidate is left, the
+            intermediate rungs are skipped and it goes straight to the last.
+    """
+    n_rungs = 1 + max(0, int(math.ceil(math.log(max_resource / min_resource, eta) - 1e-9)))
+    schedule = []
+    for rung in range(n_rungs):
+        count = max(1, n_candidates // eta ** rung)
+        last = rung == n_rungs - 1 or count == 1
+        schedule.append((count, int(max_resource if last else min_resource * eta ** rung)))
+        if last:
+            break
+    return schedule
+
+
+# Training data shared by every job in a worker process, set by _init_worker
+_WORKER_DATA = {}
+
+
+def _init_worker(X, y):
+    _WORKER_DATA['X'] = X
+    _WORKER_DATA['y'] = y
+
+
+def _fit_fold(candidate_id, params, n_estimators, train_index, test_index, scoring, random_state):
+    """Fit and score one candidate on one CV fold inside a worker."""
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.metrics import get_scorer
+
+    X, y = _WORKER_DATA['X'], _WORKER_DATA['y']
+    # One thread per fit: the pool already provides the parallelism
+    model = RandomForestClassifier(n_estimators=n_estimators, random_state=random_state, n_jobs=1, **params)
+
+    start = time.perf_counter()
+    model.fit(X[train_index], y[train_index])
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score = get_scorer(scoring)(model, X[test_index], y[test_index])
+    score_seconds = time.perf_counter() - start
+
+    return candidate_id, float(score), fit_seconds, score_seconds
+
+
+def successive_halving(X, y, candidates=None, folds=5, scoring='accuracy', min_resource=MIN_RESOURCE,
+                       max_resource=MAX_RESOURCE, eta=ETA, workers=None, random_state=42,
+                       start_method=None, verbose=True):
+    """
+    Search candidate forest configurations with successive halving.
+
+    Passing min_resource=max_resource runs a single rung, i.e. an
+    exhaustive grid search at full size through the same pool.
+
+    Args:
+        X (ndarray): Training features
+        y (ndarray): Training labels
+        candidates (list): Parameter dicts (candidate_grid() by default)
+        folds (int): Stratified CV folds
+        scoring (str): sklearn scorer name, higher is better
+        min_resource (int): Trees per forest in the first rung
+        max_resource (int): Trees per forest in the last rung
+        eta (int): Keep the best 1/eta candidates after each rung
+        workers (int): Worker processes (os.cpu_count() by default)
+        random_state (int): Seed for the folds and every forest
+        start_method (str): multiprocessing start method (platform default if None)
+        verbose (bool): Print one line per rung
+
+    Returns:
+        dict: 'best_params' (including n_estimators), 'best_score',
+            'leaderboard' (list of row dicts, best first) and 'seconds'
+    """
+    from sklearn.model_selection import StratifiedKFold
+
+    candidates = candidates if candidates is not None else candidate_grid()
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.asarray(y)
+    splits = list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=random_state).split(X, y))
+    workers = workers or os.cpu_count() or 1
+    context = multiprocessing.get_context(start_method)
+
+    leaderboard = []
+    # Candidates ranked by the previous rung; each rung keeps the schedule's count
+    ranked = list(range(len(candidates)))
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                             initargs=(X, y)) as executor:
+        for rung, (count, n_estimators) in enumerate(halving_schedule(len(candidates), min_resource,
+                                                                      max_resource, eta)):
+            alive = ranked[:count]
+            rung_start = time.perf_counter()
+            futures = [executor.submit(_fit_fold, candidate_id, candidates[candidate_id], n_estimators,
+                                       train_index, test_index, scoring, random_state)
+                       for candidate_id in alive for train_index, test_index in splits]
+
+            folds_by_candidate = {candidate_id: [] for candidate_id in alive}
+            for future in futures:
+                candidate_id, score, fit_seconds, score_seconds = future.result()
+                folds_by_candidate[candidate_id].append((score, fit_seconds, score_seconds))
+
+            rows = []
+            for candidate_id, results in folds_by_candidate.items():
+                scores, fit_times, score_times = (np.array(column) for column in zip(*results))
+                rows.append({
+                    'candidate': candidate_id,
+                    'rung': rung,
+                    'n_estimators': n_estimators,
+                    **candidates[candidate_id],
+                    'mean_score': float(scores.mean()),
+                    'std_score': float(scores.std()),
+                    'mean_fit_seconds': float(fit_times.mean()),
+                    'mean_score_seconds': float(score_times.mean()),
+                    'total_fit_seconds': float(fit_times.sum()),
+                })
+            # Best score first; ties go to the earlier candidate so reruns pick the same winner
+            rows.sort(key=lambda row: (-row['mean_score'], row['candidate']))
+            leaderboard.extend(rows)
+
+            ranked = [row['candidate'] for row in rows]
+            if verbose:
+                print(f"  Rung {rung}: {len(rows)} candidate(s) x {folds} folds at {n_estimators} trees "
+                      f"in {time.perf_counter() - rung_start:.1f}s, best {scoring} = {rows[0]['mean_score']:.4f}")
+
+    # Rank by the deepest rung reached, then by score within it
+    leaderboard.sort(key=lambda row: (-row['rung'], -row['mean_score'], row['candidate']))
+    best = leaderboard[0]
+    return {
+        'best_params': {**candidates[best['candidate']], 'n_estimators': best['n_estimators']},
+        'best_score': best['mean_score'],
+        'leaderboard': leaderboard,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def save_leaderboard(leaderboard, path=LEADERBOARD_FILE):
+    """Write the leaderboard rows to CSV."""
+    import pandas as pd
+
+    pd.DataFrame(leaderboard).to_csv(path, index=False)
+    return path
+
+
+def load_training_split(cache=None):
+    """
+    Training features and labels from the task3 pipeline's cached stages.
+
+    The test split is never touched by the search. Trees are insensitive to
+    feature scaling, so the folds use the unscaled features.
+
+    Returns:
+        tuple: (X_train, y_train) as arrays
+    """
+    from task3_predictive_analytics import load_split
+    from task3_stage_cache import StageCache
+
+    cache = cache or StageCache(verbose=False)
+    split = load_split(cache, lazy=True)[1].value
+    return split['X_train'].to_numpy(), split['y_train'].to_numpy()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Successive-halving search over the task3 forest hyperparameters")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--scoring', default='accuracy', help="sklearn scorer name, e.g. accuracy, f1, roc_auc")
+    parser.add_argument('--min-trees', type=int, default=MIN_RESOURCE)
+    parser.add_argument('--max-trees', type=int, default=MAX_RESOURCE)
+    parser.add_argument('--eta', type=int, default=ETA)
+    parser.add_argument('--output', default=LEADERBOARD_FILE)
+    parser.add_argument('--compare-exhaustive', action='store_true',
+                        help="Also time the full grid at --max-trees for comparison")
+    parser.add_argument('--train-best', action='store_true',
+                        help="Run the task3 pipeline (without plots) with the best configuration")
+    args = parser.parse_args()
+
+    X_train, y_train = load_training_split()
+    grid = candidate_grid()
+    schedule = halving_schedule(len(grid), args.min_trees, args.max_trees, args.eta)
+    print(f"Searching {len(grid)} candidates x {args.folds} folds; rungs (candidates, trees): {schedule}")
+
+    result = successive_halving(X_train, y_train, grid, args.folds, args.scoring, args.min_trees,
+                                args.max_trees, args.eta, args.workers)
+    save_leaderboard(result['leaderboard'], args.output)
+    print(f"\n✓ Search finished in {result['seconds']:.1f}s")
+    print(f"✓ Best {args.scoring}: {result['best_score']:.4f} with {result['best_params']}")
+    print(f"✓ Saved: {args.output}")
+
+    if args.compare_exhaustive:
+        print(f"\nExhaustive grid at {args.max_trees} trees:")
+        exhaustive = successive_halving(X_train, y_train, grid, args.folds, args.scoring, args.max_trees,
+                                        args.max_trees, args.eta, args.workers)
+        print(f"✓ Exhaustive search: {exhaustive['seconds']:.1f}s, best {args.scoring} "
+              f"{exhaustive['best_score']:.4f} with {exhaustive['best_params']}")
+        print(f"✓ Successive halving took {result['seconds'] / exhaustive['seconds']:.0%} of the exhaustive time")
+
+    if args.train_best:
+        from task3_predictive_analytics import run_pipeline
+
+        run_pipeline(make_plots=False, model_params=result['best_params'])
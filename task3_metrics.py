@@ -0,0 +1,292 @@
+"""
+Task 3: Single-Pass Binary Classification Metrics
+==================================================
+Computes every metric task3 reports (accuracy, precision, recall, F1, the
+classification report, confusion matrix, ROC curve and ROC AUC) from two
+small sufficient statistics instead of one sklearn call per metric:
+
+    - the 2x2 confusion matrix, from one bincount over the labels
+    - a score table: each distinct predicted probability with its
+      positive and negative counts
+
+Sorting the score table by descending probability and taking cumulative
+sums gives the true/false positive counts at every threshold, i.e. the
+ROC curve. Both statistics add across chunks, so a large scored file is
+evaluated in one streaming pass, and partial results from several workers
+can be merged. The score table holds one row per distinct probability,
+at most one per input row; forest probabilities are averages of leaf
+fractions and repeat, so it is typically smaller than the input.
+
+Results match sklearn's, with zero_division treated as 0 and pos_label=1.
+
+Example:
+    python task3_metrics.py task3_scored.csv --label-column target
+"""
+
+import numpy as np
+
+
+class BinaryMetrics:
+    """
+    Mergeable confusion matrix and score table for labels in {0, 1}.
+    """
+
+    def __init__(self):
+        self.confusion = np.zeros((2, 2), dtype=np.int64)
+        self.scores = np.empty(0)
+        self.positives = np.empty(0, dtype=np.int64)
+        self.negatives = np.empty(0, dtype=np.int64)
+
+    def update(self, y_true, y_pred=None, y_score=None, threshold=0.5):
+        """
+        Fold a chunk of labels, predictions and/or scores into the statistics.
+
+        Args:
+            y_true (array-like): True labels (0 or 1)
+            y_pred (array-like): Predicted labels; derived from y_score >
+                threshold when omitted
+            y_score (array-like): Probability of class 1, for the ROC curve
+            threshold (float): Decision threshold used when y_pred is omitted
+
+        Returns:
+            BinaryMetrics: self
+
+        Raises:
+            ValueError: On labels outside {0, 1} or mismatched lengths
+        """
+        y_true = _as_labels(y_true, 'y_true')
+        if y_score is not None:
+            y_score = np.asarray(y_score, dtype=np.float64).ravel()
+            if len(y_score) != len(y_true):
+                raise ValueError("y_score and y_true have different lengths")
+        if y_pred is None:
+            if y_score is None:
+                raise ValueError("Either y_pred or y_score is required")
+            y_pred = (y_score > threshold).astype(np.int64)
+        y_pred = _as_labels(y_pred, 'y_pred')
+        if len(y_pred) != len(y_true):
+            raise ValueError("y_pred and y_true have different lengths")
+
+        self.confusion += np.bincount(2 * y_true + y_pred, minlength=4).reshape(2, 2)
+        if y_score is not None:
+            scores, inverse = np.unique(y_score, return_inverse=True)
+            positives = np.bincount(inverse, weights=y_true, minlength=len(scores)).astype(np.int64)
+            counts = np.bincount(inverse, minlength=len(scores))
+            self._merge_table(scores, positives, counts - positives)
+        return self
+
+    def _merge_table(self, scores, positives, negatives):
+        if len(self.scores) == 0:
+            self.scores, self.positives, self.negatives = scores, positives, negatives
+            return
+        merged, inverse = np.unique(np.concatenate([self.scores, scores]), return_inverse=True)
+        self.positives = np.bincount(inverse, weights=np.concatenate([self.positives, positives]),
+                                     minlength=len(merged)).astype(np.int64)
+        self.negatives = np.bincount(inverse, weights=np.concatenate([self.negatives, negatives]),
+                                     minlength=len(merged)).astype(np.int64)
+        self.scores = merged
+
+    def merge(self, other):
+        """
+        Add another BinaryMetrics (e.g. from a different chunk or worker).
+
+        Returns:
+            BinaryMetrics: self
+        """
+        self.confusion += other.confusion
+        if len(other.scores):
+            self._merge_table(other.scores, other.positives, other.negatives)
+        return self
+
+    @property
+    def count(self):
+        return int(self.confusion.sum())
+
+    def confusion_matrix(self):
+        """Counts with true labels as rows and predictions as columns, like sklearn."""
+        return self.confusion.copy()
+
+    def _per_class(self):
+        """Precision, recall, F1 and support of class 0 and class 1."""
+        true_positive = np.diag(self.confusion).astype(np.float64)
+        support = self.confusion.sum(axis=1)
+        predicted = self.confusion.sum(axis=0)
+        precision = _divide(true_positive, predicted)
+        recall = _divide(true_positive, support)
+        f1 = _divide(2 * true_positive, support + predicted)
+        return precision, recall, f1, support
+
+    def accuracy(self):
+        return _divide(np.trace(self.confusion), self.count)
+
+    def precision(self):
+        return self._per_class()[0][1]
+
+    def recall(self):
+        return self._per_class()[1][1]
+
+    def f1(self):
+        return self._per_class()[2][1]
+
+    def classification_report(self, target_names=None, digits=2):
+        """
+        Text report laid out exactly like sklearn's classification_report.
+
+        Args:
+            target_names (list): Display names of class 0 and class 1
+            digits (int): Decimal places
+        """
+        target_names = list(target_names) if target_names is not None else ['0', '1']
+        precision, recall, f1, support = self._per_class()
+        total = int(support.sum())
+
+        headers = ["precision", "recall", "f1-score", "support"]
+        width = max(max(len(name) for name in target_names), len("weighted avg"), digits)
+        report = ("{:>{width}s} " + " {:>9}" * len(headers)).format("", *headers, width=width)
+        report += "\n\n"
+        row_fmt = "{:>{width}s} " + " {:>9.{digits}f}" * 3 + " {:>9}\n"
+        for row in zip(target_names, precision, recall, f1, support):
+            report += row_fmt.format(*row, width=width, digits=digits)
+        report += "\n"
+
+        accuracy_fmt = "{:>{width}s} " + " {:>9.{digits}}" * 2 + " {:>9.{digits}f}" + " {:>9}\n"
+        report += accuracy_fmt.format("accuracy", "", "", self.accuracy(), total, width=width, digits=digits)
+        report += row_fmt.format("macro avg", precision.mean(), recall.mean(), f1.mean(), total,
+                                 width=width, digits=digits)
+        weights = support if total else None
+        report += row_fmt.format("weighted avg", *(np.average(values, weights=weights)
+                                                   for values in (precision, recall, f1)), total,
+                                 width=width, digits=digits)
+        return report
+
+    def roc_curve(self, drop_intermediate=True):
+        """
+        ROC curve from the score table, as sklearn.metrics.roc_curve.
+
+        Returns:
+            tuple: (fpr, tpr, thresholds); thresholds start at +inf
+        """
+        if len(self.scores) == 0:
+            raise ValueError("No scores were given; pass y_score to update()")
+        # Descending probability: cumulative counts are the positives at each threshold
+        thresholds = self.scores[::-1]
+        tps = np.cumsum(self.positives[::-1]).astype(np.float64)
+        fps = np.cumsum(self.negatives[::-1]).astype(np.float64)
+
+        if drop_intermediate and len(fps) > 2:
+            # Keep only corners; collinear points do not change the curve or its area
+            corners = np.where(np.r_[True, np.logical_or(np.diff(fps, 2), np.diff(tps, 2)), True])[0]
+            fps, tps, thresholds = fps[corners], tps[corners], thresholds[corners]
+
+        tps = np.r_[0.0, tps]
+        fps = np.r_[0.0, fps]
+        thresholds = np.r_[np.inf, thresholds]
+        fpr = fps / fps[-1] if fps[-1] > 0 else np.full(fps.shape, np.nan)
+        tpr = tps / tps[-1] if tps[-1] > 0 else np.full(tps.shape, np.nan)
+        return fpr, tpr, thresholds
+
+    def roc_auc(self):
+        """
+        Area under the ROC curve.
+
+        Raises:
+            ValueError: If only one class is present, as sklearn does
+        """
+        if not (self.positives.sum() and self.negatives.sum()):
+            raise ValueError("Only one class present in y_true. ROC AUC score is not defined in that case.")
+        fpr, tpr, _ = self.roc_curve()
+        # Trapezoid rule written out: np.trapezoid needs numpy >= 2.0 and recent 2.x releases drop np.trapz
+        return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2.0))
+
+    def summary(self, target_names=None, digits=4):
+        """
+        Every metric at once.
+
+        Returns:
+            dict: 'accuracy', 'precision', 'recall', 'f1', 'classification_report',
+                'confusion_matrix', and with scores 'roc_auc', 'fpr', 'tpr', 'thresholds'
+        """
+        result = {
+            'accuracy': self.accuracy(),
+            'precision': self.precision(),
+            'recall': self.recall(),
+            'f1': self.f1(),
+            'classification_report': self.classification_report(target_names, digits),
+            'confusion_matrix': self.confusion_matrix(),
+        }
+        if len(self.scores):
+            result['fpr'], result['tpr'], result['thresholds'] = self.roc_curve()
+            result['roc_auc'] = self.roc_auc()
+        return result
+
+
+def _as_labels(values, name):
+    values = np.asarray(values).ravel()
+    labels = values.astype(np.int64)
+    if len(labels) and (labels.min() < 0 or labels.max() > 1 or not np.array_equal(labels, values)):
+        raise ValueError(f"{name} must contain only the labels 0 and 1")
+    return labels
+
+
+def _divide(numerator, denominator):
+    """Elementwise division returning 0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = np.where(denominator > 0, numerator / np.where(denominator > 0, denominator, 1), 0.0)
+    return result if result.ndim else float(result)
+
+
+def evaluate_scored_file(path, label_column='target', prediction_column=None, score_column=None,
+                         chunksize=None):
+    """
+    Evaluate a CSV/Parquet file of scored rows in one streaming pass.
+
+    Args:
+        path (str): Output of task3_model_artifact.score_file with a label column added
+        label_column (str): True labels (0 or 1)
+        prediction_column (str): Predicted labels (PREDICTION_COLUMN by default)
+        score_column (str): Probability of class 1 (PROBABILITY_COLUMN by default)
+        chunksize (int): Rows per chunk
+
+    Returns:
+        BinaryMetrics: Statistics over the whole file
+    """
+    from task3_model_artifact import (
+        DEFAULT_CHUNKSIZE, PREDICTION_COLUMN, PROBABILITY_COLUMN, iter_feature_chunks
+    )
+
+    prediction_column = prediction_column or PREDICTION_COLUMN
+    score_column = score_column or PROBABILITY_COLUMN
+    metrics = BinaryMetrics()
+    for chunk in iter_feature_chunks(path, chunksize or DEFAULT_CHUNKSIZE):
+        if label_column not in chunk.columns:
+            raise ValueError(f"{path} has no '{label_column}' column")
+        y_pred = chunk[prediction_column].to_numpy() if prediction_column in chunk.columns else None
+        y_score = chunk[score_column].to_numpy() if score_column in chunk.columns else None
+        metrics.update(chunk[label_column].to_numpy(), y_pred, y_score)
+    return metrics
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Evaluate a scored CSV/Parquet file in one pass")
+    parser.add_argument('input')
+    parser.add_argument('--label-column', default='target')
+    parser.add_argument('--chunksize', type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = evaluate_scored_file(args.input, args.label_column, chunksize=args.chunksize)
+    seconds = time.perf_counter() - start
+    summary = result.summary(['Malignant', 'Benign'])
+    print(f"✓ Evaluated {result.count} rows in {seconds:.2f}s ({len(result.scores)} distinct scores)")
+    print(f"  Accuracy:  {summary['accuracy']:.4f}")
+    print(f"  Precision: {summary['precision']:.4f}")
+    print(f"  Recall:    {summary['recall']:.4f}")
+    print(f"  F1-score:  {summary['f1']:.4f}")
+    if 'roc_auc' in summary:
+        print(f"  ROC AUC:   {summary['roc_auc']:.4f}")
+    print("\n" + summary['classification_report'])
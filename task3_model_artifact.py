@@ -0,0 +1,333 @@
+"""
+Task 3: Persisted Model Artifact and Batch Scoring
+===================================================
+Saves the fitted StandardScaler and RandomForestClassifier from the task3
+pipeline as one versioned joblib file, loads it lazily on first use, and
+scores large CSV or Parquet files of the 30 load_breast_cancer feature
+columns in vectorized chunks.
+
+Example:
+    python task3_model_artifact.py train
+    python task3_model_artifact.py score patients.csv --output scored.csv --chunksize 100000
+"""
+
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+
+MODEL_FILE = 'task3_model.joblib'
+
+# Bumped whenever the artifact layout changes
+ARTIFACT_FORMAT = 1
+
+DEFAULT_CHUNKSIZE = 50000
+
+# Inference engines for LazyModel
+ENGINE_SKLEARN = 'sklearn'
+ENGINE_FLAT = 'flat'
+
+PREDICTION_COLUMN = 'prediction'
+PROBABILITY_COLUMN = 'probability_benign'
+
+
+def model_version(scaler, model):
+    """
+    Content hash identifying a fitted scaler + forest.
+
+    Tree node arrays are hashed field by field: their structured dtype has
+    padding bytes that are left uninitialised by fitting, so hashing the raw
+    objects gives a freshly trained forest and its reloaded copy different
+    versions.
+    """
+    import joblib
+
+    digest = hashlib.sha1(joblib.hash([scaler, model.get_params(), model.classes_], hash_name='sha1').encode())
+    for estimator in getattr(model, 'estimators_', [model]):
+        state = estimator.tree_.__getstate__()
+        nodes = state['nodes']
+        packed = np.dtype([(name, nodes.dtype.fields[name][0]) for name in nodes.dtype.names])
+        digest.update(nodes.astype(packed).tobytes())
+        digest.update(np.ascontiguousarray(state['values']).tobytes())
+    return digest.hexdigest()[:12]
+
+
+def save_model_artifact(scaler, model, feature_names, path=MODEL_FILE, metrics=None):
+    """
+    Write scaler and forest to one versioned artifact file.
+
+    The file is stored uncompressed so the scaler's arrays can be memory-mapped
+    on load. The forest's tree arrays are copied whenever sklearn unpickles its
+    Tree objects, so every loading process holds its own copy of the trees.
+
+    Args:
+        scaler (StandardScaler): Fitted scaler
+        model (RandomForestClassifier): Fitted forest
+        feature_names (list): Column order the scaler was fitted on
+        path (str): Destination file
+        metrics (dict): Optional headline metrics stored with the model
+
+    Returns:
+        dict: The artifact metadata (includes the content-derived model_version)
+    """
+    import joblib
+    import sklearn
+
+    payload = {'scaler': scaler, 'model': model}
+    metadata = {
+        'format': ARTIFACT_FORMAT,
+        'model_version': model_version(scaler, model),
+        'created': datetime.now().isoformat(),
+        'sklearn_version': sklearn.__version__,
+        'feature_names': list(feature_names),
+        'classes': [int(label) for label in model.classes_],
+        'metrics': {key: float(value) for key, value in (metrics or {}).items()},
+    }
+
+    temp_path = path + '.tmp'
+    joblib.dump({'metadata': metadata, **payload}, temp_path)
+    os.replace(temp_path, path)
+    return metadata
+
+
+def load_model_artifact(path=MODEL_FILE, mmap=True):
+    """
+    Load an artifact written by save_model_artifact.
+
+    Args:
+        path (str): Artifact file
+        mmap (bool): Memory-map the scaler's arrays read-only (the tree arrays
+            are always copied into memory)
+
+    Returns:
+        dict: 'metadata', 'scaler' and 'model'
+
+    Raises:
+        ValueError: If the file is not a task3 artifact of a supported format
+    """
+    import joblib
+
+    artifact = joblib.load(path, mmap_mode='r' if mmap else None)
+    metadata = artifact.get('metadata', {}) if isinstance(artifact, dict) else {}
+    if metadata.get('format') != ARTIFACT_FORMAT:
+        raise ValueError(f"{path} is not a task3 model artifact (format {ARTIFACT_FORMAT})")
+    return artifact
+
+
+class LazyModel:
+    """
+    Scaler + forest loaded from an artifact on first use.
+    """
+
+    def __init__(self, path=MODEL_FILE, mmap=True, n_jobs=None, engine=ENGINE_SKLEARN):
+        """
+        Args:
+            path (str): Artifact file
+            mmap (bool): Memory-map the scaler's arrays (see load_model_artifact)
+            n_jobs (int): Override the forest's n_jobs after loading; 1 avoids
+                thread start-up cost on small online batches
+            engine (str): ENGINE_SKLEARN, or ENGINE_FLAT to score through
+                task3_flat_forest's array traversal (faster on small batches)
+        """
+        if engine not in (ENGINE_SKLEARN, ENGINE_FLAT):
+            raise ValueError(f"Unknown inference engine: {engine}")
+        self.path = path
+        self.mmap = mmap
+        self.n_jobs = n_jobs
+        self.engine = engine
+        self.load_seconds = None
+        self._artifact = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._artifact is None:
+            with self._lock:
+                if self._artifact is None:
+                    start = time.perf_counter()
+                    artifact = load_model_artifact(self.path, self.mmap)
+                    if self.n_jobs is not None:
+                        artifact['model'].n_jobs = self.n_jobs
+                    if self.engine == ENGINE_FLAT:
+                        from task3_flat_forest import export_forest
+                        artifact['flat_forest'] = export_forest(artifact['model'])
+                    self._artifact = artifact
+                    self.load_seconds = time.perf_counter() - start
+        return self._artifact
+
+    @property
+    def metadata(self):
+        return self._load()['metadata']
+
+    @property
+    def feature_names(self):
+        return self.metadata['feature_names']
+
+    def predict_proba(self, X):
+        """
+        Benign-class probability for each row of raw (unscaled) features.
+
+        Args:
+            X (array-like): 2-D array with columns in feature_names order
+
+        Returns:
+            ndarray: Probability of class 1 (Benign) per row
+        """
+        artifact = self._load()
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        # Skip the scaler's feature-name check: columns are ordered by the caller
+        scaled = (X - artifact['scaler'].mean_) / artifact['scaler'].scale_
+        if self.engine == ENGINE_FLAT:
+            return artifact['flat_forest'].predict_proba(scaled)[:, 1]
+        return artifact['model'].predict_proba(scaled)[:, 1]
+
+    def predict(self, X, threshold=0.5):
+        """Class labels (0 = Malignant, 1 = Benign) for raw feature rows."""
+        return (self.predict_proba(X) > threshold).astype(np.int64)
+
+
+def _feature_matrix(frame, feature_names):
+    """Pull the model's feature columns out of a chunk, in training order."""
+    missing = [name for name in feature_names if name not in frame.columns]
+    if missing:
+        raise ValueError(f"Input is missing {len(missing)} feature column(s): {', '.join(missing[:5])}")
+    return frame[feature_names].to_numpy(dtype=np.float64, copy=False)
+
+
+def iter_feature_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Read a CSV or Parquet file as DataFrame chunks.
+
+    Parquet support needs pyarrow, imported only when a Parquet file is read.
+
+    Yields:
+        DataFrame: Up to chunksize rows
+    """
+    import pandas as pd
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        yield from pd.read_csv(path, chunksize=chunksize)
+    elif extension in ('.parquet', '.pq'):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet needs pyarrow: pip install pyarrow")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported input format: {path}")
+
+
+class _ChunkWriter:
+    """Appends scored chunks to a CSV or Parquet file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.parquet = os.path.splitext(path)[1].lower() in ('.parquet', '.pq')
+        self._writer = None
+        self._first = True
+
+    def write(self, frame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode='w' if self._first else 'a', header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def score_file(input_path, output_path, model=None, chunksize=DEFAULT_CHUNKSIZE, threshold=0.5,
+               keep_features=False):
+    """
+    Score a CSV/Parquet file chunk by chunk and write predictions.
+
+    Each chunk is scaled and scored with one vectorized predict_proba call.
+    Columns other than the 30 features (e.g. an id) are passed through.
+
+    Args:
+        input_path (str): CSV or Parquet file with the feature columns
+        output_path (str): CSV or Parquet file for the results
+        model (LazyModel): Model to score with; defaults to MODEL_FILE
+        chunksize (int): Rows per chunk; bounds memory use
+        threshold (float): Probability above which a row is Benign
+        keep_features (bool): Copy the feature columns to the output too
+
+    Returns:
+        dict: 'rows', 'chunks', 'seconds' and 'rows_per_second'
+    """
+    model = model or LazyModel()
+    feature_names = model.feature_names
+    writer = _ChunkWriter(output_path)
+    rows = chunks = 0
+    start = time.perf_counter()
+
+    try:
+        for chunk in iter_feature_chunks(input_path, chunksize):
+            probabilities = model.predict_proba(_feature_matrix(chunk, feature_names))
+            output = chunk if keep_features else chunk.drop(columns=feature_names)
+            output = output.assign(**{PREDICTION_COLUMN: (probabilities > threshold).astype(np.int64),
+                                      PROBABILITY_COLUMN: probabilities})
+            writer.write(output)
+            rows += len(chunk)
+            chunks += 1
+    finally:
+        writer.close()
+
+    seconds = time.perf_counter() - start
+    return {'rows': rows, 'chunks': chunks, 'seconds': round(seconds, 3),
+            'rows_per_second': round(rows / seconds, 1) if seconds > 0 else None}
+
+
+def artifact_checksum(path=MODEL_FILE):
+    """SHA-1 of the artifact file, for pinning a deployed model."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Train once, score many: task3 model artifact tools")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    train_parser = commands.add_parser('train', help="Run the pipeline (without plots) and save the artifact")
+    train_parser.add_argument('--model', default=MODEL_FILE)
+
+    score_parser = commands.add_parser('score', help="Score a CSV/Parquet file of the 30 feature columns")
+    score_parser.add_argument('input')
+    score_parser.add_argument('--output', default='task3_scored.csv')
+    score_parser.add_argument('--model', default=MODEL_FILE)
+    score_parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    score_parser.add_argument('--threshold', type=float, default=0.5)
+    score_parser.add_argument('--keep-features', action='store_true')
+    args = parser.parse_args()
+
+    if args.command == 'train':
+        from task3_predictive_analytics import run_pipeline
+
+        run_pipeline(make_plots=False, model_path=args.model)
+    else:
+        lazy_model = LazyModel(args.model)
+        stats = score_file(args.input, args.output, lazy_model, args.chunksize, args.threshold,
+                           args.keep_features)
+        print(f"✓ Model {lazy_model.metadata['model_version']} loaded in {lazy_model.load_seconds:.3f}s")
+        print(f"✓ Scored {stats['rows']} rows in {stats['chunks']} chunk(s), {stats['seconds']:.2f}s "
+              f"({stats['rows_per_second']} rows/s)")
+        print(f"✓ Saved: {args.output}")
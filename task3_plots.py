@@ -0,0 +1,233 @@
+"""
+Task 3: Figure Rendering
+=========================
+The five task3 figures, drawn with matplotlib's object-oriented API (one
+Figure per call, no global pyplot state) so they can be rendered
+concurrently in worker processes.
+
+PlotRenderer queues figures as their inputs become available and renders
+them in a process pool while the pipeline continues. A figure is skipped
+when its PNG exists and the hash of its inputs, drawing code and DPI
+matches the one recorded when the PNG was last written. matplotlib and
+seaborn are imported only when a figure is drawn, so a run without plots
+never loads them.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from task3_stage_cache import fingerprint
+
+
+CLASS_NAMES = ['Malignant', 'Benign']
+
+FULL_DPI = 300
+PREVIEW_DPI = 72
+
+
+def configure_plot_style():
+    """Set style for plots."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.style.use('default')
+    sns.set_palette("husl")
+
+
+def _new_figure(figsize):
+    from matplotlib.figure import Figure
+    return Figure(figsize=figsize)
+
+
+def _save(figure, path, dpi):
+    figure.tight_layout()
+    figure.savefig(path, dpi=dpi, bbox_inches='tight')
+    return path
+
+
+def plot_target_distribution(y, path='task3_target_distribution.png', dpi=FULL_DPI):
+    """Bar and pie chart of the target classes."""
+    figure = _new_figure((12, 5))
+    bar_axes, pie_axes = figure.subplots(1, 2)
+
+    y.value_counts().sort_index().plot(kind='bar', color=['lightcoral', 'lightgreen'], ax=bar_axes)
+    bar_axes.set_title('Target Distribution', fontsize=14, fontweight='bold')
+    bar_axes.set_xlabel('Target Class', fontsize=12)
+    bar_axes.set_ylabel('Count', fontsize=12)
+    bar_axes.set_xticks([0, 1], CLASS_NAMES, rotation=0)
+    bar_axes.grid(axis='y', alpha=0.3)
+
+    y.value_counts().plot(kind='pie', autopct='%1.1f%%',
+                          colors=['lightcoral', 'lightgreen'],
+                          labels=CLASS_NAMES, ax=pie_axes)
+    pie_axes.set_title('Target Distribution Percentage', fontsize=14, fontweight='bold')
+    pie_axes.set_ylabel('')
+    return _save(figure, path, dpi)
+
+
+def plot_correlation_heatmap(correlation_matrix, path='task3_correlation_heatmap.png', dpi=FULL_DPI):
+    """Heatmap of the first 20x20 block of the feature correlation matrix."""
+    import seaborn as sns
+
+    figure = _new_figure((14, 12))
+    axes = figure.subplots()
+    # Use iloc to slice pandas DataFrame correctly
+    sns.heatmap(correlation_matrix.iloc[:20, :20], annot=False, cmap='coolwarm', center=0,
+                square=True, linewidths=0.5, ax=axes)
+    axes.set_title('Feature Correlation Matrix (Top 20x20)', fontsize=14, fontweight='bold')
+    return _save(figure, path, dpi)
+
+
+def plot_confusion_matrix(cm, path='task3_confusion_matrix.png', dpi=FULL_DPI):
+    """Annotated confusion matrix heatmap."""
+    import seaborn as sns
+
+    figure = _new_figure((8, 6))
+    axes = figure.subplots()
+    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues',
+                xticklabels=CLASS_NAMES,
+                yticklabels=CLASS_NAMES,
+                cbar_kws={'label': 'Count'}, ax=axes)
+    axes.set_title('Confusion Matrix', fontsize=14, fontweight='bold')
+    axes.set_ylabel('True Label', fontsize=12)
+    axes.set_xlabel('Predicted Label', fontsize=12)
+    return _save(figure, path, dpi)
+
+
+def plot_feature_importance(feature_importance, path='task3_feature_importance.png', dpi=FULL_DPI):
+    """Horizontal bar chart of the 15 most important features."""
+    figure = _new_figure((12, 8))
+    axes = figure.subplots()
+    top_features = feature_importance.head(15)
+    axes.barh(range(len(top_features)), top_features['importance'], color='steelblue')
+    axes.set_yticks(range(len(top_features)), top_features['feature'])
+    axes.set_xlabel('Importance Score', fontsize=12)
+    axes.set_title('Top 15 Most Important Features', fontsize=14, fontweight='bold')
+    axes.invert_yaxis()
+    axes.grid(axis='x', alpha=0.3)
+    return _save(figure, path, dpi)
+
+
+def plot_roc_curve(fpr, tpr, roc_auc, path='task3_roc_curve.png', dpi=FULL_DPI):
+    """ROC curve against the random-classifier diagonal."""
+    figure = _new_figure((9, 7))
+    axes = figure.subplots()
+    axes.plot(fpr, tpr, linewidth=2, label=f'Random Forest (AUC = {roc_auc:.4f})')
+    axes.plot([0, 1], [0, 1], 'k--', linewidth=1, label='Random Classifier')
+    axes.set_xlabel('False Positive Rate', fontsize=12)
+    axes.set_ylabel('True Positive Rate', fontsize=12)
+    axes.set_title('ROC Curve - Breast Cancer Classification', fontsize=14, fontweight='bold')
+    axes.legend(loc='lower right', fontsize=11)
+    axes.grid(True, alpha=0.3)
+    return _save(figure, path, dpi)
+
+
+def _render(plot, args, path, dpi):
+    """Draw one figure (runs in a worker process)."""
+    start = time.perf_counter()
+    plot(*args, path=path, dpi=dpi)
+    return time.perf_counter() - start
+
+
+def _figure_key(plot, args, dpi):
+    """Hash of a figure's drawing code, inputs and resolution."""
+    try:
+        source = inspect.getsource(plot)
+    except (OSError, TypeError):
+        source = plot.__qualname__
+    return fingerprint([hashlib.sha1(source.encode('utf-8')).hexdigest(), fingerprint(list(args)), dpi])
+
+
+class PlotRenderer:
+    """
+    Renders figures in a process pool, skipping ones whose inputs are unchanged.
+    """
+
+    def __init__(self, dpi=FULL_DPI, workers=None, manifest_path=None, enabled=True):
+        """
+        Args:
+            dpi (int): Resolution of every figure (FULL_DPI, or PREVIEW_DPI for drafts)
+            workers (int): Worker processes (os.cpu_count() by default); 0 or 1
+                renders in this process, avoiding the pool's start-up cost
+            manifest_path (str): JSON file recording each PNG's input hash;
+                None re-renders every figure
+            enabled (bool): False makes submit() a no-op
+        """
+        self.dpi = dpi
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.manifest_path = manifest_path
+        self.enabled = enabled
+        self.manifest = {}
+        if manifest_path and os.path.exists(manifest_path):
+            try:
+                with open(manifest_path) as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError):
+                self.manifest = {}
+        self._executor = None
+        self._styled = False
+        self._pending = []
+        self._results = []
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 initializer=configure_plot_style)
+        return self._executor
+
+    def submit(self, plot, args, path):
+        """
+        Queue a figure, unless its PNG is already up to date.
+
+        Args:
+            plot (callable): One of the plot_* functions
+            args (tuple): Positional inputs of the figure
+            path (str): Output PNG
+        """
+        if not self.enabled:
+            return
+        key = _figure_key(plot, args, self.dpi)
+        if self.manifest_path and self.manifest.get(path) == key and os.path.exists(path):
+            self._results.append({'path': path, 'rendered': False, 'seconds': 0.0})
+            return
+        if self.workers <= 1:
+            if not self._styled:
+                configure_plot_style()
+                self._styled = True
+            seconds = _render(plot, args, path, self.dpi)
+            self._record(path, key, seconds)
+        else:
+            self._pending.append((path, key, self._pool().submit(_render, plot, args, path, self.dpi)))
+
+    def _record(self, path, key, seconds):
+        self.manifest[path] = key
+        self._results.append({'path': path, 'rendered': True, 'seconds': seconds})
+
+    def finish(self):
+        """
+        Wait for queued figures and save the manifest.
+
+        Returns:
+            list: One dict per submitted figure with 'path', 'rendered' and 'seconds'
+        """
+        try:
+            for path, key, future in self._pending:
+                self._record(path, key, future.result())
+        finally:
+            self._pending = []
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+        if self.manifest_path and self._results:
+            temp_path = self.manifest_path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(self.manifest, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.manifest_path)
+        results, self._results = self._results, []
+        return results
@@ -0,0 +1,389 @@
+"""
+Task 3: Online Prediction Server with Dynamic Micro-Batching
+=============================================================
+A local HTTP service around the persisted task3 scaler+forest artifact.
+
+Requests that arrive within a short window are coalesced into a single
+vectorized predict_proba call, so concurrent single-row traffic pays the
+forest's per-call overhead once per batch instead of once per row. The
+model is loaded and exercised at startup so the first request is not slow.
+
+Endpoints:
+    POST /predict   {"instances": [[30 floats], ...]} or [{feature: value}, ...]
+                    -> {"probabilities": [...], "predictions": [...], "model_version": ...}
+    GET  /metrics   latency percentiles, throughput and batch-size counters
+    GET  /health    {"status": "ok", "model_version": ...}
+
+Example:
+    python task3_prediction_server.py --port 8100 --max-batch 128 --max-wait-ms 2
+    python task3_prediction_server.py --benchmark --requests 4000 --clients 32
+"""
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from task3_model_artifact import ENGINE_FLAT, ENGINE_SKLEARN, MODEL_FILE, LazyModel
+
+
+DEFAULT_MAX_BATCH = 128
+DEFAULT_MAX_WAIT_MS = 2.0
+
+# Latency samples kept for percentiles
+LATENCY_WINDOW = 10000
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Collects prediction requests from many threads and scores them together.
+    """
+
+    def __init__(self, model, max_batch=DEFAULT_MAX_BATCH, max_wait_ms=DEFAULT_MAX_WAIT_MS):
+        """
+        Args:
+            model (LazyModel): Model exposing predict_proba(X)
+            max_batch (int): Rows per predict_proba call at most
+            max_wait_ms (float): How long the first queued request waits for
+                company before its batch is scored anyway
+        """
+        self.model = model
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._batch_sizes = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+        self.started = time.monotonic()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def submit(self, X):
+        """
+        Queue rows for scoring.
+
+        Args:
+            X (ndarray): 2-D array of raw feature rows
+
+        Returns:
+            Future: Resolves to the benign-class probabilities for X
+        """
+        future = Future()
+        self._queue.put((X, future, time.perf_counter()))
+        return future
+
+    def predict_proba(self, X, timeout=None):
+        """Blocking convenience wrapper around submit()."""
+        return self.submit(X).result(timeout)
+
+    def _collect(self):
+        """Block for one request, then gather more until the batch is full or the window closes."""
+        first = self._queue.get()
+        if first is _STOP:
+            return None
+        batch, rows = [first], len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            try:
+                X = batch[0][0] if len(batch) == 1 else np.vstack([item[0] for item in batch])
+                probabilities = self.model.predict_proba(X)
+            except Exception as e:
+                with self._stats_lock:
+                    self.errors += len(batch)
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            done = time.perf_counter()
+            offset = 0
+            for rows, future, _ in batch:
+                future.set_result(probabilities[offset:offset + len(rows)])
+                offset += len(rows)
+
+            with self._stats_lock:
+                self.batches += 1
+                self.requests += len(batch)
+                self.rows += len(X)
+                self._batch_sizes.append(len(X))
+                self._latencies.extend(done - submitted for _, _, submitted in batch)
+
+    def stats(self):
+        """Counters and latency percentiles (milliseconds) since startup."""
+        with self._stats_lock:
+            latencies = np.array(self._latencies) * 1000
+            batch_sizes = np.array(self._batch_sizes)
+            elapsed = time.monotonic() - self.started
+            report = {
+                'requests': self.requests,
+                'rows': self.rows,
+                'batches': self.batches,
+                'errors': self.errors,
+                'uptime_seconds': round(elapsed, 3),
+                'requests_per_second': round(self.requests / elapsed, 2) if elapsed > 0 else 0.0,
+                'mean_batch_rows': round(float(batch_sizes.mean()), 2) if len(batch_sizes) else 0.0,
+            }
+        for percent in (50, 95, 99):
+            report[f"latency_p{percent}_ms"] = round(float(np.percentile(latencies, percent)), 3) \
+                if len(latencies) else None
+        return report
+
+    def close(self):
+        """Stop the batching thread after the queued work is scored."""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+
+def parse_instances(payload, feature_names):
+    """
+    Turn a /predict request body into a feature matrix.
+
+    Args:
+        payload (dict): {"instances": rows}; a row is a list in feature
+            order or a dict keyed by feature name
+        feature_names (list): The model's feature order
+
+    Returns:
+        ndarray: 2-D float array
+
+    Raises:
+        ValueError: If the body is malformed or a row has the wrong width
+    """
+    instances = payload.get('instances') if isinstance(payload, dict) else None
+    if not instances or not isinstance(instances, list):
+        raise ValueError('Body must be {"instances": [...]} with at least one row')
+    if isinstance(instances[0], dict):
+        missing = [name for name in feature_names if name not in instances[0]]
+        if missing:
+            raise ValueError(f"Missing feature(s): {', '.join(missing[:5])}")
+        try:
+            rows = [[row[name] for name in feature_names] for row in instances]
+        except (KeyError, TypeError):
+            raise ValueError("Every instance must be an object with all feature names")
+    else:
+        rows = instances
+    try:
+        X = np.asarray(rows, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("Instances must be numeric rows of equal length")
+    if X.ndim != 2 or X.shape[1] != len(feature_names):
+        raise ValueError(f"Each row needs {len(feature_names)} features")
+    return X
+
+
+class _PredictionRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, status, document):
+        payload = json.dumps(document).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n")
+        # One write per response to avoid Nagle/delayed-ACK stalls
+        self.wfile.write(head.encode('latin-1') + payload)
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._respond(200, {'status': 'ok', 'model_version': self.server.model_version})
+        elif self.path == '/metrics':
+            self._respond(200, self.server.batcher.stats())
+        else:
+            self._respond(404, {'error': 'not found'})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        if self.path != '/predict':
+            self._respond(404, {'error': 'not found'})
+            return
+        try:
+            X = parse_instances(json.loads(body or b'null'), self.server.feature_names)
+        except ValueError as e:
+            self._respond(400, {'error': str(e)})
+            return
+        try:
+            probabilities = self.server.batcher.predict_proba(X, timeout=self.server.request_timeout)
+        except Exception as e:
+            self._respond(500, {'error': str(e)})
+            return
+        self._respond(200, {
+            'probabilities': probabilities.tolist(),
+            'predictions': (probabilities > 0.5).astype(int).tolist(),
+            'model_version': self.server.model_version,
+        })
+
+
+class PredictionServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP front end feeding one MicroBatcher.
+    """
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, host='127.0.0.1', port=8100, model=None, max_batch=DEFAULT_MAX_BATCH,
+                 max_wait_ms=DEFAULT_MAX_WAIT_MS, request_timeout=10.0):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free one)
+            model (LazyModel): Model to serve; defaults to MODEL_FILE with n_jobs=1
+            max_batch (int): Rows per batched predict_proba call
+            max_wait_ms (float): Batching window
+            request_timeout (float): Seconds a request waits for its batch
+        """
+        super().__init__((host, port), _PredictionRequestHandler)
+        # Small batches are faster single-threaded than with joblib's worker start-up
+        self.model = model or LazyModel(MODEL_FILE, n_jobs=1)
+        self.request_timeout = request_timeout
+        self.warmup_seconds = self.warm_up()
+        self.feature_names = self.model.feature_names
+        self.model_version = self.model.metadata['model_version']
+        self.batcher = MicroBatcher(self.model, max_batch, max_wait_ms)
+        self._thread = None
+
+    def warm_up(self):
+        """Load the artifact and run one prediction so the first request is fast."""
+        start = time.perf_counter()
+        scaler = self.model._load()['scaler']
+        self.model.predict_proba(np.asarray(scaler.mean_).reshape(1, -1))
+        return time.perf_counter() - start
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving, drain the batcher and release the socket."""
+        self.shutdown()
+        self.batcher.close()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def run_load_test(url, rows, requests=2000, clients=32):
+    """
+    Fire single-row /predict requests from concurrent keep-alive clients.
+
+    Args:
+        url (str): Server base URL
+        rows (ndarray): Feature rows to cycle through
+        requests (int): Total requests
+        clients (int): Concurrent client threads
+
+    Returns:
+        dict: 'requests', 'seconds' and 'requests_per_second'
+    """
+    import http.client
+    from urllib.parse import urlsplit
+
+    address = urlsplit(url)
+    counter = iter(range(requests))
+    counter_lock = threading.Lock()
+
+    def client():
+        connection = http.client.HTTPConnection(address.hostname, address.port, timeout=30)
+        try:
+            while True:
+                with counter_lock:
+                    index = next(counter, None)
+                if index is None:
+                    return
+                body = json.dumps({'instances': [rows[index % len(rows)].tolist()]}).encode('utf-8')
+                connection.request('POST', '/predict', body, {'Content-Type': 'application/json'})
+                response = connection.getresponse()
+                response.read()
+        finally:
+            connection.close()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    return {'requests': requests, 'seconds': round(seconds, 3), 'requests_per_second': round(requests / seconds, 1)}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve task3 predictions over HTTP with micro-batching")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8100)
+    parser.add_argument('--model', default=MODEL_FILE)
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH)
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT_MS)
+    parser.add_argument('--engine', default=ENGINE_SKLEARN, choices=[ENGINE_SKLEARN, ENGINE_FLAT],
+                        help="flat scores through the exported flat-array forest")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Compare batched and unbatched throughput on a local server and exit")
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--clients', type=int, default=32)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        from sklearn.datasets import load_breast_cancer
+
+        feature_rows = load_breast_cancer().data
+        for label, max_batch in (('unbatched', 1), ('batched', args.max_batch)):
+            with PredictionServer(args.host, 0, LazyModel(args.model, n_jobs=1, engine=args.engine), max_batch,
+                                  args.max_wait_ms) as server:
+                result = run_load_test(server.url, feature_rows, args.requests, args.clients)
+                stats = server.batcher.stats()
+            print(f"✓ {label:<10} {result['requests_per_second']:>9.1f} req/s  "
+                  f"p50 {stats['latency_p50_ms']:.2f} ms  p99 {stats['latency_p99_ms']:.2f} ms  "
+                  f"mean batch {stats['mean_batch_rows']:.1f} rows")
+    else:
+        server = PredictionServer(args.host, args.port, LazyModel(args.model, n_jobs=1, engine=args.engine),
+                                  args.max_batch, args.max_wait_ms)
+        print(f"✓ Model {server.model_version} warmed up in {server.warmup_seconds:.3f}s")
+        print(f"✓ Serving predictions at {server.url}/predict (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.batcher.close()
+            server.server_close()
@@ -3,313 +3,522 @@ Task 3: Predictive Analytics for Resource Allocation
 =====================================================
 Breast Cancer Classification using Machine Learning
 Analyze and predict cancer classification using Random Forest algorithm
+
+The analysis is a pipeline of callable stages (load, profile, split,
+scale, train, evaluate, plot, save). Importing this module runs nothing;
+run_pipeline() executes the stages through a content-hashed on-disk cache
+(task3_stage_cache), so a rerun only recomputes stages whose input data,
+parameters or code changed.
+
+pandas and sklearn are imported inside the stages that use them, and
+matplotlib/seaborn only when a figure is drawn, so importing this module
+is cheap and a cached metrics-only run (run_metrics) never loads them.
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.datasets import load_breast_cancer
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import (
-    accuracy_score, f1_score, classification_report, 
-    confusion_matrix, precision_score, recall_score, 
-    roc_auc_score, roc_curve
-)
+import csv
+import os
 import warnings
+
+import numpy as np
 warnings.filterwarnings('ignore')
 
-# Set style for plots
-plt.style.use('default')
-sns.set_palette("husl")
+from task3_eda_stats import EDAStats
+from task3_metrics import BinaryMetrics
+from task3_model_artifact import MODEL_FILE, save_model_artifact
+from task3_plots import (
+    CLASS_NAMES, FULL_DPI, PREVIEW_DPI, PlotRenderer, plot_confusion_matrix, plot_correlation_heatmap,
+    plot_feature_importance, plot_roc_curve, plot_target_distribution
+)
+from task3_stage_cache import DEFAULT_CACHE_DIR, StageCache
+
+
+# Random Forest hyperparameters
+MODEL_PARAMS = {
+    'n_estimators': 100,      # Number of trees
+    'max_depth': 10,          # Maximum depth
+    'min_samples_split': 5,   # Minimum samples to split
+    'min_samples_leaf': 2,    # Minimum samples in leaf
+    'random_state': 42,       # For reproducibility
+    'n_jobs': -1              # Use all CPUs
+}
 
-print("="*80)
-print("TASK 3: PREDICTIVE ANALYTICS - BREAST CANCER CLASSIFICATION")
-print("="*80)
+# Train/test split settings (80/20, stratified)
+SPLIT_PARAMS = {
+    'test_size': 0.2,
+    'random_state': 42
+}
+
+METRICS_FILE = 'task3_performance_metrics.csv'
 
 
 # ============================================================================
 # 1. LOAD AND EXPLORE THE DATASET
 # ============================================================================
 
-print("\n1. Loading and exploring dataset...")
+def load_dataset():
+    """
+    Load the breast cancer dataset into a DataFrame.
+
+    Returns:
+        tuple: (df with feature columns and 'target', target_names)
+    """
+    import pandas as pd
+    from sklearn.datasets import load_breast_cancer
+
+    data = load_breast_cancer()
 
-data = load_breast_cancer()
+    # Create a DataFrame for easier manipulation
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    df['target'] = data.target
+    return df, list(data.target_names)
 
-# Create a DataFrame for easier manipulation
-df = pd.DataFrame(data.data, columns=data.feature_names)
-df['target'] = data.target
 
-print(f"Dataset Shape: {df.shape}")
-print(f"\nTarget Distribution:")
-print(df['target'].value_counts())
-print(f"\nTarget Mapping: {data.target_names}")
-print(f"  0 = Malignant (Bad)")
-print(f"  1 = Benign (Good)")
+def print_dataset_overview(df, target_names):
+    """Print shape and target distribution of the dataset."""
+    print(f"Dataset Shape: {df.shape}")
+    print(f"\nTarget Distribution:")
+    print(df['target'].value_counts())
+    print(f"\nTarget Mapping: {np.array(target_names)}")
+    print(f"  0 = Malignant (Bad)")
+    print(f"  1 = Benign (Good)")
 
 
 # ============================================================================
 # 2. DATA PREPROCESSING
 # ============================================================================
 
-print("\n2. Preprocessing data...")
+def profile_dataset(df):
+    """
+    Count missing values and duplicate rows in one pass over mergeable
+    statistics (see task3_eda_stats).
 
-# Check for missing values
-missing_values = df.isnull().sum()
-print(f"Missing Values: {missing_values.sum()}")
-print(f"Duplicate Rows: {df.duplicated().sum()}")
+    Returns:
+        dict: 'missing_values', 'duplicate_rows' and the EDAStats as 'stats'
+    """
+    stats = EDAStats.from_frame(df, count_columns=('target',))
+    summary = stats.summary()
+    return {
+        'missing_values': summary['missing_values'],
+        'duplicate_rows': summary['duplicate_rows'],
+        'stats': stats
+    }
 
-# Separate features and target
-X = df.drop('target', axis=1)
-y = df['target']
 
-print(f"Features shape: {X.shape}")
-print(f"Target shape: {y.shape}")
+def split_dataset(df, test_size=0.2, random_state=42):
+    """
+    Separate features and target and split them into training and testing sets.
 
-# Split the data into training and testing sets (80/20)
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42, stratify=y
-)
+    Returns:
+        dict: 'X_train', 'X_test', 'y_train', 'y_test'
+    """
+    from sklearn.model_selection import train_test_split
 
-print(f"\nSplit completed:")
-print(f"  Training set: {X_train.shape}")
-print(f"  Testing set:  {X_test.shape}")
+    X = df.drop('target', axis=1)
+    y = df['target']
 
-# Feature scaling
-scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train)
-X_test_scaled = scaler.transform(X_test)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=random_state, stratify=y
+    )
+    return {'X_train': X_train, 'X_test': X_test, 'y_train': y_train, 'y_test': y_test}
 
-print("✓ Features scaled successfully")
 
+def scale_features(split):
+    """
+    Fit a StandardScaler on the training features and scale both sets.
 
-# ============================================================================
-# 3. VISUALIZATIONS
-# ============================================================================
+    Returns:
+        dict: 'scaler', 'X_train_scaled', 'X_test_scaled'
+    """
+    from sklearn.preprocessing import StandardScaler
 
-print("\n3. Creating visualizations...")
-
-# Visualize target distribution
-plt.figure(figsize=(12, 5))
-
-plt.subplot(1, 2, 1)
-y.value_counts().sort_index().plot(kind='bar', color=['lightcoral', 'lightgreen'])
-plt.title('Target Distribution', fontsize=14, fontweight='bold')
-plt.xlabel('Target Class', fontsize=12)
-plt.ylabel('Count', fontsize=12)
-plt.xticks([0, 1], ['Malignant', 'Benign'], rotation=0)
-plt.grid(axis='y', alpha=0.3)
-
-plt.subplot(1, 2, 2)
-y.value_counts().plot(kind='pie', autopct='%1.1f%%', 
-                      colors=['lightcoral', 'lightgreen'],
-                      labels=['Malignant', 'Benign'])
-plt.title('Target Distribution Percentage', fontsize=14, fontweight='bold')
-plt.ylabel('')
-
-plt.tight_layout()
-plt.savefig('task3_target_distribution.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: task3_target_distribution.png")
-
-# Feature correlation heatmap
-correlation_matrix = X_train.corr()
-plt.figure(figsize=(14, 12))
-# Use iloc to slice pandas DataFrame correctly
-sns.heatmap(correlation_matrix.iloc[:20, :20], annot=False, cmap='coolwarm', center=0,
-            square=True, linewidths=0.5)
-plt.title('Feature Correlation Matrix (Top 20x20)', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('task3_correlation_heatmap.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: task3_correlation_heatmap.png")
+    scaler = StandardScaler()
+    return {
+        'scaler': scaler,
+        'X_train_scaled': scaler.fit_transform(split['X_train']),
+        'X_test_scaled': scaler.transform(split['X_test'])
+    }
 
 
 # ============================================================================
 # 4. MODEL TRAINING - RANDOM FOREST CLASSIFIER
 # ============================================================================
 
-print("\n4. Training Random Forest model...")
+def train_model(X_train_scaled, y_train, **model_params):
+    """
+    Train a Random Forest on the scaled training set.
 
-rf_classifier = RandomForestClassifier(
-    n_estimators=100,      # Number of trees
-    max_depth=10,          # Maximum depth
-    min_samples_split=5,   # Minimum samples to split
-    min_samples_leaf=2,    # Minimum samples in leaf
-    random_state=42,       # For reproducibility
-    n_jobs=-1              # Use all CPUs
-)
+    Args:
+        model_params: RandomForestClassifier keyword arguments (see MODEL_PARAMS)
 
-print("Random Forest Parameters:")
-print(f"  - Number of trees: {rf_classifier.n_estimators}")
-print(f"  - Max depth: {rf_classifier.max_depth}")
-print(f"  - Min samples split: {rf_classifier.min_samples_split}")
+    Returns:
+        RandomForestClassifier: The fitted model
+    """
+    from sklearn.ensemble import RandomForestClassifier
 
-# Train the model
-rf_classifier.fit(X_train_scaled, y_train)
-print("✓ Model training completed")
+    rf_classifier = RandomForestClassifier(**model_params)
+    rf_classifier.fit(X_train_scaled, y_train)
+    return rf_classifier
 
 
 # ============================================================================
 # 5. MODEL EVALUATION
 # ============================================================================
 
-print("\n5. Evaluating model performance...")
-
-# Make predictions
-y_train_pred = rf_classifier.predict(X_train_scaled)
-y_test_pred = rf_classifier.predict(X_test_scaled)
-
-# Calculate accuracy
-train_accuracy = accuracy_score(y_train, y_train_pred)
-test_accuracy = accuracy_score(y_test, y_test_pred)
-
-print("\nAccuracy Scores:")
-print(f"  Training Accuracy: {train_accuracy:.4f} ({train_accuracy*100:.2f}%)")
-print(f"  Test Accuracy:     {test_accuracy:.4f} ({test_accuracy*100:.2f}%)")
-
-# Calculate F1-score
-train_f1 = f1_score(y_train, y_train_pred)
-test_f1 = f1_score(y_test, y_test_pred)
-
-print("\nF1 Scores:")
-print(f"  Training F1-score: {train_f1:.4f}")
-print(f"  Test F1-score:     {test_f1:.4f}")
-
-# Additional metrics
-test_precision = precision_score(y_test, y_test_pred)
-test_recall = recall_score(y_test, y_test_pred)
-
-print("\nAdditional Metrics:")
-print(f"  Precision: {test_precision:.4f}")
-print(f"  Recall:    {test_recall:.4f}")
-
-# Detailed classification report
-print("\n" + "="*80)
-print("DETAILED CLASSIFICATION REPORT")
-print("="*80)
-print(classification_report(y_test, y_test_pred, 
-                          target_names=['Malignant', 'Benign'],
-                          digits=4))
-
-
-# Confusion Matrix
-cm = confusion_matrix(y_test, y_test_pred)
-
-plt.figure(figsize=(8, 6))
-sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', 
-            xticklabels=['Malignant', 'Benign'], 
-            yticklabels=['Malignant', 'Benign'],
-            cbar_kws={'label': 'Count'})
-plt.title('Confusion Matrix', fontsize=14, fontweight='bold')
-plt.ylabel('True Label', fontsize=12)
-plt.xlabel('Predicted Label', fontsize=12)
-plt.tight_layout()
-plt.savefig('task3_confusion_matrix.png', dpi=300, bbox_inches='tight')
-print("\n✓ Saved: task3_confusion_matrix.png")
-
-print("\nConfusion Matrix Breakdown:")
-print(f"  True Negatives:  {cm[0][0]} (Correctly predicted Malignant)")
-print(f"  False Positives: {cm[0][1]} (Wrongly predicted Benign, actually Malignant)")
-print(f"  False Negatives: {cm[1][0]} (Wrongly predicted Malignant, actually Benign)")
-print(f"  True Positives:  {cm[1][1]} (Correctly predicted Benign)")
+def evaluate_model(rf_classifier, split, scaled):
+    """
+    Predict on both sets and compute every reported metric.
+
+    Returns:
+        dict: Accuracy/F1 for train and test, test precision/recall,
+            classification report, confusion matrix, test probabilities,
+            ROC curve points and AUC
+    """
+    y_train, y_test = split['y_train'], split['y_test']
+
+    # Make predictions
+    y_train_pred = rf_classifier.predict(scaled['X_train_scaled'])
+    y_test_pred = rf_classifier.predict(scaled['X_test_scaled'])
+    y_test_proba = rf_classifier.predict_proba(scaled['X_test_scaled'])[:, 1]
+
+    # One confusion matrix and score table per set; every metric derives from them
+    train = BinaryMetrics().update(y_train, y_train_pred)
+    test = BinaryMetrics().update(y_test, y_test_pred, y_test_proba).summary(CLASS_NAMES, digits=4)
+
+    return {
+        'train_accuracy': train.accuracy(),
+        'test_accuracy': test['accuracy'],
+        'train_f1': train.f1(),
+        'test_f1': test['f1'],
+        'test_precision': test['precision'],
+        'test_recall': test['recall'],
+        'classification_report': test['classification_report'],
+        'confusion_matrix': test['confusion_matrix'],
+        'y_test_proba': y_test_proba,
+        'roc_auc': test['roc_auc'],
+        'fpr': test['fpr'],
+        'tpr': test['tpr'],
+        'thresholds': test['thresholds']
+    }
+
+
+def print_evaluation(metrics):
+    """Print accuracy, F1, precision/recall and the classification report."""
+    train_accuracy, test_accuracy = metrics['train_accuracy'], metrics['test_accuracy']
+    print("\nAccuracy Scores:")
+    print(f"  Training Accuracy: {train_accuracy:.4f} ({train_accuracy*100:.2f}%)")
+    print(f"  Test Accuracy:     {test_accuracy:.4f} ({test_accuracy*100:.2f}%)")
+
+    print("\nF1 Scores:")
+    print(f"  Training F1-score: {metrics['train_f1']:.4f}")
+    print(f"  Test F1-score:     {metrics['test_f1']:.4f}")
+
+    print("\nAdditional Metrics:")
+    print(f"  Precision: {metrics['test_precision']:.4f}")
+    print(f"  Recall:    {metrics['test_recall']:.4f}")
+
+    # Detailed classification report
+    print("\n" + "="*80)
+    print("DETAILED CLASSIFICATION REPORT")
+    print("="*80)
+    print(metrics['classification_report'])
+
+
+def print_confusion_breakdown(cm):
+    """Explain each cell of the confusion matrix."""
+    print("\nConfusion Matrix Breakdown:")
+    print(f"  True Negatives:  {cm[0][0]} (Correctly predicted Malignant)")
+    print(f"  False Positives: {cm[0][1]} (Wrongly predicted Benign, actually Malignant)")
+    print(f"  False Negatives: {cm[1][0]} (Wrongly predicted Malignant, actually Benign)")
+    print(f"  True Positives:  {cm[1][1]} (Correctly predicted Benign)")
 
 
 # ============================================================================
 # 6. FEATURE IMPORTANCE ANALYSIS
 # ============================================================================
 
-print("\n6. Analyzing feature importance...")
-
-feature_importance = pd.DataFrame({
-    'feature': X.columns,
-    'importance': rf_classifier.feature_importances_
-}).sort_values('importance', ascending=False)
+def feature_importance_table(rf_classifier, feature_names):
+    """
+    Rank features by the forest's impurity-based importance.
 
-print("\nTop 10 Most Important Features:")
-print(feature_importance.head(10))
+    Returns:
+        DataFrame: 'feature' and 'importance', most important first
+    """
+    import pandas as pd
 
-# Visualize feature importance
-plt.figure(figsize=(12, 8))
-top_features = feature_importance.head(15)
-plt.barh(range(len(top_features)), top_features['importance'], color='steelblue')
-plt.yticks(range(len(top_features)), top_features['feature'])
-plt.xlabel('Importance Score', fontsize=12)
-plt.title('Top 15 Most Important Features', fontsize=14, fontweight='bold')
-plt.gca().invert_yaxis()
-plt.grid(axis='x', alpha=0.3)
-plt.tight_layout()
-plt.savefig('task3_feature_importance.png', dpi=300, bbox_inches='tight')
-print("\n✓ Saved: task3_feature_importance.png")
+    return pd.DataFrame({
+        'feature': list(feature_names),
+        'importance': rf_classifier.feature_importances_
+    }).sort_values('importance', ascending=False)
 
 
 # ============================================================================
-# 7. ROC CURVE ANALYSIS
+# 8. SUMMARY AND CONCLUSIONS
 # ============================================================================
 
-print("\n7. Creating ROC curve...")
+def print_summary(metrics):
+    """Print the performance summary and key takeaways."""
+    print("\n" + "="*80)
+    print("MODEL PERFORMANCE SUMMARY")
+    print("="*80)
+    print(f"\nTest Accuracy:     {metrics['test_accuracy']:.4f} ({metrics['test_accuracy']*100:.2f}%)")
+    print(f"Test F1-Score:     {metrics['test_f1']:.4f}")
+    print(f"Test Precision:    {metrics['test_precision']:.4f}")
+    print(f"Test Recall:       {metrics['test_recall']:.4f}")
+    print(f"ROC AUC Score:     {metrics['roc_auc']:.4f}")
+
+    print("\nMetric Interpretations:")
+    print("  Accuracy: Overall percentage of correct predictions")
+    print("  Precision: Of predicted benign cases, how many are actually benign")
+    print("  Recall: Of actual benign cases, how many were correctly identified")
+    print("  F1-Score: Harmonic mean of precision and recall")
+    print("  ROC AUC: Model's ability to distinguish between malignant and benign")
+
+    print("\n" + "="*80)
+    print("KEY TAKEAWAYS")
+    print("="*80)
+    print("1. Data Quality: Dataset was clean with no missing values")
+    print("2. Model Performance: Random Forest achieved excellent accuracy and F1-scores")
+    print("3. Feature Importance: Certain features contribute more to predictions")
+    print("4. Generalization: Test performance indicates good generalization")
+    print("5. Deployment Ready: Model shows strong predictive capability")
+
+
+def save_metrics_csv(metrics, path=METRICS_FILE):
+    """Save the headline test metrics to CSV."""
+    rows = [
+        ('Test Accuracy', metrics['test_accuracy']),
+        ('Test F1-Score', metrics['test_f1']),
+        ('Test Precision', metrics['test_precision']),
+        ('Test Recall', metrics['test_recall']),
+        ('ROC AUC Score', metrics['roc_auc']),
+    ]
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['Metric', 'Value'])
+        writer.writerows((name, float(value)) for name, value in rows)
+    return path
 
-y_test_proba = rf_classifier.predict_proba(X_test_scaled)[:, 1]
-roc_auc = roc_auc_score(y_test, y_test_proba)
 
-print(f"ROC AUC Score: {roc_auc:.4f}")
-
-# Plot ROC curve
-fpr, tpr, thresholds = roc_curve(y_test, y_test_proba)
+# ============================================================================
+# PIPELINE
+# ============================================================================
 
-plt.figure(figsize=(9, 7))
-plt.plot(fpr, tpr, linewidth=2, label=f'Random Forest (AUC = {roc_auc:.4f})')
-plt.plot([0, 1], [0, 1], 'k--', linewidth=1, label='Random Classifier')
-plt.xlabel('False Positive Rate', fontsize=12)
-plt.ylabel('True Positive Rate', fontsize=12)
-plt.title('ROC Curve - Breast Cancer Classification', fontsize=14, fontweight='bold')
-plt.legend(loc='lower right', fontsize=11)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('task3_roc_curve.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: task3_roc_curve.png")
+def dataset_version():
+    """sklearn release that pins the bundled dataset, read without importing sklearn."""
+    from importlib import metadata
 
+    try:
+        return metadata.version('scikit-learn')
+    except metadata.PackageNotFoundError:
+        import sklearn
+        return sklearn.__version__
 
-# ============================================================================
-# 8. SUMMARY AND CONCLUSIONS
-# ============================================================================
 
-print("\n" + "="*80)
-print("MODEL PERFORMANCE SUMMARY")
-print("="*80)
-print(f"\nTest Accuracy:     {test_accuracy:.4f} ({test_accuracy*100:.2f}%)")
-print(f"Test F1-Score:     {test_f1:.4f}")
-print(f"Test Precision:    {test_precision:.4f}")
-print(f"Test Recall:       {test_recall:.4f}")
-print(f"ROC AUC Score:     {roc_auc:.4f}")
-
-print("\nMetric Interpretations:")
-print("  Accuracy: Overall percentage of correct predictions")
-print("  Precision: Of predicted benign cases, how many are actually benign")
-print("  Recall: Of actual benign cases, how many were correctly identified")
-print("  F1-Score: Harmonic mean of precision and recall")
-print("  ROC AUC: Model's ability to distinguish between malignant and benign")
-
-print("\n" + "="*80)
-print("KEY TAKEAWAYS")
-print("="*80)
-print("1. Data Quality: Dataset was clean with no missing values")
-print("2. Model Performance: Random Forest achieved excellent accuracy and F1-scores")
-print("3. Feature Importance: Certain features contribute more to predictions")
-print("4. Generalization: Test performance indicates good generalization")
-print("5. Deployment Ready: Model shows strong predictive capability")
-
-print("\n✓ Analysis completed successfully!")
-print("="*80)
-
-
-# Save results to CSV
-results_df = pd.DataFrame({
-    'Metric': ['Test Accuracy', 'Test F1-Score', 'Test Precision', 
-               'Test Recall', 'ROC AUC Score'],
-    'Value': [test_accuracy, test_f1, test_precision, test_recall, roc_auc]
-})
-
-results_df.to_csv('task3_performance_metrics.csv', index=False)
-print("\n✓ Saved: task3_performance_metrics.csv")
+def _split_loaded(loaded, **split_params):
+    return split_dataset(loaded[0], **split_params)
+
+
+def _profile_loaded(loaded):
+    return profile_dataset(loaded[0])
 
+
+def _train_scaled(scaled, split, **model_params):
+    return train_model(scaled['X_train_scaled'], split['y_train'], **model_params)
+
+
+def load_split(cache, split_params=None, lazy=False):
+    """
+    The 'load' and 'split' stages.
+
+    The split is keyed on the load stage's fingerprint, so with lazy=True
+    neither DataFrame is read from the cache unless it is used.
+
+    Returns:
+        tuple: (load StageResult, split StageResult)
+    """
+    split_params = {**SPLIT_PARAMS, **(split_params or {})}
+    # The bundled dataset only changes with the sklearn release
+    load = cache.run('load', load_dataset, version=dataset_version(), lazy=lazy)
+    split = cache.run('split', _split_loaded, inputs=(load,), params=split_params, lazy=lazy)
+    return load, split
+
+
+def train_and_evaluate(cache, split, model_params=None, lazy=False):
+    """
+    The 'scale', 'train' and 'evaluate' stages on top of a split stage.
+
+    Returns:
+        dict: StageResults for 'scale', 'train' and 'evaluate'
+    """
+    model_params = {**MODEL_PARAMS, **(model_params or {})}
+    scale = cache.run('scale', scale_features, inputs=(split,), lazy=lazy)
+    train = cache.run('train', _train_scaled, inputs=(scale, split), params=model_params, lazy=lazy)
+    evaluate = cache.run('evaluate', evaluate_model, inputs=(train, split, scale), lazy=lazy)
+    return {'scale': scale, 'train': train, 'evaluate': evaluate}
+
+
+def run_metrics(cache=None, model_params=None, split_params=None):
+    """
+    Report the test metrics only: no EDA, figures or model artifact.
+
+    Stages are loaded lazily, so when the evaluation is cached nothing
+    else is read from disk and neither pandas nor sklearn is imported.
+
+    Returns:
+        dict: The evaluation metrics
+    """
+    cache = cache or StageCache()
+    _, split = load_split(cache, split_params, lazy=True)
+    metrics = train_and_evaluate(cache, split, model_params, lazy=True)['evaluate'].value
+    print_evaluation(metrics)
+    print_summary(metrics)
+    save_metrics_csv(metrics)
+    print(f"\n✓ Saved: {METRICS_FILE}")
+    return metrics
+
+
+def save_model(scaled, rf_classifier, feature_names, metrics, path=MODEL_FILE):
+    """Persist the fitted scaler and forest as one artifact."""
+    headline = {key: metrics[key] for key in ('test_accuracy', 'test_f1', 'roc_auc')}
+    return save_model_artifact(scaled['scaler'], rf_classifier, feature_names, path, headline)
+
+
+def run_pipeline(cache=None, make_plots=True, model_params=None, split_params=None, model_path=MODEL_FILE,
+                 plot_dpi=FULL_DPI, plot_workers=None):
+    """
+    Run the full analysis, reusing cached stages whose inputs are unchanged.
+
+    Figures are queued as soon as their inputs exist and rendered in a
+    process pool alongside the remaining stages (see task3_plots).
+
+    Args:
+        cache (StageCache): Stage cache; defaults to one in DEFAULT_CACHE_DIR
+        make_plots (bool): Render the five figures
+        model_params (dict): Overrides for MODEL_PARAMS
+        split_params (dict): Overrides for SPLIT_PARAMS
+        model_path (str): Where the scaler+forest artifact is saved (None skips it)
+        plot_dpi (int): Figure resolution (PREVIEW_DPI for quick drafts)
+        plot_workers (int): Rendering processes (1 renders in this process)
+
+    Returns:
+        dict: StageResults keyed by stage name
+    """
+    cache = cache or StageCache()
+    model_params = {**MODEL_PARAMS, **(model_params or {})}
+    split_params = {**SPLIT_PARAMS, **(split_params or {})}
+    stages = {}
+    # Unchanged figures are skipped using input hashes recorded next to the stage cache
+    manifest_path = os.path.join(cache.directory, 'plots.json') if cache.enabled else None
+    renderer = PlotRenderer(plot_dpi, plot_workers, manifest_path, enabled=make_plots)
+
+    print("="*80)
+    print("TASK 3: PREDICTIVE ANALYTICS - BREAST CANCER CLASSIFICATION")
+    print("="*80)
+
+    print("\n1. Loading and exploring dataset...")
+    stages['load'], stages['split'] = load_split(cache, split_params)
+    df, target_names = stages['load'].value
+    print_dataset_overview(df, target_names)
+
+    print("\n2. Preprocessing data...")
+    stages['profile'] = cache.run('profile', _profile_loaded, inputs=(stages['load'],))
+    profile = stages['profile'].value
+    print(f"Missing Values: {profile['missing_values']}")
+    print(f"Duplicate Rows: {profile['duplicate_rows']}")
+    print(f"Features shape: {(df.shape[0], df.shape[1] - 1)}")
+    print(f"Target shape: {(df.shape[0],)}")
+
+    split = stages['split'].value
+    print(f"\nSplit completed:")
+    print(f"  Training set: {split['X_train'].shape}")
+    print(f"  Testing set:  {split['X_test'].shape}")
+
+    stages['scale'] = cache.run('scale', scale_features, inputs=(stages['split'],))
+    print("✓ Features scaled successfully")
+
+    print("\n3. Creating visualizations...")
+    renderer.submit(plot_target_distribution, (df['target'],), 'task3_target_distribution.png')
+    if make_plots:
+        # Only the plotted 20x20 block is read back from the training-set statistics
+        stages['train_stats'] = cache.run('train_stats', EDAStats.from_frame, inputs=(split['X_train'],))
+        heatmap_columns = list(split['X_train'].columns[:20])
+        renderer.submit(plot_correlation_heatmap, (stages['train_stats'].value.correlation(heatmap_columns),),
+                        'task3_correlation_heatmap.png')
+        print("✓ Figures queued for rendering")
+    else:
+        print("Skipped (plots disabled)")
+
+    print("\n4. Training Random Forest model...")
+    print("Random Forest Parameters:")
+    print(f"  - Number of trees: {model_params['n_estimators']}")
+    print(f"  - Max depth: {model_params['max_depth']}")
+    print(f"  - Min samples split: {model_params['min_samples_split']}")
+    stages['train'] = cache.run('train', _train_scaled, inputs=(stages['scale'], stages['split']),
+                                params=model_params)
+    print("✓ Model training completed")
+
+    print("\n5. Evaluating model performance...")
+    stages['evaluate'] = cache.run('evaluate', evaluate_model,
+                                   inputs=(stages['train'], stages['split'], stages['scale']))
+    metrics = stages['evaluate'].value
+    print_evaluation(metrics)
+    renderer.submit(plot_confusion_matrix, (metrics['confusion_matrix'],), 'task3_confusion_matrix.png')
+    print_confusion_breakdown(metrics['confusion_matrix'])
+
+    print("\n6. Analyzing feature importance...")
+    stages['feature_importance'] = cache.run('feature_importance', feature_importance_table,
+                                             inputs=(stages['train'], list(split['X_train'].columns)))
+    feature_importance = stages['feature_importance'].value
+    print("\nTop 10 Most Important Features:")
+    print(feature_importance.head(10))
+    renderer.submit(plot_feature_importance, (feature_importance,), 'task3_feature_importance.png')
+
+    print("\n7. Creating ROC curve...")
+    print(f"ROC AUC Score: {metrics['roc_auc']:.4f}")
+    renderer.submit(plot_roc_curve, (metrics['fpr'], metrics['tpr'], metrics['roc_auc']), 'task3_roc_curve.png')
+
+    print_summary(metrics)
+
+    print("\n✓ Analysis completed successfully!")
+    print("="*80)
+
+    save_metrics_csv(metrics)
+    print(f"\n✓ Saved: {METRICS_FILE}")
+
+    if model_path:
+        # Written on every run rather than cached: other tools (e.g. task3_streaming.py
+        # train) overwrite the same file, so its existence says nothing about its content
+        artifact = save_model(stages['scale'].value, stages['train'].value, list(split['X_train'].columns),
+                              metrics, path=model_path)
+        print(f"✓ Saved: {model_path} (model {artifact['model_version']})")
+
+    for figure in renderer.finish():
+        status = f"rendered in {figure['seconds']:.2f}s" if figure['rendered'] else "unchanged"
+        print(f"✓ Saved: {figure['path']} ({status})")
+
+    return stages
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Breast cancer classification pipeline with cached stages")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Directory for cached stage outputs")
+    parser.add_argument('--no-cache', action='store_true', help="Recompute every stage")
+    parser.add_argument('--clear-cache', action='store_true', help="Delete cached stages before running")
+    parser.add_argument('--no-plots', action='store_true', help="Skip the figures")
+    parser.add_argument('--metrics-only', action='store_true',
+                        help="Only report and save the test metrics (fastest with a warm cache)")
+    parser.add_argument('--preview', action='store_true', help=f"Render figures at {PREVIEW_DPI} dpi")
+    parser.add_argument('--plot-workers', type=int, default=None,
+                        help="Figure rendering processes (default: CPU count; 1 renders in-process)")
+    args = parser.parse_args()
+
+    stage_cache = StageCache(args.cache_dir, enabled=not args.no_cache)
+    if args.clear_cache:
+        stage_cache.clear()
+    if args.metrics_only:
+        run_metrics(stage_cache)
+    else:
+        run_pipeline(stage_cache, make_plots=not args.no_plots,
+                     plot_dpi=PREVIEW_DPI if args.preview else FULL_DPI, plot_workers=args.plot_workers)
@@ -0,0 +1,326 @@
+"""
+Task 3: Content-Hashed Stage Cache
+===================================
+On-disk cache for the stages of the task3 analytics pipeline.
+
+A stage's cache key is a hash of:
+    - the stage name and the source code of the function that computes it,
+      plus every function and class of this repository that it calls by
+      name (directly or through other repository code)
+    - the fingerprints of its inputs (upstream StageResults, or raw data)
+    - its parameters
+
+An upstream stage's fingerprint is its own cache key, so a change to the
+data or to one stage's parameters invalidates exactly the stages
+downstream of it; everything else is loaded from disk.
+
+Code reached only through an object's attribute (e.g. a method of a
+passed-in model) and installed libraries are not part of the key; after
+changing those, run the pipeline with --clear-cache.
+
+Entries for earlier parameters stay on disk, so switching back and forth
+between configurations reuses both. When the directory grows beyond
+max_bytes, the least recently used entries are deleted.
+"""
+
+import dis
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import shutil
+import sys
+import time
+
+
+DEFAULT_CACHE_DIR = '.task3_cache'
+
+# Total size of cached stage outputs before least recently used ones are evicted
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class StageResult:
+    """
+    Output of one pipeline stage together with its fingerprint.
+
+    A result returned by StageCache.run(..., lazy=True) reads its value from
+    disk on first access, so a stage whose output is never used costs
+    nothing but its key.
+    """
+
+    def __init__(self, name, value, fingerprint, cached, seconds, loader=None):
+        self.name = name
+        self._value = value
+        self._loader = loader
+        self.fingerprint = fingerprint
+        self.cached = cached
+        self.seconds = seconds
+
+    @property
+    def value(self):
+        if self._loader is not None:
+            start = time.perf_counter()
+            self._value = self._loader()
+            self._loader = None
+            self.seconds = time.perf_counter() - start
+        return self._value
+
+    def __repr__(self):
+        source = 'cache' if self.cached else f"{self.seconds:.2f}s"
+        return f"StageResult({self.name!r}, {self.fingerprint[:12]}, {source})"
+
+
+def fingerprint(obj):
+    """
+    Stable content hash of a stage input.
+
+    StageResults contribute their key; arrays, DataFrames and plain Python
+    values are hashed by content.
+    """
+    if isinstance(obj, StageResult):
+        return obj.fingerprint
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return hashlib.sha1(json.dumps(obj).encode('utf-8')).hexdigest()
+    if isinstance(obj, (list, tuple)):
+        return hashlib.sha1(''.join(fingerprint(item) for item in obj).encode('utf-8')).hexdigest()
+    if isinstance(obj, dict):
+        parts = ''.join(f"{key}={fingerprint(value)};" for key, value in sorted(obj.items()))
+        return hashlib.sha1(parts.encode('utf-8')).hexdigest()
+    if type(obj).__module__.startswith('pandas'):
+        # Pickled frames differ with internal block layout; hash the values instead
+        import pandas as pd
+        digest = hashlib.sha1(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+        digest.update(repr(getattr(obj, 'columns', getattr(obj, 'name', None))).encode('utf-8'))
+        digest.update(repr(getattr(obj, 'dtypes', None)).encode('utf-8'))
+        return digest.hexdigest()
+    import joblib
+    return joblib.hash(obj, hash_name='sha1')
+
+
+def _source(obj):
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        return getattr(obj, '__qualname__', repr(obj))
+
+
+def _module_dir(obj):
+    path = getattr(sys.modules.get(getattr(obj, '__module__', None) or ''), '__file__', None)
+    return os.path.dirname(os.path.abspath(path)) if path else None
+
+
+def _local_module(name, root):
+    """Import a module by name if its file lives in root (library modules are left alone)."""
+    if name in sys.modules:
+        module = sys.modules[name]
+    else:
+        # Only the top-level name is looked up: finding a submodule would import its package
+        spec = importlib.util.find_spec(name.partition('.')[0])
+        if spec is None or not spec.origin or os.path.dirname(os.path.abspath(spec.origin)) != root:
+            return None
+        module = importlib.import_module(name)
+    path = getattr(module, '__file__', None)
+    return module if path and os.path.dirname(os.path.abspath(path)) == root else None
+
+
+def _referenced(func, root):
+    """Objects func's code names: module globals and names imported from repository modules."""
+    namespace = getattr(func, '__globals__', {})
+    codes = [func.__code__]
+    while codes:
+        code = codes.pop()
+        codes.extend(const for const in code.co_consts if inspect.iscode(const))
+        module = None
+        for instruction in dis.get_instructions(code):
+            if instruction.opname == 'IMPORT_NAME':
+                module = _local_module(instruction.argval, root)
+            elif instruction.opname == 'IMPORT_FROM':
+                if module is not None:
+                    yield getattr(module, instruction.argval, None)
+            elif instruction.opname in ('LOAD_GLOBAL', 'LOAD_NAME'):
+                yield namespace.get(instruction.argval)
+
+
+@functools.lru_cache(maxsize=None)
+def _source_hash(func):
+    """
+    Hash of a stage function's code and of the repository code it calls.
+
+    Functions and classes defined next to the stage's module and referenced
+    by name are followed recursively, so editing a helper such as
+    train_model invalidates every stage that calls it.
+    """
+    root = _module_dir(getattr(func, '__func__', func))
+    digest = hashlib.sha1()
+    pending, seen = [func], set()
+    while pending:
+        obj = pending.pop()
+        if inspect.isclass(getattr(obj, '__self__', None)):
+            # A classmethod such as EDAStats.from_frame depends on its class
+            pending.append(obj.__self__)
+        obj = inspect.unwrap(getattr(obj, '__func__', obj))
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        digest.update(_source(obj).encode('utf-8'))
+        if root is None:
+            continue
+
+        if inspect.isclass(obj):
+            members = [getattr(member, '__func__', getattr(member, 'fget', member)) for member in vars(obj).values()]
+            functions = [member for member in members if inspect.isfunction(member)]
+        else:
+            functions = [obj] if inspect.isfunction(obj) else []
+        for function in functions:
+            for dependency in _referenced(function, root):
+                if (inspect.isfunction(dependency) or inspect.isclass(dependency)) and \
+                        _module_dir(dependency) == root:
+                    pending.append(dependency)
+    return digest.hexdigest()
+
+
+class StageCache:
+    """
+    Runs pipeline stages, reusing results whose inputs have not changed.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, enabled=True, verbose=True, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory (str): Where stage outputs are stored
+            enabled (bool): False recomputes every stage and writes nothing
+            verbose (bool): Print one line per stage
+            max_bytes (int): Size of the stored outputs above which the least
+                recently used entries are deleted
+        """
+        self.directory = directory
+        self.enabled = enabled
+        self.verbose = verbose
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'misses': 0}
+        if enabled:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, name, func, inputs=(), params=None, version=None):
+        """Cache key for one stage invocation."""
+        parts = [name, _source_hash(func), fingerprint(list(inputs)), fingerprint(params or {}),
+                 fingerprint(version)]
+        return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def _path(self, name, key):
+        return os.path.join(self.directory, f"{name}-{key[:16]}.joblib")
+
+    def run(self, name, func, inputs=(), params=None, outputs=(), version=None, lazy=False):
+        """
+        Return a stage's result from the cache, or compute and store it.
+
+        Args:
+            name (str): Stage name
+            func (callable): Called as func(*input values, **params)
+            inputs (tuple): StageResults or raw values passed positionally
+            params (dict): Keyword arguments, part of the cache key
+            outputs (tuple): Files the stage writes; a cache hit also
+                requires all of them to exist
+            version: Extra key material not passed to func (e.g. the
+                library version that pins a bundled dataset)
+            lazy (bool): On a hit, defer reading the value until it is used
+
+        Returns:
+            StageResult: The stage output and its fingerprint
+        """
+        params = params or {}
+        key = self.key(name, func, inputs, params, version)
+        result = self.lookup(name, key, outputs, lazy)
+        if result is not None:
+            return result
+
+        start = time.perf_counter()
+        values = [item.value if isinstance(item, StageResult) else item for item in inputs]
+        value = func(*values, **params)
+        return self.store(name, key, value, time.perf_counter() - start)
+
+    def lookup(self, name, key, outputs=(), lazy=False):
+        """
+        Load a stored stage result.
+
+        Args:
+            lazy (bool): Return at once and read the value on first access;
+                an unreadable entry then raises instead of counting as a miss
+
+        Returns:
+            StageResult: The cached result, or None on a miss
+        """
+        import joblib
+
+        path = self._path(name, key)
+        if not (self.enabled and os.path.exists(path) and all(os.path.exists(output) for output in outputs)):
+            return None
+        # The modification time orders entries for least-recently-used eviction
+        os.utime(path)
+        if lazy:
+            self.stats['hits'] += 1
+            if self.verbose:
+                print(f"  [cache] {name}: reused ({key[:12]})")
+            return StageResult(name, None, key, True, 0.0, loader=lambda: joblib.load(path))
+        start = time.perf_counter()
+        try:
+            value = joblib.load(path)
+        except Exception:
+            return None
+        self.stats['hits'] += 1
+        if self.verbose:
+            print(f"  [cache] {name}: reused ({key[:12]})")
+        return StageResult(name, value, key, True, time.perf_counter() - start)
+
+    def store(self, name, key, value, seconds):
+        """
+        Record a freshly computed stage result.
+
+        Returns:
+            StageResult: The result, marked as computed
+        """
+        self.stats['misses'] += 1
+        if self.enabled:
+            import joblib
+
+            path = self._path(name, key)
+            temp_path = path + '.tmp'
+            joblib.dump(value, temp_path)
+            os.replace(temp_path, path)
+            self._evict(keep=path)
+        if self.verbose:
+            print(f"  [cache] {name}: computed in {seconds:.2f}s ({key[:12]})")
+        return StageResult(name, value, key, False, seconds)
+
+    def _evict(self, keep):
+        """Delete the least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for entry in os.listdir(self.directory):
+            if entry.endswith('.joblib'):
+                path = os.path.join(self.directory, entry)
+                try:
+                    status = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((status.st_mtime_ns, status.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        """Delete every cached stage."""
+        if os.path.isdir(self.directory):
+            shutil.rmtree(self.directory)
+        if self.enabled:
+            os.makedirs(self.directory, exist_ok=True)
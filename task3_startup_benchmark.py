@@ -0,0 +1,135 @@
+"""
+Task 3: Startup Time Benchmark
+===============================
+Measures how long the task3 entry points take to import and start, each
+in a fresh interpreter, and enforces a budget. Importing a task3 module
+must not load pandas, sklearn, matplotlib or seaborn; those are imported
+by the stages that use them.
+
+Exits with status 1 when a module exceeds its import budget or loads a
+heavy library, so it can gate changes.
+
+Example:
+    python task3_startup_benchmark.py --repeats 5
+    python task3_startup_benchmark.py --commands
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+# Median import time allowed per module, in milliseconds
+IMPORT_BUDGETS_MS = {
+    'task3_stage_cache': 150,
+    'task3_model_artifact': 250,
+    'task3_flat_forest': 250,
+    'task3_prediction_server': 300,
+    'task3_predictive_analytics': 300,
+}
+
+# Libraries that importing a task3 module must not load
+HEAVY_MODULES = ('pandas', 'sklearn', 'matplotlib', 'seaborn')
+
+# End-to-end runs timed with --commands (the first one warms the cache)
+COMMANDS = {
+    'pipeline --no-plots': ['task3_predictive_analytics.py', '--no-plots'],
+    'pipeline --metrics-only': ['task3_predictive_analytics.py', '--metrics-only'],
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'loaded': [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_import(module, repeats=5):
+    """
+    Import a module in fresh interpreters.
+
+    Returns:
+        dict: 'module', 'median_ms', 'min_ms' and 'heavy_loaded' (heavy
+            libraries present in sys.modules afterwards)
+    """
+    samples, loaded = [], set()
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_DIR, os.environ.get('PYTHONPATH')])))
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                                capture_output=True, text=True, check=True, cwd=REPO_DIR, env=env).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result['seconds'] * 1000)
+        loaded.update(result['loaded'])
+    return {'module': module, 'median_ms': round(statistics.median(samples), 1),
+            'min_ms': round(min(samples), 1), 'heavy_loaded': sorted(loaded)}
+
+
+def check_budgets(budgets=None, repeats=5):
+    """
+    Measure every budgeted module.
+
+    Returns:
+        list: measure_import() rows with 'budget_ms' and 'ok' added
+    """
+    rows = []
+    for module, budget in (budgets or IMPORT_BUDGETS_MS).items():
+        row = measure_import(module, repeats)
+        row['budget_ms'] = budget
+        row['ok'] = row['median_ms'] <= budget and not row['heavy_loaded']
+        rows.append(row)
+        mark = '✓' if row['ok'] else '✗'
+        heavy = f" loads {', '.join(row['heavy_loaded'])}" if row['heavy_loaded'] else ''
+        print(f"{mark} {module:<28} {row['median_ms']:>8.1f} ms (budget {budget} ms){heavy}")
+    return rows
+
+
+def time_commands(commands=None, workdir=None):
+    """
+    Wall-clock time of end-to-end command runs.
+
+    Args:
+        commands (dict): Label -> script and arguments (COMMANDS by default)
+        workdir (str): Directory the commands run in (their outputs land there)
+
+    Returns:
+        dict: Label -> seconds
+    """
+    timings = {}
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_DIR, os.environ.get('PYTHONPATH')])))
+    for label, command in (commands or COMMANDS).items():
+        script = os.path.join(REPO_DIR, command[0])
+        start = time.perf_counter()
+        subprocess.run([sys.executable, script, *command[1:]], check=True, cwd=workdir or REPO_DIR, env=env,
+                       stdout=subprocess.DEVNULL)
+        timings[label] = time.perf_counter() - start
+        print(f"✓ {label:<28} {timings[label]:>8.2f} s")
+    return timings
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check task3 import-time budgets")
+    parser.add_argument('--repeats', type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument('--commands', action='store_true', help="Also time end-to-end pipeline runs")
+    parser.add_argument('--workdir', default=None, help="Where --commands runs write their outputs")
+    args = parser.parse_args()
+
+    print("Import time (median of fresh interpreters):")
+    results = check_budgets(repeats=args.repeats)
+    if args.commands:
+        print("\nEnd-to-end runs:")
+        time_commands(workdir=args.workdir)
+
+    failed = [row['module'] for row in results if not row['ok']]
+    if failed:
+        print(f"\n✗ Over budget: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✓ All modules within their import budget")
@@ -0,0 +1,441 @@
+"""
+Task 3: Out-of-Core Streaming Training
+=======================================
+Trains the task3 scaler + forest from CSV or Parquet files too large to
+load into one DataFrame. The input has the 30 load_breast_cancer feature
+columns and a 'target' column and is read in chunks, so peak memory
+depends on the chunk size and sample size, not on the file size.
+
+One streaming pass computes:
+    - row, missing-value and class counts
+    - duplicate rows, from 64-bit row hashes spilled to hash-partitioned
+      temporary files (8 bytes of disk per row) and counted one partition at
+      a time, so memory stays bounded; count_duplicates=False skips this
+    - the StandardScaler, fitted chunk by chunk with partial_fit
+    - a uniform reservoir sample of complete rows (mode 'subsample')
+
+The forest is then trained on one of two inputs:
+    - 'subsample': the scaled reservoir sample (no second pass)
+    - 'ensemble': a small forest per chunk from a second pass with the
+      final scaler, merged into one RandomForestClassifier; a uniform
+      reservoir sample of at most max_trees of those trees is kept, so the
+      model size is capped rather than growing with the file
+
+The result is saved with save_model_artifact, so task3_model_artifact's
+score command and the prediction server use it unchanged.
+
+Example:
+    python task3_streaming.py synthesize big.csv --rows 2000000
+    python task3_streaming.py train big.csv --mode ensemble --chunksize 100000
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from task3_model_artifact import DEFAULT_CHUNKSIZE, MODEL_FILE, iter_feature_chunks, save_model_artifact
+
+
+TARGET_COLUMN = 'target'
+
+MODE_SUBSAMPLE = 'subsample'
+MODE_ENSEMBLE = 'ensemble'
+
+# Rows kept for the 'subsample' forest
+DEFAULT_SAMPLE_ROWS = 200000
+
+# Trees grown per chunk in 'ensemble' mode
+DEFAULT_TREES_PER_CHUNK = 10
+
+# Trees kept in the merged 'ensemble' forest, as in task3's MODEL_PARAMS
+DEFAULT_MAX_TREES = 100
+
+# Row hashes are spilled to 2**HASH_PARTITION_BITS files, partitioned by their top bits
+HASH_PARTITION_BITS = 8
+
+
+class RowHashSpill:
+    """
+    64-bit row hashes appended to hash-partitioned temporary files.
+
+    Equal rows have equal hashes and so land in the same partition. While
+    streaming, only the current chunk's hashes are in memory; counting
+    loads one partition at a time, about 8 bytes x rows / 2**partition_bits.
+    """
+
+    def __init__(self, partition_bits=HASH_PARTITION_BITS, directory=None):
+        """
+        Args:
+            partition_bits (int): log2 of the number of partition files
+            directory (str): Where the temporary files go (system default if None)
+        """
+        self._directory = tempfile.TemporaryDirectory(prefix='task3_row_hashes_', dir=directory)
+        self._shift = np.uint64(64 - partition_bits)
+        self._files = [open(os.path.join(self._directory.name, f"{index:04d}.u64"), 'wb')
+                       for index in range(2 ** partition_bits)]
+
+    def add(self, hashes):
+        """Append one chunk of uint64 row hashes."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        partitions = (hashes >> self._shift).astype(np.int64)
+        order = np.argsort(partitions, kind='stable')
+        hashes = hashes[order]
+        bounds = np.searchsorted(partitions[order], np.arange(len(self._files) + 1))
+        for index in np.flatnonzero(np.diff(bounds)):
+            self._files[index].write(hashes[bounds[index]:bounds[index + 1]].tobytes())
+
+    def count_duplicates(self):
+        """Rows whose hash was already seen, as DataFrame.duplicated().sum()."""
+        duplicates = 0
+        for f in self._files:
+            f.flush()
+            values = np.fromfile(f.name, dtype=np.uint64)
+            duplicates += len(values) - len(np.unique(values))
+        return duplicates
+
+    def close(self):
+        """Delete the partition files."""
+        for f in self._files:
+            f.close()
+        self._directory.cleanup()
+
+
+class StreamingProfile:
+    """
+    Single-pass statistics over a chunked dataset.
+    """
+
+    def __init__(self, feature_names, sample_rows=DEFAULT_SAMPLE_ROWS, random_state=42, count_duplicates=True,
+                 spill_dir=None):
+        """
+        Args:
+            feature_names (list): Feature columns, in training order
+            sample_rows (int): Reservoir size (0 disables sampling)
+            random_state (int): Seed for the reservoir
+            count_duplicates (bool): Spill row hashes to disk to count exact
+                duplicate rows (duplicate_rows is None when False)
+            spill_dir (str): Directory for the row hash files
+        """
+        from sklearn.preprocessing import StandardScaler
+
+        self.feature_names = list(feature_names)
+        self.scaler = StandardScaler()
+        self.rows = 0
+        self.complete_rows = 0
+        self.missing = np.zeros(len(self.feature_names) + 1, dtype=np.int64)
+        self.class_counts = {}
+        self._row_hashes = RowHashSpill(directory=spill_dir) if count_duplicates else None
+        self._duplicate_rows = None
+        self.sample_rows = sample_rows
+        self._sample_X = np.empty((sample_rows, len(self.feature_names)))
+        self._sample_y = np.empty(sample_rows, dtype=np.int64)
+        self._sampled = 0
+        self._rng = np.random.default_rng(random_state)
+
+    def update(self, chunk):
+        """
+        Fold one DataFrame chunk into the statistics.
+
+        Raises:
+            ValueError: If a feature column or the target column is missing
+        """
+        import pandas as pd
+
+        columns = self.feature_names + [TARGET_COLUMN]
+        missing_columns = [name for name in columns if name not in chunk.columns]
+        if missing_columns:
+            raise ValueError(f"Input is missing {len(missing_columns)} column(s): {', '.join(missing_columns[:5])}")
+        frame = chunk[columns]
+
+        self.rows += len(frame)
+        null_mask = frame.isna().to_numpy()
+        self.missing += null_mask.sum(axis=0)
+
+        # Duplicates across chunk boundaries are counted from the spilled hashes
+        if self._row_hashes is not None:
+            self._row_hashes.add(pd.util.hash_pandas_object(frame, index=False).to_numpy())
+            self._duplicate_rows = None
+
+        complete = ~null_mask.any(axis=1)
+        X = frame[self.feature_names].to_numpy(dtype=np.float64)[complete]
+        y = frame[TARGET_COLUMN].to_numpy()[complete].astype(np.int64)
+        if len(X) == 0:
+            return
+        labels, counts = np.unique(y, return_counts=True)
+        for label, count in zip(labels.tolist(), counts.tolist()):
+            self.class_counts[label] = self.class_counts.get(label, 0) + count
+
+        self.scaler.partial_fit(X)
+        self._reservoir_update(X, y)
+        self.complete_rows += len(X)
+
+    def _reservoir_update(self, X, y):
+        """Vectorized Algorithm R over one chunk of complete rows."""
+        if self.sample_rows <= 0:
+            return
+        fill = min(self.sample_rows - self._sampled, len(X))
+        if fill > 0:
+            self._sample_X[self._sampled:self._sampled + fill] = X[:fill]
+            self._sample_y[self._sampled:self._sampled + fill] = y[:fill]
+            self._sampled += fill
+
+        seen = self.complete_rows + np.arange(fill, len(X))
+        slots = (self._rng.random(len(seen)) * (seen + 1)).astype(np.int64)
+        replace = slots < self.sample_rows
+        rows, slots = np.arange(fill, len(X))[replace], slots[replace]
+        # Sequential semantics: the last row drawn for a slot wins
+        _, last = np.unique(slots[::-1], return_index=True)
+        keep = len(slots) - 1 - last
+        self._sample_X[slots[keep]] = X[rows[keep]]
+        self._sample_y[slots[keep]] = y[rows[keep]]
+
+    def sample(self):
+        """Reservoir sample as (X, y) of raw features."""
+        return self._sample_X[:self._sampled], self._sample_y[:self._sampled]
+
+    @property
+    def duplicate_rows(self):
+        """Rows identical to an earlier row, or None if not counted."""
+        if self._row_hashes is not None and self._duplicate_rows is None:
+            self._duplicate_rows = self._row_hashes.count_duplicates()
+        return self._duplicate_rows
+
+    def close(self):
+        """Delete the spilled row hashes; duplicate_rows keeps its last value."""
+        if self._row_hashes is not None:
+            self._duplicate_rows = self.duplicate_rows
+            self._row_hashes.close()
+            self._row_hashes = None
+
+    def summary(self):
+        """
+        Returns:
+            dict: 'rows', 'complete_rows', 'missing_values', 'duplicate_rows',
+                'missing_by_column' and 'class_counts'
+        """
+        names = self.feature_names + [TARGET_COLUMN]
+        return {
+            'rows': self.rows,
+            'complete_rows': self.complete_rows,
+            'missing_values': int(self.missing.sum()),
+            'duplicate_rows': self.duplicate_rows,
+            'missing_by_column': {name: int(count) for name, count in zip(names, self.missing) if count},
+            'class_counts': dict(sorted(self.class_counts.items())),
+        }
+
+
+def _complete_chunk(chunk, feature_names):
+    """Feature matrix and labels of a chunk's rows without missing values."""
+    frame = chunk[list(feature_names) + [TARGET_COLUMN]].dropna()
+    return frame[feature_names].to_numpy(dtype=np.float64), frame[TARGET_COLUMN].to_numpy().astype(np.int64)
+
+
+class TreeReservoir:
+    """
+    Uniform sample of at most max_trees trees from a stream of fitted forests.
+
+    Algorithm R over individual trees: every tree seen so far is kept with
+    equal probability, and trees that fall out of the sample are released,
+    so memory and model size stay bounded however many chunks are fitted.
+    """
+
+    def __init__(self, max_trees, random_state=None):
+        """
+        Args:
+            max_trees (int): Trees kept in the merged forest
+            random_state (int): Seed for the sample
+        """
+        if max_trees < 1:
+            raise ValueError("max_trees must be at least 1")
+        self.max_trees = max_trees
+        self.trees_seen = 0
+        self._trees = []
+        self._forest = None
+        self._rng = np.random.default_rng(random_state)
+
+    def add(self, forest):
+        """Offer every tree of a fitted forest; all forests must share classes."""
+        if self._forest is None:
+            self._forest = forest
+        elif not np.array_equal(forest.classes_, self._forest.classes_):
+            raise ValueError("Cannot merge forests fitted on different classes")
+        for tree in forest.estimators_:
+            if len(self._trees) < self.max_trees:
+                self._trees.append(tree)
+            else:
+                slot = self._rng.integers(0, self.trees_seen + 1)
+                if slot < self.max_trees:
+                    self._trees[slot] = tree
+            self.trees_seen += 1
+
+    def forest(self):
+        """
+        Returns:
+            RandomForestClassifier: The first forest added, holding the sampled
+                trees, or None if nothing was added
+        """
+        if self._forest is None:
+            return None
+        self._forest.estimators_ = list(self._trees)
+        self._forest.n_estimators = len(self._trees)
+        return self._forest
+
+
+def train_streaming(path, mode=MODE_SUBSAMPLE, chunksize=DEFAULT_CHUNKSIZE, sample_rows=DEFAULT_SAMPLE_ROWS,
+                    trees_per_chunk=DEFAULT_TREES_PER_CHUNK, model_params=None, feature_names=None,
+                    model_path=MODEL_FILE, random_state=42, count_duplicates=True,
+                    max_trees=DEFAULT_MAX_TREES):
+    """
+    Fit the scaler and forest on a chunked CSV/Parquet file.
+
+    Args:
+        path (str): CSV or Parquet file with the feature columns and 'target'
+        mode (str): MODE_SUBSAMPLE or MODE_ENSEMBLE
+        chunksize (int): Rows per chunk
+        sample_rows (int): Reservoir size for MODE_SUBSAMPLE
+        trees_per_chunk (int): Trees per chunk for MODE_ENSEMBLE
+        model_params (dict): Overrides for task3's MODEL_PARAMS
+        feature_names (list): Feature columns (load_breast_cancer's by default)
+        model_path (str): Where to save the artifact (None skips it)
+        random_state (int): Seed for sampling and the forests
+        count_duplicates (bool): Count exact duplicate rows (spills 8 bytes
+            per row to temporary files)
+        max_trees (int): Cap on the merged MODE_ENSEMBLE forest; trees beyond
+            it are reservoir-sampled across chunks
+
+    Returns:
+        dict: 'profile' (StreamingProfile.summary()), 'scaler', 'model',
+            'metadata' and per-phase 'seconds'
+    """
+    from sklearn.datasets import load_breast_cancer
+    from sklearn.ensemble import RandomForestClassifier
+
+    from task3_predictive_analytics import MODEL_PARAMS
+
+    if mode not in (MODE_SUBSAMPLE, MODE_ENSEMBLE):
+        raise ValueError(f"Unknown training mode: {mode}")
+    feature_names = list(feature_names if feature_names is not None else load_breast_cancer().feature_names)
+    params = {**MODEL_PARAMS, 'random_state': random_state, **(model_params or {})}
+    seconds = {}
+
+    start = time.perf_counter()
+    profile = StreamingProfile(feature_names, sample_rows if mode == MODE_SUBSAMPLE else 0, random_state,
+                               count_duplicates)
+    try:
+        for chunk in iter_feature_chunks(path, chunksize):
+            profile.update(chunk)
+    finally:
+        profile.close()
+    seconds['profile'] = time.perf_counter() - start
+    if profile.complete_rows == 0:
+        raise ValueError(f"{path} has no complete rows to train on")
+    scaler = profile.scaler
+
+    start = time.perf_counter()
+    if mode == MODE_SUBSAMPLE:
+        X_sample, y_sample = profile.sample()
+        model = RandomForestClassifier(**params).fit(scaler.transform(X_sample), y_sample)
+    else:
+        reservoir, skipped = TreeReservoir(max_trees, random_state), 0
+        for index, chunk in enumerate(iter_feature_chunks(path, chunksize)):
+            X, y = _complete_chunk(chunk, feature_names)
+            # A tree fitted on one class cannot be averaged with the others
+            if len(np.unique(y)) < len(profile.class_counts):
+                skipped += 1
+                continue
+            forest = RandomForestClassifier(**{**params, 'n_estimators': trees_per_chunk,
+                                               'random_state': random_state + index})
+            reservoir.add(forest.fit(scaler.transform(X), y))
+        model = reservoir.forest()
+        if model is None:
+            raise ValueError("No chunk contains every class; use a larger chunksize or mode 'subsample'")
+        seconds['skipped_chunks'] = skipped
+        seconds['trees_fitted'] = reservoir.trees_seen
+    seconds['train'] = time.perf_counter() - start
+
+    metadata = None
+    if model_path:
+        metadata = save_model_artifact(scaler, model, feature_names, model_path)
+    return {'profile': profile.summary(), 'scaler': scaler, 'model': model, 'metadata': metadata,
+            'seconds': seconds}
+
+
+def synthesize_dataset(path, rows, chunksize=DEFAULT_CHUNKSIZE, noise=0.05, random_state=42):
+    """
+    Write a large CSV by resampling load_breast_cancer rows with
+    multiplicative jitter, for exercising the streaming path.
+
+    Returns:
+        str: The written path
+    """
+    import pandas as pd
+    from sklearn.datasets import load_breast_cancer
+
+    data = load_breast_cancer()
+    rng = np.random.default_rng(random_state)
+    written = 0
+    while written < rows:
+        size = min(chunksize, rows - written)
+        index = rng.integers(0, len(data.data), size)
+        features = data.data[index] * (1 + noise * rng.standard_normal((size, data.data.shape[1])))
+        frame = pd.DataFrame(features, columns=data.feature_names)
+        frame[TARGET_COLUMN] = data.target[index]
+        frame.to_csv(path, mode='w' if written == 0 else 'a', header=written == 0, index=False)
+        written += size
+    return path
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process so far, in MiB."""
+    import resource
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Out-of-core training for the task3 model")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    train_parser = commands.add_parser('train', help="Stream a CSV/Parquet file and save the model artifact")
+    train_parser.add_argument('input')
+    train_parser.add_argument('--mode', choices=[MODE_SUBSAMPLE, MODE_ENSEMBLE], default=MODE_SUBSAMPLE)
+    train_parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    train_parser.add_argument('--sample-rows', type=int, default=DEFAULT_SAMPLE_ROWS)
+    train_parser.add_argument('--trees-per-chunk', type=int, default=DEFAULT_TREES_PER_CHUNK)
+    train_parser.add_argument('--max-trees', type=int, default=DEFAULT_MAX_TREES,
+                              help="Trees kept in the merged ensemble forest")
+    train_parser.add_argument('--model', default=MODEL_FILE)
+    train_parser.add_argument('--skip-duplicates', action='store_true',
+                              help="Do not count duplicate rows (saves the row hash spill files)")
+
+    synth_parser = commands.add_parser('synthesize', help="Write a large jittered copy of the dataset")
+    synth_parser.add_argument('output')
+    synth_parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    if args.command == 'synthesize':
+        synthesize_dataset(args.output, args.rows)
+        print(f"✓ Saved: {args.output} ({args.rows} rows)")
+    else:
+        result = train_streaming(args.input, args.mode, args.chunksize, args.sample_rows, args.trees_per_chunk,
+                                 model_path=args.model, count_duplicates=not args.skip_duplicates,
+                                 max_trees=args.max_trees)
+        profile = result['profile']
+        print(f"Rows: {profile['rows']} ({profile['complete_rows']} complete)")
+        print(f"Missing Values: {profile['missing_values']}")
+        print(f"Duplicate Rows: {'not counted' if profile['duplicate_rows'] is None else profile['duplicate_rows']}")
+        print(f"Class counts: {profile['class_counts']}")
+        print(f"✓ Profiled and fitted scaler in {result['seconds']['profile']:.1f}s")
+        kept = f"{result['model'].n_estimators} trees"
+        if 'trees_fitted' in result['seconds']:
+            kept += f" of {result['seconds']['trees_fitted']} fitted"
+        print(f"✓ Trained {kept} ({args.mode}) in {result['seconds']['train']:.1f}s")
+        print(f"✓ Peak memory: {peak_rss_mb():.0f} MiB")
+        print(f"✓ Saved: {args.model} (model {result['metadata']['model_version']})")